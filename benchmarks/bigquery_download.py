@@ -0,0 +1,158 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compare BigQuery result downloads over REST and the Storage Read API.
+
+Both paths run the real google-cloud-bigquery download code against a local
+stand-in for the service, so no project or network access is needed:
+
+  - REST: ``tabledata.list`` pages of JSON rows, as returned by the API.
+  - Storage: a read session whose streams return Arrow record batches.
+
+python -m benchmarks.bigquery_download --rows 1000000 --streams 8
+"""
+
+import argparse
+import time
+import types
+from unittest import mock
+
+import numpy
+import pyarrow
+from google.cloud import bigquery
+from google.cloud.bigquery.table import RowIterator
+
+REST_PAGE_SIZE = 100000
+STORAGE_PAGE_SIZE = 10000
+
+SCHEMA = [
+    bigquery.SchemaField("id", "INTEGER"),
+    bigquery.SchemaField("amount", "FLOAT"),
+    bigquery.SchemaField("hash__all", "STRING"),
+]
+
+
+def generate_table(num_rows):
+    """Return an Arrow table shaped like a row validation result."""
+    ids = numpy.arange(num_rows, dtype="int64")
+    return pyarrow.table(
+        {
+            "id": ids,
+            "amount": ids * 0.5,
+            "hash__all": pyarrow.array([f"{i:064x}" for i in ids]),
+        }
+    )
+
+
+def _rest_api_request(table):
+    """Return an api_request callable serving tabledata.list JSON pages."""
+    rows = list(zip(*(table[name].to_pylist() for name in table.column_names)))
+    pages = [
+        rows[start : start + REST_PAGE_SIZE]
+        for start in range(0, len(rows), REST_PAGE_SIZE)
+    ]
+    pages = [
+        [{"f": [{"v": str(value)} for value in row]} for row in page] for page in pages
+    ]
+
+    def api_request(method, path, query_params=None, **kwargs):
+        page_num = int((query_params or {}).get("pageToken") or 0)
+        response = {"rows": pages[page_num], "totalRows": str(table.num_rows)}
+        if page_num + 1 < len(pages):
+            response["pageToken"] = str(page_num + 1)
+        return response
+
+    return api_request
+
+
+class _StoragePage(object):
+    def __init__(self, schema, buffer):
+        self._schema = schema
+        self._buffer = buffer
+
+    def to_arrow(self):
+        return pyarrow.ipc.read_record_batch(self._buffer, self._schema)
+
+    def to_dataframe(self, dtypes=None):
+        return self.to_arrow().to_pandas()
+
+
+class _StorageClient(object):
+    """Stand-in BigQueryReadClient serving IPC serialized record batches."""
+
+    def __init__(self, table, num_streams):
+        self._schema = table.schema
+        batches = table.to_batches(max_chunksize=STORAGE_PAGE_SIZE)
+        self._streams = {
+            f"stream-{i}": [batch.serialize() for batch in batches[i::num_streams]]
+            for i in range(num_streams)
+        }
+
+    def create_read_session(self, parent=None, read_session=None, **kwargs):
+        streams = [types.SimpleNamespace(name=name) for name in self._streams]
+        return types.SimpleNamespace(name="session", streams=streams)
+
+    def read_rows(self, name, **kwargs):
+        pages = [_StoragePage(self._schema, buffer) for buffer in self._streams[name]]
+        rows = types.SimpleNamespace(pages=pages)
+        return types.SimpleNamespace(rows=lambda session: rows)
+
+
+def _row_iterator(table):
+    table_ref = bigquery.TableReference.from_string("project.dataset.results")
+    return RowIterator(
+        mock.Mock(project="project"),
+        _rest_api_request(table),
+        "/projects/project/datasets/dataset/tables/results/data",
+        SCHEMA,
+        table=table_ref,
+        total_rows=table.num_rows,
+    )
+
+
+def time_rest(table):
+    start = time.perf_counter()
+    df = _row_iterator(table).to_dataframe(create_bqstorage_client=False)
+    return time.perf_counter() - start, len(df)
+
+
+def time_storage(table, num_streams):
+    bqstorage_client = _StorageClient(table, num_streams)
+    start = time.perf_counter()
+    df = _row_iterator(table).to_dataframe(
+        bqstorage_client=bqstorage_client, create_bqstorage_client=False
+    )
+    return time.perf_counter() - start, len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--streams", type=int, default=8)
+    args = parser.parse_args()
+
+    table = generate_table(args.rows)
+    rest_seconds, rest_rows = time_rest(table)
+    storage_seconds, storage_rows = time_storage(table, args.streams)
+
+    print(f"rows: {args.rows:,}")
+    print(f"rest:    {rest_seconds:8.3f}s ({rest_rows:,} rows)")
+    print(
+        f"storage: {storage_seconds:8.3f}s ({storage_rows:,} rows, "
+        f"{args.streams} streams)"
+    )
+    print(f"speedup: {rest_seconds / storage_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scaling curves of combiner.generate_report.
+
+Sweeps the number of rows, the number of validations (unions of the source
+and target pivots) and the number of join keys (JSON group_by_columns built
+with re_replace), each from a default point, and reports the time per row
+and per field (row of the report) and the peak memory. The curves are saved
+as CSV, checked in at benchmarks/results/combiner_scaling.csv, so combiner
+changes can show before and after numbers:
+
+python -m benchmarks.combiner --output benchmarks/results/combiner_scaling.csv
+python -m benchmarks.combiner --baseline benchmarks/results/combiner_scaling.csv
+"""
+
+import argparse
+import csv
+import statistics
+import tracemalloc
+import warnings
+
+import ibis.backends.pandas
+import numpy
+import pandas
+
+from data_validation import combiner, consts, metadata
+
+DEFAULT_ROWS = 2000
+DEFAULT_VALIDATIONS = 4
+DEFAULT_JOIN_KEYS = 1
+SWEEPS = {
+    "rows": [500, 1000, 2000, 4000, 8000, 16000],
+    "validations": [1, 2, 4, 8, 16],
+    "join_keys": [1, 2, 4, 8],
+}
+FIELDS = [
+    "dimension",
+    "rows",
+    "validations",
+    "join_keys",
+    "fields",
+    "build_seconds",
+    "execute_seconds",
+    "seconds",
+    "us_per_row",
+    "us_per_field",
+    "peak_mib",
+]
+
+
+def build_inputs(rows, validations, join_keys, drift_rate=0.01, seed=0):
+    """Return source and target DataFrames and the RunMetadata to combine.
+
+    Rows are the groups of a grouped column validation with one sum column
+    per validation, keyed by join_keys string columns.
+    """
+    rng = numpy.random.default_rng(seed)
+    data = {"key_0": numpy.arange(rows).astype(str)}
+    for index in range(1, join_keys):
+        # Quotes and backslashes exercise the escaping of group_by_columns.
+        data[f"key_{index}"] = numpy.char.add(
+            'k"\\', rng.integers(0, 100, size=rows).astype(str)
+        )
+    validation_metadata = {}
+    for index in range(validations):
+        name = f"sum__value_{index}"
+        data[name] = rng.random(rows).round(6) * 1000
+        validation_metadata[name] = metadata.ValidationMetadata(
+            validation_type=consts.COLUMN_VALIDATION,
+            aggregation_type="sum",
+            source_table_schema="bench",
+            source_table_name="source",
+            target_table_schema="bench",
+            target_table_name="target",
+            source_column_name=f"value_{index}",
+            target_column_name=f"value_{index}",
+            primary_keys=[],
+            num_random_rows=None,
+            threshold=0.0,
+        )
+    source_df = pandas.DataFrame(data)
+    target_df = source_df.copy()
+    drifted = rng.random(rows) < drift_rate
+    for name in validation_metadata:
+        target_df.loc[drifted, name] += 1
+    run_metadata = metadata.RunMetadata(validations=validation_metadata)
+    join_on_fields = tuple(f"key_{index}" for index in range(join_keys))
+    return source_df, target_df, run_metadata, join_on_fields
+
+
+def _generate_report(source_df, target_df, run_metadata, join_on_fields):
+    client = ibis.backends.pandas.connect(
+        {combiner.DEFAULT_SOURCE: source_df, combiner.DEFAULT_TARGET: target_df}
+    )
+    return combiner.generate_report(
+        client,
+        run_metadata,
+        client.table(combiner.DEFAULT_SOURCE),
+        client.table(combiner.DEFAULT_TARGET),
+        join_on_fields=join_on_fields,
+    )
+
+
+def measure(rows, validations, join_keys, repeat=3):
+    """Return the median build and execute seconds and peak memory of a report."""
+    source_df, target_df, run_metadata, join_on_fields = build_inputs(
+        rows, validations, join_keys
+    )
+    builds, executes = [], []
+    for _ in range(repeat):
+        run_metadata.timings = []
+        _generate_report(source_df, target_df, run_metadata, join_on_fields)
+        durations = run_metadata.phase_durations()
+        builds.append(durations["combiner_build"])
+        executes.append(durations["combiner_execute"])
+
+    # Memory is measured in a separate run, tracemalloc slows allocations.
+    tracemalloc.start()
+    try:
+        result_df = _generate_report(source_df, target_df, run_metadata, join_on_fields)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    build_seconds = statistics.median(builds)
+    execute_seconds = statistics.median(executes)
+    seconds = build_seconds + execute_seconds
+    return {
+        "rows": rows,
+        "validations": validations,
+        "join_keys": join_keys,
+        "fields": len(result_df),
+        "build_seconds": round(build_seconds, 6),
+        "execute_seconds": round(execute_seconds, 6),
+        "seconds": round(seconds, 6),
+        "us_per_row": round(seconds / rows * 1e6, 3),
+        "us_per_field": round(seconds / len(result_df) * 1e6, 3),
+        "peak_mib": round(peak / 1024**2, 3),
+    }
+
+
+def sweep(dimensions, repeat=3):
+    """Yield a result for each point of the sweeps of the given dimensions."""
+    for dimension in dimensions:
+        for value in SWEEPS[dimension]:
+            point = {
+                "rows": DEFAULT_ROWS,
+                "validations": DEFAULT_VALIDATIONS,
+                "join_keys": DEFAULT_JOIN_KEYS,
+                dimension: value,
+            }
+            yield {"dimension": dimension, **measure(repeat=repeat, **point)}
+
+
+def _read_curves(path):
+    with open(path, newline="") as f:
+        return {
+            (row["dimension"], row["rows"], row["validations"], row["join_keys"]): row
+            for row in csv.DictReader(f)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--dimensions",
+        default=",".join(SWEEPS),
+        help="Comma separated dimensions to sweep, of: " + ", ".join(SWEEPS),
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Save the curves as CSV to this file")
+    parser.add_argument("--baseline", help="Compare with curves saved by --output")
+    args = parser.parse_args()
+    # The pandas backend of ibis warns about deprecated pandas APIs per table.
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    baseline = _read_curves(args.baseline) if args.baseline else {}
+    header = (
+        f"{'dimension':<12}{'rows':>7}{'vals':>5}{'keys':>5}{'fields':>8}"
+        f"{'seconds':>9}{'us/row':>9}{'us/field':>9}{'peak MiB':>9}"
+    )
+    print(header + ("    vs baseline" if baseline else ""))
+
+    results = []
+    for result in sweep(args.dimensions.split(","), args.repeat):
+        results.append(result)
+        line = (
+            f"{result['dimension']:<12}{result['rows']:>7}"
+            f"{result['validations']:>5}{result['join_keys']:>5}"
+            f"{result['fields']:>8}{result['seconds']:>9.3f}"
+            f"{result['us_per_row']:>9.1f}{result['us_per_field']:>9.1f}"
+            f"{result['peak_mib']:>9.1f}"
+        )
+        key = tuple(
+            str(result[name])
+            for name in ("dimension", "rows", "validations", "join_keys")
+        )
+        if key in baseline:
+            line += f"{result['seconds'] / float(baseline[key]['seconds']):>14.2f}x"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+
+if __name__ == "__main__":
+    main()
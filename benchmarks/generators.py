@@ -0,0 +1,131 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Synthetic source and target tables for benchmarks.
+
+Tables have a unique integer ``id`` key, an integer ``group_key`` with a
+controllable cardinality for grouped validations, and value columns of the
+types in a type mix. A target table is a copy of the source with a fraction
+of the rows drifted: changed, deleted or inserted.
+"""
+
+import numpy
+import pandas
+
+KEY_COLUMN = "id"
+GROUP_COLUMN = "group_key"
+
+TYPE_MIXES = {
+    "numeric": ["int", "float"],
+    "string": ["string"],
+    "mixed": ["int", "float", "string", "timestamp"],
+}
+FILE_TYPES = ["csv", "parquet"]
+
+_WORDS = numpy.array(
+    ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+)
+_EPOCH = numpy.datetime64("2020-01-01T00:00:00")
+
+
+def _values(column_type, rows, rng):
+    if column_type == "int":
+        return rng.integers(0, 1000000, size=rows)
+    elif column_type == "float":
+        return rng.random(rows).round(6) * 1000
+    elif column_type == "string":
+        words = _WORDS[rng.integers(0, len(_WORDS), size=rows)]
+        numbers = rng.integers(0, 100000, size=rows).astype(str)
+        return numpy.char.add(numpy.char.add(words, "-"), numbers)
+    elif column_type == "timestamp":
+        seconds = rng.integers(0, 3 * 365 * 24 * 3600, size=rows)
+        return _EPOCH + seconds.astype("timedelta64[s]")
+    raise ValueError(f"Unknown column type: {column_type}")
+
+
+def generate_table(
+    rows, columns=8, type_mix="mixed", key_cardinality=100, seed=0, start_id=0
+):
+    """Return a DataFrame of synthetic rows.
+
+    Args:
+        rows (int): Number of rows.
+        columns (int): Number of value columns, besides id and group_key.
+        type_mix (str): Key of TYPE_MIXES, value column types cycle through it.
+        key_cardinality (int): Distinct values of the group_key column.
+        seed (int): Random seed, the same arguments return the same table.
+        start_id (int): First id of the rows.
+    """
+    rng = numpy.random.default_rng(seed)
+    types = TYPE_MIXES[type_mix]
+    data = {
+        KEY_COLUMN: numpy.arange(start_id, start_id + rows, dtype="int64"),
+        GROUP_COLUMN: rng.integers(0, key_cardinality, size=rows),
+    }
+    for index in range(columns):
+        column_type = types[index % len(types)]
+        data[f"{column_type}_{index}"] = _values(column_type, rows, rng)
+    return pandas.DataFrame(data)
+
+
+def inject_drift(df, drift_rate, seed=0):
+    """Return a copy of df with drift_rate of its rows drifted.
+
+    Drifted rows are split evenly between rows with a changed value, deleted
+    rows and inserted rows with new ids.
+    """
+    rng = numpy.random.default_rng(seed + 1)
+    drifted = int(len(df) * drift_rate)
+    changed, deleted = drifted - 2 * (drifted // 3), drifted // 3
+    inserted = drifted // 3
+    positions = rng.permutation(len(df))
+    value_columns = [
+        name for name in df.columns if name not in (KEY_COLUMN, GROUP_COLUMN)
+    ]
+
+    target_df = df.copy()
+    if value_columns and changed:
+        column = value_columns[0]
+        changed_rows = target_df.index[positions[:changed]]
+        if pandas.api.types.is_numeric_dtype(target_df[column]):
+            target_df.loc[changed_rows, column] = (
+                target_df.loc[changed_rows, column] + 1
+            )
+        elif pandas.api.types.is_datetime64_any_dtype(target_df[column]):
+            target_df.loc[changed_rows, column] = target_df.loc[
+                changed_rows, column
+            ] + pandas.Timedelta(seconds=1)
+        else:
+            target_df.loc[changed_rows, column] = (
+                target_df.loc[changed_rows, column] + "-drift"
+            )
+    target_df = target_df.drop(target_df.index[positions[changed : changed + deleted]])
+
+    if inserted:
+        # Inserted rows copy the values of random rows under new ids.
+        new_rows = df.iloc[rng.integers(0, len(df), size=inserted)].copy()
+        first_id = int(df[KEY_COLUMN].max()) + 1
+        new_rows[KEY_COLUMN] = numpy.arange(first_id, first_id + inserted)
+        target_df = pandas.concat([target_df, new_rows], ignore_index=True)
+    return target_df.reset_index(drop=True)
+
+
+def write_table(df, path, file_type="csv"):
+    """Write a table as a CSV or Parquet file."""
+    if file_type == "csv":
+        df.to_csv(path, index=False)
+    elif file_type == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        raise ValueError(f"Unknown file type: {file_type}")
+    return path
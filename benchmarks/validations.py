@@ -0,0 +1,291 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark validations end to end against generated tables.
+
+Source and target tables are generated into a temporary directory and
+validated through the FileSystem connection type (and DuckDB for custom
+queries), with the same config building as the CLI. Benchmarks which
+fail, eg. custom queries where the client cannot run raw SQL, are skipped.
+The time and peak memory of each validation are saved as JSON, to compare
+with a baseline saved at another commit:
+
+python -m benchmarks.validations --rows 100000 --output baseline.json
+python -m benchmarks.validations --rows 100000 --baseline baseline.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import generators
+from data_validation import __main__ as main
+from data_validation import cli_tools, consts, memory, state_manager
+from data_validation.data_validation import DataValidation
+
+TABLE_NAME = "bench"
+SOURCE_CONN = "bench_source"
+TARGET_CONN = "bench_target"
+DUCKDB_SOURCE_CONN = "bench_duckdb_source"
+DUCKDB_TARGET_CONN = "bench_duckdb_target"
+
+CUSTOM_QUERY = f"SELECT * FROM {TABLE_NAME}"
+DEFAULT_TOLERANCE = 0.2
+
+
+class _DiscardResults(object):
+    """Result handler which keeps only the number of results."""
+
+    def __init__(self):
+        self.rows = 0
+
+    def execute(self, config, result_df):
+        self.rows += 0 if result_df is None else len(result_df)
+        return result_df
+
+
+def _validation_args(query_file, comparison_fields):
+    """Return the validate command line arguments of each benchmark."""
+    connections = ["-sc", SOURCE_CONN, "-tc", TARGET_CONN, "-tbls", TABLE_NAME]
+    return {
+        "column": ["column", *connections, "--count", "*", "--sum", "*"]
+        + ["--min", "*", "--max", "*"],
+        "grouped_column": ["column", *connections, "-gc", generators.GROUP_COLUMN]
+        + ["--count", "*", "--sum", "*"],
+        "row_hash": ["row", *connections, "-pk", generators.KEY_COLUMN]
+        + ["-hash", "*"],
+        "row_comparison": ["row", *connections, "-pk", generators.KEY_COLUMN]
+        + ["-comp-fields", ",".join(comparison_fields)],
+        "schema": ["schema", *connections],
+        "custom_query": ["custom-query", "-sc", DUCKDB_SOURCE_CONN]
+        + ["-tc", DUCKDB_TARGET_CONN, "-cqt", "column"]
+        + ["-sqf", query_file, "-tqf", query_file],
+    }
+
+
+def _has_duckdb():
+    try:
+        import duckdb_engine  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def prepare(directory, args):
+    """Generate the tables and connections, return the validation arguments."""
+    source_df = generators.generate_table(
+        args.rows,
+        columns=args.columns,
+        type_mix=args.type_mix,
+        key_cardinality=args.key_cardinality,
+        seed=args.seed,
+    )
+    target_df = generators.inject_drift(source_df, args.drift_rate, seed=args.seed)
+    paths = {}
+    for name, df in ((SOURCE_CONN, source_df), (TARGET_CONN, target_df)):
+        paths[name] = generators.write_table(
+            df, os.path.join(directory, f"{name}.{args.file_type}"), args.file_type
+        )
+
+    os.environ[consts.ENV_DIRECTORY_VAR] = directory
+    mgr = state_manager.StateManager()
+    for name, duckdb_name in (
+        (SOURCE_CONN, DUCKDB_SOURCE_CONN),
+        (TARGET_CONN, DUCKDB_TARGET_CONN),
+    ):
+        connection = {"table_name": TABLE_NAME, "file_path": paths[name]}
+        mgr.create_connection(
+            name,
+            {
+                consts.SOURCE_TYPE: "FileSystem",
+                "file_type": args.file_type,
+                **connection,
+            },
+        )
+        mgr.create_connection(duckdb_name, {consts.SOURCE_TYPE: "DuckDB", **connection})
+
+    query_file = os.path.join(directory, "query.sql")
+    with open(query_file, "w") as f:
+        f.write(CUSTOM_QUERY)
+
+    value_columns = [
+        name
+        for name in source_df.columns
+        if name not in (generators.KEY_COLUMN, generators.GROUP_COLUMN)
+    ]
+    return _validation_args(query_file, value_columns)
+
+
+def run_once(validation_args):
+    """Run a validation, return its seconds, peak RSS, results and phases."""
+    parser = cli_tools.configure_arg_parser()
+    args = parser.parse_args(["validate", *validation_args])
+    result_handler = _DiscardResults()
+    phases = {}
+
+    memory.reset_peak_rss()
+    start = time.perf_counter()
+    for config_manager in main.build_config_managers_from_args(args):
+        validator = DataValidation(config_manager.config, result_handler=result_handler)
+        validator.execute()
+        for phase, duration in validator.run_metadata.phase_durations().items():
+            phases[phase] = phases.get(phase, 0.0) + duration
+    seconds = time.perf_counter() - start
+
+    return {
+        "seconds": seconds,
+        "peak_rss": memory.get_peak_rss(),
+        "result_rows": result_handler.rows,
+        "phases": phases,
+    }
+
+
+def run_benchmark(validation_args, repeat):
+    """Return the median and fastest of repeated runs of a validation."""
+    runs = [run_once(validation_args) for _ in range(repeat)]
+    fastest = min(runs, key=lambda run: run["seconds"])
+    return {
+        "seconds": statistics.median(run["seconds"] for run in runs),
+        "min_seconds": fastest["seconds"],
+        "peak_rss": max(run["peak_rss"] or 0 for run in runs) or None,
+        "result_rows": fastest["result_rows"],
+        "phases": {
+            phase: round(duration, 6) for phase, duration in fastest["phases"].items()
+        },
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Print results against a baseline, return the names of regressions.
+
+    A benchmark regressed if its median time grew by more than tolerance.
+    """
+    regressions = []
+    print(f"{'benchmark':<16}{'baseline':>10}{'current':>10}{'ratio':>8}")
+    for name, result in results.items():
+        if name not in baseline["results"]:
+            print(f"{name:<16}{'-':>10}{result['seconds']:>9.3f}s{'-':>8}")
+            continue
+        baseline_seconds = baseline["results"][name]["seconds"]
+        ratio = result["seconds"] / baseline_seconds if baseline_seconds else 1.0
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<16}{baseline_seconds:>9.3f}s{result['seconds']:>9.3f}s"
+            f"{ratio:>7.2f}x{flag}"
+        )
+    return regressions
+
+
+def main_(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument(
+        "--type-mix", choices=sorted(generators.TYPE_MIXES), default="mixed"
+    )
+    parser.add_argument("--key-cardinality", type=int, default=100)
+    parser.add_argument("--drift-rate", type=float, default=0.01)
+    parser.add_argument("--file-type", choices=generators.FILE_TYPES, default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--benchmarks", help="Comma separated benchmarks to run, defaults to all"
+    )
+    parser.add_argument("--output", help="Save the results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare with results saved by --output")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Slowdown ratio over the baseline reported as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        validations = prepare(directory, args)
+        names = args.benchmarks.split(",") if args.benchmarks else list(validations)
+        if "custom_query" in names and not _has_duckdb():
+            print("Skipping custom_query: pip install duckdb duckdb-engine")
+            names.remove("custom_query")
+
+        results = {}
+        for name in names:
+            try:
+                results[name] = run_benchmark(validations[name], args.repeat)
+            except Exception as e:
+                # Eg. custom queries need a client which supports raw SQL.
+                print(f"Skipping {name}: {type(e).__name__}: {e}")
+                continue
+            print(
+                f"{name:<16}{results[name]['seconds']:>9.3f}s "
+                f"peak RSS {(results[name]['peak_rss'] or 0) / 1024 ** 2:,.0f} MiB, "
+                f"{results[name]['result_rows']:,} results"
+            )
+
+    report = {
+        "commit": _git_commit(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": {
+            name: getattr(args, name)
+            for name in (
+                "rows",
+                "columns",
+                "type_mix",
+                "key_cardinality",
+                "drift_rate",
+                "file_type",
+                "seed",
+                "repeat",
+            )
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        parameters = {**baseline["parameters"], "repeat": args.repeat}
+        if parameters != report["parameters"]:
+            print("Warning: the baseline was run with different parameters")
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import contextlib
 import json
 import os
 import sys
@@ -23,10 +25,15 @@ from data_validation import (
     clients,
     consts,
     jellyfish_distance,
+    memory,
+    planner,
+    profiler,
     state_manager,
 )
 from data_validation.config_manager import ConfigManager
 from data_validation.data_validation import DataValidation
+from data_validation.schema_validation import BulkSchemaValidation
+from data_validation.result_handlers.pipeline import ResultPipeline
 
 # by default yaml dumps lists as pointers. This disables that feature
 Dumper.ignore_aliases = lambda *args: True
@@ -232,8 +239,9 @@ def build_config_managers_from_args(args):
     labels = cli_tools.get_labels(args.labels)
 
     mgr = state_manager.StateManager()
-    source_client = clients.get_data_client(mgr.get_connection_config(args.source_conn))
-    target_client = clients.get_data_client(mgr.get_connection_config(args.target_conn))
+    connections = mgr.get_connection_configs([args.source_conn, args.target_conn])
+    source_client = clients.get_data_client(connections[args.source_conn])
+    target_client = clients.get_data_client(connections[args.target_conn])
 
     format = args.format if args.format else "table"
 
@@ -265,6 +273,11 @@ def build_config_managers_from_args(args):
             result_handler_config=result_handler_config,
             filter_config=filter_config,
             verbose=args.verbose,
+            report=args.report,
+            output_file=args.output_file,
+            record_timings=args.record_timings,
+            record_query_stats=args.record_query_stats,
+            memory_budget=args.memory_budget,
         )
         if config_type != consts.SCHEMA_VALIDATION:
             config_manager = build_config_from_args(args, config_manager)
@@ -288,8 +301,11 @@ def build_config_managers_from_yaml(args):
     yaml_configs = _get_yaml_config_from_file(config_file_path)
 
     mgr = state_manager.StateManager()
-    source_conn = mgr.get_connection_config(yaml_configs[consts.YAML_SOURCE])
-    target_conn = mgr.get_connection_config(yaml_configs[consts.YAML_TARGET])
+    connections = mgr.get_connection_configs(
+        [yaml_configs[consts.YAML_SOURCE], yaml_configs[consts.YAML_TARGET]]
+    )
+    source_conn = connections[yaml_configs[consts.YAML_SOURCE]]
+    target_conn = connections[yaml_configs[consts.YAML_TARGET]]
 
     source_client = clients.get_data_client(source_conn)
     target_client = clients.get_data_client(target_conn)
@@ -312,11 +328,10 @@ def _compare_match_tables(source_table_map, target_table_map, score_cutoff=0.8):
     # TODO(dhercher): evaluate if improved comparison and score cutoffs should be used.
     table_configs = []
 
-    target_keys = target_table_map.keys()
-    for source_key in source_table_map:
-        target_key = jellyfish_distance.extract_closest_match(
-            source_key, target_keys, score_cutoff=score_cutoff
-        )
+    target_keys = jellyfish_distance.extract_closest_matches(
+        source_table_map.keys(), target_table_map.keys(), score_cutoff=score_cutoff
+    )
+    for source_key, target_key in zip(source_table_map, target_keys):
         if target_key is None:
             continue
 
@@ -358,12 +373,19 @@ def find_tables_using_string_matching(args):
     score_cutoff = args.score_cutoff or 0.8
 
     mgr = state_manager.StateManager()
-    source_client = clients.get_data_client(mgr.get_connection_config(args.source_conn))
-    target_client = clients.get_data_client(mgr.get_connection_config(args.target_conn))
+    connections = mgr.get_connection_configs([args.source_conn, args.target_conn])
+    source_client = clients.get_data_client(connections[args.source_conn])
+    target_client = clients.get_data_client(connections[args.target_conn])
 
     allowed_schemas = cli_tools.get_arg_list(args.allowed_schemas)
-    source_table_map = get_table_map(source_client, allowed_schemas=allowed_schemas)
-    target_table_map = get_table_map(target_client)
+    # Source and target tables are listed at the same time.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        source_future = executor.submit(
+            get_table_map, source_client, allowed_schemas=allowed_schemas
+        )
+        target_future = executor.submit(get_table_map, target_client)
+        source_table_map = source_future.result()
+        target_table_map = target_future.result()
 
     table_configs = _compare_match_tables(
         source_table_map, target_table_map, score_cutoff=score_cutoff
@@ -400,31 +422,136 @@ def convert_config_to_yaml(args, config_managers):
     return yaml_config
 
 
-def run_validation(config_manager, verbose=False):
+def run_validation(
+    config_manager,
+    verbose=False,
+    result_handler=None,
+    validation_profiler=None,
+    schema_results=None,
+    shared_scan=None,
+):
     """Run a single validation.
 
     Args:
         config_manager (ConfigManager): Validation config manager instance.
         verbose (bool): Validation setting to log queries run.
+        result_handler (ResultHandler): Optional Result Handler shared
+            between validations.
+        validation_profiler (ValidationProfiler): Optional profiler to
+            profile the validation with.
+        schema_results (DataFrame): Optional comparison of the schemas of a
+            schema validation, from a bulk schema validation.
+        shared_scan (ScanMember): Optional shared scan, which runs the queries
+            of a column validation with those of others on the same table.
     """
-    validator = DataValidation(
-        config_manager.config,
-        validation_builder=None,
-        result_handler=None,
-        verbose=verbose,
-    )
-    validator.execute()
+    if validation_profiler is None:
+        profile = contextlib.nullcontext()
+    else:
+        profile = validation_profiler.profile(_get_profile_label(config_manager))
+
+    with profile as validation_profile:
+        validator = DataValidation(
+            config_manager.config,
+            validation_builder=None,
+            result_handler=result_handler,
+            verbose=verbose,
+            schema_results=schema_results,
+            shared_scan=shared_scan,
+        )
+        if validation_profile is not None:
+            validation_profile.run_id = validator.run_metadata.run_id
+        validator.execute()
+
+
+def _get_profile_label(config_manager):
+    """Return the table or, for custom queries, validation type to name profiles."""
+    table_name = config_manager.config.get(consts.CONFIG_TABLE_NAME)
+    if not table_name:
+        return config_manager.validation_type
+    schema_name = config_manager.config.get(consts.CONFIG_SCHEMA_NAME)
+    return f"{schema_name}.{table_name}" if schema_name else table_name
+
+
+def get_bulk_schema_results(config_managers, verbose=False):
+    """Return the schema comparisons of schema validations, by config manager id.
+
+    Schema validations which share source and target clients are compared
+    together, with one catalog query per side.
+    """
+    groups = {}
+    for config_manager in config_managers:
+        if config_manager.validation_type == consts.SCHEMA_VALIDATION:
+            key = (id(config_manager.source_client), id(config_manager.target_client))
+            groups.setdefault(key, []).append(config_manager)
+
+    schema_results = {}
+    for group in groups.values():
+        results = BulkSchemaValidation(group, verbose=verbose).execute()
+        for config_manager, result_df in zip(group, results):
+            schema_results[id(config_manager)] = result_df
+    return schema_results
 
 
 def run_validations(args, config_managers):
     """Run and manage a series of validations.
 
+    Results are written by a ResultPipeline in the background, so a
+    validation's report is written while the next validation runs.
+    Validations with a buffered result handler config share one Result
+    Handler, which is flushed once all validations have run. With --bulk,
+    the schemas of schema validations are compared before any validation
+    runs. With --shared-scan, column validations of the same table share
+    their queries, and with --union-batch-size the queries of other column
+    validations are run in batches of UNION ALL queries.
+
     Args:
         config_managers (list[ConfigManager]): List of config manager instances.
     """
-    # TODO(issue/31): Add parallel execution logic
-    for config_manager in config_managers:
-        run_validation(config_manager, verbose=args.verbose)
+    buffered_handlers = {}
+    validation_profiler = None
+    if getattr(args, "profile", None):
+        validation_profiler = profiler.ValidationProfiler(
+            args.profile, top=args.profile_top
+        )
+    schema_results = {}
+    if getattr(args, "bulk", False):
+        schema_results = get_bulk_schema_results(config_managers, verbose=args.verbose)
+    shared_scans = {}
+    if getattr(args, "shared_scan", False):
+        shared_scans = planner.plan_shared_scans(config_managers)
+    if getattr(args, "union_batch_size", None):
+        shared_scans.update(
+            planner.plan_union_batches(
+                [
+                    config_manager
+                    for config_manager in config_managers
+                    if id(config_manager) not in shared_scans
+                ],
+                args.union_batch_size,
+            )
+        )
+    with ResultPipeline() as pipeline:
+        # TODO(issue/31): Add parallel execution logic
+        for config_manager in config_managers:
+            if config_manager.result_handler_config.get(consts.RESULT_HANDLER_BUFFERED):
+                key = json.dumps(config_manager.result_handler_config, sort_keys=True)
+                if key not in buffered_handlers:
+                    buffered_handlers[key] = config_manager.get_result_handler()
+                result_handler = buffered_handlers[key]
+            else:
+                result_handler = config_manager.get_result_handler()
+            run_validation(
+                config_manager,
+                verbose=args.verbose,
+                result_handler=pipeline.handler(result_handler),
+                validation_profiler=validation_profiler,
+                schema_results=schema_results.get(id(config_manager)),
+                shared_scan=shared_scans.get(id(config_manager)),
+            )
+
+    # Printed once the results are written, so it is not interleaved with them.
+    if validation_profiler:
+        validation_profiler.print_summary()
 
 
 def store_yaml_config_file(args, config_managers):
@@ -510,10 +637,17 @@ def main():
         print(run_raw_query_against_connection(args))
     elif args.command == "validate":
         validate(args)
-    elif args.command == "deploy":
+    elif args.command == "beta" and args.beta_cmd == "deploy":
         from data_validation import app
 
-        app.app.run(debug=True, host="0.0.0.0", port=int(os.environ.get("PORT", 8080)))
+        app.serve(
+            port=args.port or int(os.environ.get("PORT", 8080)),
+            workers=args.workers,
+            max_queued=args.max_queued,
+            batch_workers=args.batch_workers,
+            max_result_bytes=memory.parse_memory_size(args.max_result_size),
+            debug=args.debug,
+        )
     else:
         raise ValueError(f"Positional Argument '{args.command}' is not supported")
 
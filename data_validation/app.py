@@ -14,22 +14,71 @@
 
 import json
 import os
-from data_validation import data_validation
+import threading
+from data_validation import data_validation, jobs, memory
 import flask
-import pandas
 import logging
 
 app = flask.Flask(__name__)
 
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10000
+MAX_BATCH_WORKERS = 32
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager():
+    """Return the JobManager running jobs, created on first use.
+
+    Its size is set by the DVT_JOB_WORKERS, DVT_JOB_MAX_QUEUED,
+    DVT_JOB_BATCH_WORKERS and DVT_JOB_MAX_RESULT_SIZE (eg. 1GB) env
+    variables, eg. when served by gunicorn, or by init_job_manager.
+    """
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = jobs.JobManager(
+                workers=int(os.environ.get("DVT_JOB_WORKERS", jobs.DEFAULT_WORKERS)),
+                max_queued=int(
+                    os.environ.get("DVT_JOB_MAX_QUEUED", jobs.DEFAULT_MAX_QUEUED)
+                ),
+                batch_workers=int(
+                    os.environ.get("DVT_JOB_BATCH_WORKERS", jobs.DEFAULT_BATCH_WORKERS)
+                ),
+                max_result_bytes=memory.parse_memory_size(
+                    os.environ.get(
+                        "DVT_JOB_MAX_RESULT_SIZE", jobs.DEFAULT_MAX_RESULT_BYTES
+                    )
+                ),
+            )
+        return _job_manager
 
-def _clean_dataframe(df):
-    rows = df.to_dict(orient="record")
-    for row in rows:
-        for key in row:
-            if type(row[key]) in [pandas.Timestamp]:
-                row[key] = str(row[key])
 
-    return json.dumps(rows)
+def init_job_manager(
+    workers=jobs.DEFAULT_WORKERS,
+    max_queued=jobs.DEFAULT_MAX_QUEUED,
+    batch_workers=jobs.DEFAULT_BATCH_WORKERS,
+    max_result_bytes=jobs.DEFAULT_MAX_RESULT_BYTES,
+):
+    """Replace the JobManager with one of the given size."""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is not None:
+            _job_manager.shutdown(wait=False)
+        _job_manager = jobs.JobManager(
+            workers=workers,
+            max_queued=max_queued,
+            batch_workers=batch_workers,
+            max_result_bytes=max_result_bytes,
+        )
+        return _job_manager
+
+
+def _clean_dataframe(df):
+    # Encoded by pandas in one vectorized call, timestamps as ISO 8601.
+    return df.to_json(orient="records", date_format="iso", date_unit="us")
 
 
 def _get_request_content(request):
@@ -72,5 +121,152 @@ def other():
     return _get_request_content(flask.request)
 
 
+def _json_response(body, status=200):
+    return flask.Response(body, status=status, mimetype="application/json")
+
+
+def _error_response(message, status):
+    return _json_response(json.dumps({"error": message}), status)
+
+
+def _job_response(job, status=200):
+    return _json_response(json.dumps(job.to_dict()), status)
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """Queue the validation config in the request body as a job.
+
+    Returns 202 with the job status, including its job_id, or 429 when the
+    queue of jobs waiting for a worker is full.
+    """
+    config = flask.request.get_json(silent=True)
+    if not isinstance(config, dict):
+        return _error_response("Expected a validation config JSON object", 400)
+    try:
+        job = get_job_manager().submit(config)
+    except jobs.QueueFullError as e:
+        return _error_response(str(e), 429)
+    return _job_response(job, 202)
+
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    return _json_response(
+        json.dumps([job.to_dict() for job in get_job_manager().list_jobs()])
+    )
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return _error_response(f"Unknown job: {job_id}", 404)
+    return _job_response(job)
+
+
+@app.route("/jobs/<job_id>", methods=["DELETE"])
+@app.route("/jobs/<job_id>/cancel", methods=["POST"])
+def cancel_job(job_id):
+    job = get_job_manager().cancel(job_id)
+    if job is None:
+        return _error_response(f"Unknown job: {job_id}", 404)
+    return _job_response(job)
+
+
+@app.route("/jobs/<job_id>/results", methods=["GET"])
+def get_job_results(job_id):
+    """Return a page of the results of a succeeded job.
+
+    Query parameters offset (default 0) and limit (default 1000, at most
+    10000) select the rows. next_offset is null on the last page.
+    """
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return _error_response(f"Unknown job: {job_id}", 404)
+    if job.status != jobs.STATUS_SUCCEEDED:
+        return _error_response(f"Job {job_id} is {job.status}", 409)
+    if job.result_df is None:
+        return _error_response(
+            f"Results of job {job_id} were written by its result handler", 404
+        )
+
+    try:
+        offset = int(flask.request.args.get("offset", 0))
+        limit = int(flask.request.args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return _error_response("offset and limit must be integers", 400)
+    if offset < 0 or not 0 < limit <= MAX_PAGE_SIZE:
+        return _error_response(
+            f"offset must not be negative and limit must be between 1 and {MAX_PAGE_SIZE}",
+            400,
+        )
+
+    next_offset = offset + limit if offset + limit < job.total_rows else None
+    page = {
+        "job_id": job.job_id,
+        "offset": offset,
+        "limit": limit,
+        "total_rows": job.total_rows,
+        "next_offset": next_offset,
+    }
+    # The results are already JSON, so they are spliced in rather than decoded.
+    body = json.dumps(page)[:-1] + ', "results": ' + job.results_json(offset, limit)
+    return _json_response(body + "}")
+
+
+@app.route("/batch", methods=["POST"])
+def run_batch():
+    """Run the validations of a YAML config document, streaming NDJSON results.
+
+    The request body has the source, target, result_handler and validations
+    of a YAML config file. Validations run in parallel, up to the workers
+    query parameter (default 4, at most 32) at a time, on the batch workers
+    shared by every batch, reusing pooled clients. A line is written for each
+    validation as it completes, then a last line with the counts of
+    succeeded and failed validations.
+    """
+    document = flask.request.get_json(silent=True)
+    try:
+        workers = int(flask.request.args.get("workers", jobs.DEFAULT_WORKERS))
+        if not 0 < workers <= MAX_BATCH_WORKERS:
+            raise ValueError(f"workers must be between 1 and {MAX_BATCH_WORKERS}")
+        configs = jobs.get_batch_configs(document)
+    except Exception as e:
+        return _error_response(str(e), 400)
+
+    def generate():
+        counts = {jobs.STATUS_SUCCEEDED: 0, jobs.STATUS_FAILED: 0}
+        for result in get_job_manager().run_batch(configs, workers=workers):
+            counts[jobs.STATUS_FAILED if result.error else jobs.STATUS_SUCCEEDED] += 1
+            yield result.to_json() + "\n"
+        yield json.dumps({"done": True, **counts}) + "\n"
+
+    return flask.Response(generate(), mimetype="application/x-ndjson")
+
+
+def serve(
+    port=8080,
+    workers=jobs.DEFAULT_WORKERS,
+    max_queued=jobs.DEFAULT_MAX_QUEUED,
+    batch_workers=jobs.DEFAULT_BATCH_WORKERS,
+    max_result_bytes=jobs.DEFAULT_MAX_RESULT_BYTES,
+    debug=False,
+):
+    """Serve validations and validation jobs with the Flask server.
+
+    For production, serve app with a WSGI server in one process, since jobs
+    are kept in memory, eg. gunicorn --workers 1 --threads 8
+    data_validation.app:app.
+    """
+    init_job_manager(
+        workers=workers,
+        max_queued=max_queued,
+        batch_workers=batch_workers,
+        max_result_bytes=max_result_bytes,
+    )
+    app.run(debug=debug, host="0.0.0.0", port=port, threaded=True)
+
+
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=int(os.environ.get("PORT", 8080)))
+    serve(port=int(os.environ.get("PORT", 8080)), debug=True)
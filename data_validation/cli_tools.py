@@ -50,6 +50,7 @@ import uuid
 import logging
 
 from data_validation import consts
+from data_validation import profiler
 from data_validation import state_manager
 
 CONNECTION_SOURCE_FIELDS = {
@@ -114,7 +115,16 @@ CONNECTION_SOURCE_FIELDS = {
     "FileSystem": [
         ["table_name", "Table name to use as reference for file data"],
         ["file_path", "The local, s3, or GCS file path to the data"],
-        ["file_type", "The file type of the file.'csv' or 'json'"],
+        [
+            "file_type",
+            "The file type of the file. 'csv', 'json', 'parquet' or 'feather'",
+        ],
+        ["chunk_size", "(Optional) Rows per chunk to read CSV or JSON lines files"],
+    ],
+    "DuckDB": [
+        ["database", "DuckDB database file (in memory if not provided)"],
+        ["table_name", "(Optional) Table name to use as reference for file data"],
+        ["file_path", "(Optional) CSV, Parquet or JSON file path or glob"],
     ],
     "Impala": [
         ["host", "Desired Impala host"],
@@ -176,9 +186,44 @@ def _configure_beta_parser(subparsers):
 
 def _configure_deploy(subparsers):
     """Configure arguments for deploying as a service."""
-    subparsers.add_parser(
+    deploy_parser = subparsers.add_parser(
         "deploy", help="Deploy Data Validation as a Service (w/ Flask)"
     )
+    deploy_parser.add_argument(
+        "--port",
+        type=int,
+        help="Port to serve on (defaults to the PORT env variable, or 8080)",
+    )
+    deploy_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of validation jobs run at the same time",
+    )
+    deploy_parser.add_argument(
+        "--max-queued",
+        type=int,
+        default=100,
+        help="Number of validation jobs waiting for a worker before new jobs are "
+        "rejected",
+    )
+    deploy_parser.add_argument(
+        "--batch-workers",
+        type=int,
+        default=32,
+        help="Number of validations of all batches run at the same time",
+    )
+    deploy_parser.add_argument(
+        "--max-result-size",
+        default="1GB",
+        help="Memory the results of finished jobs may use, eg. 1GB, before the "
+        "oldest finished jobs are dropped",
+    )
+    deploy_parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Run the Flask server in debug mode",
+    )
 
 
 def _configure_find_tables(subparsers):
@@ -224,6 +269,10 @@ def _configure_run_config_parser(subparsers):
         "-c",
         help="YAML Config File Path to be used for building or running validations.",
     )
+    _add_profile_arguments(run_config_parser)
+    _add_bulk_argument(run_config_parser)
+    _add_shared_scan_argument(run_config_parser)
+    _add_union_batch_argument(run_config_parser)
 
 
 def _configure_validation_config_parser(subparsers):
@@ -243,6 +292,10 @@ def _configure_validation_config_parser(subparsers):
         "-c",
         help="YAML Config File Path to be used for building or running validations.",
     )
+    _add_profile_arguments(run_parser)
+    _add_bulk_argument(run_parser)
+    _add_shared_scan_argument(run_parser)
+    _add_union_batch_argument(run_parser)
 
     get_parser = configs_subparsers.add_parser(
         "get", help="Get and print a validation config"
@@ -373,6 +426,7 @@ def _configure_row_parser(row_parser):
 def _configure_column_parser(column_parser):
     """Configure arguments to run column level validations."""
     _add_common_arguments(column_parser)
+    _add_union_batch_argument(column_parser)
     column_parser.add_argument(
         "--count",
         "-count",
@@ -467,6 +521,7 @@ def _configure_schema_parser(schema_parser):
         "-ec",
         help="Comma separated list of columns 'col_a,col_b' to be excluded from the schema validation",
     )
+    _add_bulk_argument(schema_parser)
 
 
 def _configure_custom_query_parser(custom_query_parser):
@@ -596,8 +651,88 @@ def _add_common_arguments(parser):
         "--format",
         "-fmt",
         default="table",
-        help="Set the format for printing command output, Supported formats are (text, csv, json, table). Defaults "
-        "to table",
+        help="Set the format for printing command output, Supported formats are (text, csv, json, jsonl, table). "
+        "Defaults to table",
+    )
+    parser.add_argument(
+        "--output-file",
+        "-of",
+        help="Append command output to this file instead of printing it",
+    )
+    parser.add_argument(
+        "--record-timings",
+        "-rt",
+        action="store_true",
+        help="Add the seconds spent in each phase of a validation to its results, "
+        "as a JSON phase_timings column",
+    )
+    parser.add_argument(
+        "--record-query-stats",
+        "-rqs",
+        action="store_true",
+        help="Add the rows, bytes and database statistics of the source and target "
+        "queries to the results, as a JSON query_stats column",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        "-mb",
+        help="Memory a row validation may use, eg. 2GB. Rows estimated to exceed it are "
+        "validated in primary key ranges. The peak RSS is added to the results",
+    )
+    parser.add_argument(
+        "--report",
+        "-rpt",
+        choices=consts.REPORT_TYPES,
+        default=consts.REPORT_ALL,
+        help="Report every result (all), only failed results (failures), or counts of "
+        "compared, missing and mismatched rows per validation (summary). Defaults to all",
+    )
+    _add_profile_arguments(parser)
+
+
+def _add_bulk_argument(parser):
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Read the schemas of all tables of schema validations with one "
+        "catalog query per connection, where supported, rather than per table",
+    )
+
+
+def _add_shared_scan_argument(parser):
+    parser.add_argument(
+        "--shared-scan",
+        action="store_true",
+        help="Run column validations of the same table, connections and filters "
+        "with one query per side, rather than one per validation",
+    )
+
+
+def _add_union_batch_argument(parser):
+    parser.add_argument(
+        "--union-batch-size",
+        "-ubs",
+        type=int,
+        help="Run the queries of up to this many column validations per connection "
+        "as one UNION ALL query, eg. to count the rows of many tables",
+    )
+
+
+def _add_profile_arguments(parser):
+    parser.add_argument(
+        "--profile",
+        "-prof",
+        nargs="?",
+        const=profiler.DEFAULT_PROFILE_DIRECTORY,
+        help="Profile each validation with cProfile and tracemalloc, write the "
+        "profiles to this directory (defaults to dvt-profiles) and print the top "
+        "functions and allocations at the end of the run",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=profiler.DEFAULT_TOP,
+        help="Number of functions and allocations to print per profiled validation",
     )
 
 
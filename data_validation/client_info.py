@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from google.api_core import client_info as http_client_info
+from google.api_core.gapic_v1 import client_info as grpc_client_info
 
 import data_validation
 
@@ -23,3 +24,7 @@ USER_AGENT = "{}/{}".format(APPLICATION_NAME, data_validation.__version__)
 
 def get_http_client_info():
     return http_client_info.ClientInfo(user_agent=USER_AGENT)
+
+
+def get_grpc_client_info():
+    return grpc_client_info.ClientInfo(user_agent=USER_AGENT)
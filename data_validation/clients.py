@@ -13,7 +13,10 @@
 # limitations under the License.
 
 
+import concurrent.futures
 import copy
+import re
+import time
 import warnings
 import logging
 import google.oauth2.service_account
@@ -21,18 +24,27 @@ import ibis
 import ibis.backends.pandas
 import ibis_bigquery
 import pandas
+import sqlalchemy as sa
 import third_party.ibis.ibis_addon.datatypes
 from google.cloud import bigquery
+import ibis.expr.datatypes as dt
+import ibis.expr.schema as sch
 from ibis.backends.mysql.client import MySQLClient
 from ibis.backends.pandas.client import PandasClient
 from ibis.backends.postgres.client import PostgreSQLClient
+from ibis_bigquery.client import NATIVE_PARTITION_COL, BigQueryClient, BigQueryQuery
+from third_party.ibis.ibis_arrow.client import ArrowFileClient, FILE_FORMATS
+from third_party.ibis.ibis_chunked.client import ChunkedFileClient
 from third_party.ibis.ibis_cloud_spanner.api import connect as spanner_connect
 from third_party.ibis.ibis_impala.api import impala_connect
 
-from data_validation import client_info, consts, exceptions
+from data_validation import client_info, consts, exceptions, metadata
 
 ibis.options.sql.default_limit = None
 
+# Schemas listed at the same time by get_all_tables.
+LIST_TABLES_WORKERS = 8
+
 # Our customized Ibis Datatype logic add support for new types
 third_party.ibis.ibis_addon.datatypes
 
@@ -40,15 +52,18 @@ third_party.ibis.ibis_addon.datatypes
 warnings.filterwarnings(
     "ignore", "Your application has authenticated using end user credentials"
 )
-warnings.filterwarnings(
-    "ignore",
-    "Cannot create BigQuery Storage client, the dependency google-cloud-bigquery-storage is not installed",
-)
 warnings.filterwarnings(
     "ignore", "The GenericFunction 'regex_extract' is already registered"
 )
 
 
+# The BigQuery Storage Read API is used to download query results if installed
+try:
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
+
+
 def _raise_missing_client_error(msg):
     def get_client_call(*args, **kwargs):
         raise Exception(msg)
@@ -89,8 +104,57 @@ try:
 except Exception:
     DB2Client = _raise_missing_client_error("pip install ibm_db_sa")
 
+try:
+    from third_party.ibis.ibis_duckdb.client import DuckDBClient
+except Exception:
+    DuckDBClient = _raise_missing_client_error("pip install duckdb duckdb-engine")
+
+
+class BigQueryStorageQuery(BigQueryQuery):
+    """BigQuery query which downloads results with the Storage Read API.
 
-def get_bigquery_client(project_id, dataset_id=None, credentials=None):
+    Results are read as Arrow record batches over parallel streams when the
+    client has a BigQuery Storage client, otherwise the paged REST API is used.
+    """
+
+    def _fetch(self, cursor):
+        df = cursor.query.to_dataframe(
+            bqstorage_client=self.client.bqstorage_client,
+            create_bqstorage_client=False,
+        )
+        df = self.schema().apply_to(df)
+        df.attrs["engine_stats"] = _get_bigquery_job_stats(cursor.query)
+        return df
+
+
+def _get_bigquery_job_stats(query_job):
+    return {
+        "job_id": query_job.job_id,
+        "location": query_job.location,
+        "total_bytes_processed": query_job.total_bytes_processed,
+        "total_bytes_billed": query_job.total_bytes_billed,
+        "slot_millis": query_job.slot_millis,
+        "cache_hit": query_job.cache_hit,
+    }
+
+
+def get_bigquery_storage_client(credentials=None):
+    """Return a BigQueryReadClient or None if the dependency is missing."""
+    if bigquery_storage is None:
+        logging.debug(
+            "google-cloud-bigquery-storage is not installed, "
+            "BigQuery results will be downloaded with the REST API."
+        )
+        return None
+
+    return bigquery_storage.BigQueryReadClient(
+        credentials=credentials, client_info=client_info.get_grpc_client_info()
+    )
+
+
+def get_bigquery_client(
+    project_id, dataset_id=None, credentials=None, use_storage_api=True
+):
     info = client_info.get_http_client_info()
     google_client = bigquery.Client(
         project=project_id, client_info=info, credentials=credentials
@@ -102,17 +166,33 @@ def get_bigquery_client(project_id, dataset_id=None, credentials=None):
     # Override the BigQuery client object to ensure the correct user agent is
     # included.
     ibis_client.client = google_client
+
+    ibis_client.bqstorage_client = (
+        get_bigquery_storage_client(credentials=credentials)
+        if use_storage_api
+        else None
+    )
+    ibis_client.query_class = BigQueryStorageQuery
     return ibis_client
 
 
-def get_pandas_client(table_name, file_path, file_type):
+def get_pandas_client(table_name, file_path, file_type, chunk_size=None):
     """Return pandas client and env with file loaded into DataFrame
 
+    Parquet and Arrow IPC (Feather) files are not loaded up front, they are
+    read when a validation is executed with only the columns it uses. CSV and
+    JSON lines files are read in chunks on execution when chunk_size is set.
+
     table_name (str): Table name to use as reference for file data
     file_path (str): The local, s3, or GCS file path to the data
-    file_type (str): The file type of the file (csv or json)
+    file_type (str): The file type of the file (csv, json, parquet, feather)
+    chunk_size (int): Rows per chunk to read CSV or JSON lines files in
     """
-    if file_type == "csv":
+    if file_type in FILE_FORMATS:
+        return ArrowFileClient(table_name, file_path, file_type)
+    elif chunk_size:
+        return ChunkedFileClient(table_name, file_path, file_type, int(chunk_size))
+    elif file_type == "csv":
         df = pandas.read_csv(file_path)
     elif file_type == "json":
         df = pandas.read_json(file_path)
@@ -124,6 +204,33 @@ def get_pandas_client(table_name, file_path, file_type):
     return pandas_client
 
 
+def execute_with_stats(client, query, result_type):
+    """Return the results of a query and the QueryStats of its execution.
+
+    Clients which collect statistics from the database return them with the
+    results, in df.attrs["engine_stats"], rather than on the client which
+    other threads may be executing queries with. They are returned as the
+    engine_stats of the QueryStats. Bytes are the shallow memory usage of the
+    results, so they cost no pass over the values of object columns.
+
+    client (IbisClient): Client to execute the query with
+    query (ibis.expr.types.Expr): Query to execute
+    result_type (str): Whether the query is the source or target query
+    """
+    start = time.perf_counter()
+    df = client.execute(query)
+    duration = time.perf_counter() - start
+
+    stats = metadata.QueryStats(
+        result_type,
+        rows=len(df),
+        bytes=int(df.memory_usage(index=False).sum()),
+        duration=duration,
+        engine_stats=dict(df.attrs.get("engine_stats", {})),
+    )
+    return df, stats
+
+
 def get_ibis_table(client, schema_name, table_name, database_name=None):
     """Return Ibis Table for Supplied Client.
 
@@ -137,9 +244,10 @@ def get_ibis_table(client, schema_name, table_name, database_name=None):
         PostgreSQLClient,
         DB2Client,
         MSSQLClient,
+        DuckDBClient,
     ]:
         return client.table(table_name, database=database_name, schema=schema_name)
-    elif type(client) in [PandasClient]:
+    elif type(client) in [PandasClient, ArrowFileClient, ChunkedFileClient]:
         return client.table(table_name, schema=schema_name)
     else:
         return client.table(table_name, database=schema_name)
@@ -153,12 +261,199 @@ def get_ibis_table_schema(client, schema_name, table_name):
     table_name (str): Table name of table object
     database_name (str): Database name (generally default is used)
     """
-    if type(client) in [MySQLClient, PostgreSQLClient]:
+    if type(client) in [MySQLClient, PostgreSQLClient, DuckDBClient]:
         return client.schema(schema_name).table(table_name).schema()
     else:
         return client.get_schema(table_name, schema_name)
 
 
+# Columns of tables in the PostgreSQL catalog, as read by SQLAlchemy for one
+# table, for all tables of the given schemas and names.
+_POSTGRES_CATALOG_COLUMNS = """
+SELECT n.nspname, c.relname, a.attname,
+  pg_catalog.format_type(a.atttypid, a.atttypmod),
+  a.attnotnull
+FROM pg_catalog.pg_attribute a
+JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE n.nspname IN :schema_names AND c.relname IN :table_names
+AND c.relkind IN ('r', 'v', 'm', 'f', 'p')
+AND a.attnum > 0 AND NOT a.attisdropped
+ORDER BY n.nspname, c.relname, a.attnum
+"""
+
+_BIGQUERY_CATALOG_COLUMNS = """
+SELECT @schema_name_{index} AS schema_name, table_name, column_name, data_type,
+  is_hidden, ordinal_position
+FROM `{dataset}.INFORMATION_SCHEMA.COLUMNS`
+WHERE table_name IN UNNEST(@table_names_{index})
+"""
+
+_BIGQUERY_TYPE_PARAMETERS = re.compile(r"\(.*\)$")
+_BIGQUERY_ARRAY = re.compile(r"^ARRAY<(\w+)>$")
+
+
+def _get_postgres_catalog_schemas(client, tables):
+    """Return the Ibis schemas of tables read with one query of the catalog.
+
+    The columns are converted to types by the dialect and Ibis as when a
+    table is reflected, so the schemas are the same as from
+    get_ibis_table_schema.
+    """
+    dialect = client.con.dialect
+    default_schema = dialect.default_schema_name
+    query = sa.text(_POSTGRES_CATALOG_COLUMNS).bindparams(
+        sa.bindparam("schema_names", expanding=True),
+        sa.bindparam("table_names", expanding=True),
+    )
+    with client.con.connect() as connection:
+        rows = connection.execute(
+            query,
+            schema_names=sorted({schema or default_schema for schema, _ in tables}),
+            table_names=sorted({table for _, table in tables}),
+        ).fetchall()
+        domains = dialect._load_domains(connection)
+        enums = {
+            (
+                (enum["name"],) if enum["visible"] else (enum["schema"], enum["name"])
+            ): enum
+            for enum in dialect._load_enums(connection, schema="*")
+        }
+
+    catalog_tables = {}
+    for schema_name, table_name, column_name, format_type, notnull in rows:
+        catalog_tables.setdefault((schema_name, table_name), []).append(
+            (column_name, format_type, notnull)
+        )
+
+    schemas = {}
+    for schema_name, table_name in tables:
+        columns = catalog_tables.get((schema_name or default_schema, table_name))
+        if not columns:
+            continue
+        try:
+            schemas[(schema_name, table_name)] = sch.schema(
+                [
+                    _get_postgres_column_type(
+                        dialect, schema_name, column, domains, enums
+                    )
+                    for column in columns
+                ]
+            )
+        except Exception:
+            # Eg. a type Ibis does not support, raised again per table.
+            continue
+    return schemas
+
+
+def _get_postgres_column_type(dialect, schema_name, column, domains, enums):
+    column_name, format_type, notnull = column
+    column_info = dialect._get_column_info(
+        column_name, format_type, None, notnull, domains, enums, schema_name, None, None
+    )
+    return (
+        column_name,
+        dt.dtype(dialect, column_info["type"], nullable=column_info["nullable"]),
+    )
+
+
+def _get_bigquery_catalog_schemas(client, tables):
+    """Return the Ibis schemas of tables read with one query of INFORMATION_SCHEMA.
+
+    The COLUMNS views of every dataset are read in one query. Tables with
+    STRUCT columns, which the view describes as one type string, are left
+    to get_ibis_table_schema.
+    """
+    table_names = {}
+    for schema_name, table_name in tables:
+        table_names.setdefault(schema_name, set()).add(table_name)
+
+    selects = []
+    parameters = []
+    for index, (schema_name, names) in enumerate(table_names.items()):
+        project, dataset = client._parse_project_and_dataset(schema_name)
+        selects.append(
+            _BIGQUERY_CATALOG_COLUMNS.format(
+                index=index, dataset=f"{project}.{dataset}"
+            )
+        )
+        parameters.append(
+            bigquery.ScalarQueryParameter(f"schema_name_{index}", "STRING", schema_name)
+        )
+        parameters.append(
+            bigquery.ArrayQueryParameter(
+                f"table_names_{index}", "STRING", sorted(names)
+            )
+        )
+    query = (
+        " UNION ALL ".join(selects)
+        + " ORDER BY schema_name, table_name, ordinal_position"
+    )
+    job_config = bigquery.QueryJobConfig(query_parameters=parameters)
+    rows = client.client.query(query, job_config=job_config).result()
+
+    catalog_tables = {}
+    for row in rows:
+        catalog_tables.setdefault((row.schema_name, row.table_name), []).append(row)
+
+    schemas = {}
+    for table, rows in catalog_tables.items():
+        fields = []
+        partition_field = None
+        for row in rows:
+            field_type = _BIGQUERY_TYPE_PARAMETERS.sub("", row.data_type)
+            mode = "NULLABLE"
+            array = _BIGQUERY_ARRAY.match(field_type)
+            if array:
+                field_type, mode = array.group(1), "REPEATED"
+            if "<" in field_type:
+                break
+            field = bigquery.SchemaField(row.column_name, field_type, mode=mode)
+            # Of the pseudo columns of ingestion time partitioned tables, the
+            # schema of a table has _PARTITIONTIME, after the other columns.
+            if row.is_hidden == "YES":
+                if row.column_name == NATIVE_PARTITION_COL:
+                    partition_field = field
+                continue
+            fields.append(field)
+        else:
+            if partition_field is not None:
+                fields.append(partition_field)
+            schemas[table] = sch.schema(
+                [(field.name, dt.dtype(field)) for field in fields]
+            )
+    return schemas
+
+
+def get_ibis_table_schemas(client, tables):
+    """Return a dict of the Ibis Table Schema of each table.
+
+    The columns of all tables are read from the catalog with one query per
+    client where supported (BigQuery, PostgreSQL, Redshift and DuckDB),
+    rather than with one request per table. Tables the catalog query does not
+    return, and tables of other clients, are read with get_ibis_table_schema.
+
+    client (IbisClient): Client to use for tables
+    tables (List[Tuple[str, str]]): Schema and table names of the tables
+    """
+    tables = list(dict.fromkeys(tables))
+    schemas = {}
+    try:
+        if isinstance(client, BigQueryClient):
+            schemas = _get_bigquery_catalog_schemas(client, tables)
+        elif isinstance(client, PostgreSQLClient):
+            schemas = _get_postgres_catalog_schemas(client, tables)
+    except Exception as e:
+        logging.warning(f"Catalog Query Error, reading tables one by one -> {e}")
+
+    for schema_name, table_name in tables:
+        if (schema_name, table_name) not in schemas:
+            schemas[(schema_name, table_name)] = get_ibis_table_schema(
+                client, schema_name, table_name
+            )
+    return schemas
+
+
 def list_schemas(client):
     """Return a list of schemas in the DB."""
     if type(client) in [
@@ -166,6 +461,7 @@ def list_schemas(client):
         PostgreSQLClient,
         DB2Client,
         MSSQLClient,
+        DuckDBClient,
     ]:
         return client.list_schemas()
     elif hasattr(client, "list_databases"):
@@ -181,6 +477,7 @@ def list_tables(client, schema_name):
         PostgreSQLClient,
         DB2Client,
         MSSQLClient,
+        DuckDBClient,
     ]:
         return client.list_tables(schema=schema_name)
     elif schema_name:
@@ -189,28 +486,41 @@ def list_tables(client, schema_name):
         return client.list_tables()
 
 
-def get_all_tables(client, allowed_schemas=None):
+def _list_schema_tables(client, schema_name):
+    try:
+        return list_tables(client, schema_name)
+    except Exception as e:
+        logging.warning(f"List Tables Error: {schema_name} -> {e}")
+        return []
+
+
+def get_all_tables(client, allowed_schemas=None, max_workers=LIST_TABLES_WORKERS):
     """Return a list of tuples with database and table names.
 
     client (IbisClient): Client to use for tables
     allowed_schemas (List[str]): List of schemas to pull.
+    max_workers (int): Number of schemas listed at the same time.
     """
-    table_objs = []
-    schemas = list_schemas(client)
-
-    for schema_name in schemas:
-        if allowed_schemas and schema_name not in allowed_schemas:
-            continue
-        try:
-            tables = list_tables(client, schema_name)
-        except Exception as e:
-            logging.warning(f"List Tables Error: {schema_name} -> {e}")
-            continue
-
-        for table_name in tables:
-            table_objs.append((schema_name, table_name))
+    schemas = [
+        schema_name
+        for schema_name in list_schemas(client)
+        if not allowed_schemas or schema_name in allowed_schemas
+    ]
+    if len(schemas) > 1 and max_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(schemas))
+        ) as executor:
+            schema_tables = list(
+                executor.map(lambda name: _list_schema_tables(client, name), schemas)
+            )
+    else:
+        schema_tables = [_list_schema_tables(client, name) for name in schemas]
 
-    return table_objs
+    return [
+        (schema_name, table_name)
+        for schema_name, tables in zip(schemas, schema_tables)
+        for table_name in tables
+    ]
 
 
 def get_data_client(connection_config):
@@ -259,4 +569,5 @@ CLIENT_LOOKUP = {
     "Snowflake": snowflake_connect,
     "Spanner": spanner_connect,
     "DB2": DB2Client,
+    "DuckDB": DuckDBClient,
 }
@@ -23,6 +23,7 @@ import functools
 import json
 import logging
 import ibis
+import ibis.backends.pandas
 import ibis.expr.datatypes
 
 from data_validation import consts
@@ -39,6 +40,7 @@ def generate_report(
     join_on_fields=(),
     is_value_comparison=False,
     verbose=False,
+    report=consts.REPORT_ALL,
 ):
     """Combine results into a report.
 
@@ -55,6 +57,9 @@ def generate_report(
         is_value_comparison (boolean): Boolean representing if source and
             target agg values should be compared with 'equals to' rather than
             a 'difference' comparison.
+        report (str): Return every result (all), only failed results
+            (failures) or one row of counts per validation (summary). Both
+            filtering and counting are part of the combiner query.
 
     Returns:
         pandas.DataFrame:
@@ -72,29 +77,168 @@ def generate_report(
             f"source: {source_names} target: {target_names}"
         )
 
-    differences_pivot = _calculate_differences(
-        source, target, join_on_fields, run_metadata.validations, is_value_comparison
-    )
+    with run_metadata.span("combiner_build"):
+        differences_pivot = _calculate_differences(
+            source,
+            target,
+            join_on_fields,
+            run_metadata.validations,
+            is_value_comparison,
+        )
 
-    source_pivot = _pivot_result(
-        source, join_on_fields, run_metadata.validations, consts.RESULT_TYPE_SOURCE
-    )
+        source_pivot = _pivot_result(
+            source, join_on_fields, run_metadata.validations, consts.RESULT_TYPE_SOURCE
+        )
 
-    target_pivot = _pivot_result(
-        target, join_on_fields, run_metadata.validations, consts.RESULT_TYPE_TARGET
-    )
-    joined = _join_pivots(source_pivot, target_pivot, differences_pivot, join_on_fields)
-    documented = _add_metadata(joined, run_metadata)
+        target_pivot = _pivot_result(
+            target, join_on_fields, run_metadata.validations, consts.RESULT_TYPE_TARGET
+        )
+        joined = _join_pivots(
+            source_pivot, target_pivot, differences_pivot, join_on_fields
+        )
+        if report == consts.REPORT_FAILURES:
+            joined = _filter_failures(joined)
+        elif report == consts.REPORT_SUMMARY:
+            joined = _summarize(joined)
+        documented = _add_metadata(joined, run_metadata)
 
     if verbose:
         logging.info("-- ** Combiner Query ** --")
         logging.info(documented.compile())
 
-    result_df = client.execute(documented)
+    with run_metadata.span("combiner_execute"):
+        result_df = client.execute(documented)
     result_df.validation_status.fillna(consts.VALIDATION_STATUS_FAIL, inplace=True)
     return result_df
 
 
+def summarize_report(result_df, run_metadata):
+    """Return summary counts for a report which was combined in full."""
+    client = ibis.backends.pandas.connect(
+        {"report": result_df[list(_REPORT_COLUMNS)].reset_index(drop=True)}
+    )
+    table = client.table(
+        "report",
+        schema=ibis.schema(
+            [(name, "string") for name in _REPORT_COLUMNS if name != "num_random_rows"]
+            + [("num_random_rows", "int64")]
+        ),
+    )
+    result_df = client.execute(_add_metadata(_summarize(table), run_metadata))
+    return result_df
+
+
+def _is_failure(report):
+    return report["validation_status"].isnull() | (
+        report["validation_status"] != consts.VALIDATION_STATUS_SUCCESS
+    )
+
+
+def _filter_failures(joined):
+    return joined[_is_failure(joined)]
+
+
+_REPORT_COLUMNS = (
+    "validation_name",
+    "validation_type",
+    "aggregation_type",
+    "source_table_name",
+    "source_column_name",
+    "source_agg_value",
+    "target_table_name",
+    "target_column_name",
+    "target_agg_value",
+    "group_by_columns",
+    "primary_keys",
+    "num_random_rows",
+    "validation_status",
+)
+
+
+def _summarize(joined):
+    """Count compared, missing and mismatched results of each validation.
+
+    Other report columns are kept, so that result handlers can treat a
+    summary like any other report.
+    """
+    descriptions = (
+        "validation_type",
+        "aggregation_type",
+        "source_table_name",
+        "source_column_name",
+        "target_table_name",
+        "target_column_name",
+        "primary_keys",
+    )
+    # Descriptive columns are null on the side a result is missing from, so
+    # take the largest non-empty value of each. A failed result is missing
+    # from a side when its key is absent there, which leaves the side's table
+    # name (or, for custom queries without one, its value) null. NULL values
+    # on both sides compare as a success, so are not counted as missing.
+    failed = _is_failure(joined)
+    in_source = (
+        joined["source_table_name"].notnull() | joined["source_agg_value"].notnull()
+    )
+    in_target = (
+        joined["target_table_name"].notnull() | joined["target_agg_value"].notnull()
+    )
+    counted = joined[
+        [joined["validation_name"], joined["num_random_rows"]]
+        + [joined[name].fillna("").name(name) for name in descriptions]
+        + [
+            joined["group_by_columns"].fillna("").name("group_by_columns"),
+            (failed & ~in_source).name(consts.MISSING_SOURCE),
+            (failed & ~in_target).name(consts.MISSING_TARGET),
+            (failed & in_source & in_target).name(consts.MISMATCHED),
+        ]
+    ]
+    summary = counted.groupby("validation_name").aggregate(
+        [counted[name].max().name(name) for name in descriptions]
+        + [
+            counted["num_random_rows"].max().name("num_random_rows"),
+            # Each key compared, ie. group or row, is counted once.
+            counted["group_by_columns"].nunique().name(consts.ROWS_COMPARED),
+        ]
+        + [
+            counted[name].cast("int64").sum().name(name)
+            for name in (
+                consts.MISSING_SOURCE,
+                consts.MISSING_TARGET,
+                consts.MISMATCHED,
+            )
+        ]
+    )
+    failures = (
+        summary[consts.MISSING_SOURCE]
+        + summary[consts.MISSING_TARGET]
+        + summary[consts.MISMATCHED]
+    )
+    return summary[
+        summary["validation_name"],
+        summary["validation_type"].nullif("").name("validation_type"),
+        summary["aggregation_type"].nullif("").name("aggregation_type"),
+        summary["source_table_name"].nullif("").name("source_table_name"),
+        summary["source_column_name"].nullif("").name("source_column_name"),
+        ibis.literal(None).cast("string").name("source_agg_value"),
+        summary["target_table_name"].nullif("").name("target_table_name"),
+        summary["target_column_name"].nullif("").name("target_column_name"),
+        ibis.literal(None).cast("string").name("target_agg_value"),
+        ibis.literal(None).cast("string").name("group_by_columns"),
+        summary["primary_keys"].nullif("").name("primary_keys"),
+        summary["num_random_rows"],
+        ibis.literal(None).cast("float64").name("difference"),
+        ibis.literal(None).cast("float64").name("pct_difference"),
+        ibis.literal(None).cast("float64").name("pct_threshold"),
+        (failures == 0)
+        .ifelse(consts.VALIDATION_STATUS_SUCCESS, consts.VALIDATION_STATUS_FAIL)
+        .name("validation_status"),
+        summary[consts.ROWS_COMPARED],
+        summary[consts.MISSING_SOURCE],
+        summary[consts.MISSING_TARGET],
+        summary[consts.MISMATCHED],
+    ]
+
+
 def _calculate_difference(field_differences, datatype, validation, is_value_comparison):
     pct_threshold = ibis.literal(validation.threshold)
 
@@ -17,9 +17,15 @@ import logging
 
 import google.oauth2.service_account
 from ibis_bigquery.client import BigQueryClient
+from third_party.ibis.ibis_chunked.client import ChunkedFileClient
 
-from data_validation import clients, consts, state_manager
+from data_validation import clients, consts, memory, state_manager
 from data_validation.result_handlers.bigquery import BigQueryResultHandler
+from data_validation.result_handlers.local import (
+    DEFAULT_SQLITE_TABLE,
+    ParquetResultHandler,
+    SQLiteResultHandler,
+)
 from data_validation.result_handlers.text import TextResultHandler
 from data_validation.validation_builder import ValidationBuilder
 
@@ -276,6 +282,32 @@ class ConfigManager(object):
         """Return int limit for query executions."""
         return self._config.get(consts.CONFIG_LIMIT)
 
+    @property
+    def report(self):
+        """Return the report mode, one of failures, summary or all."""
+        return self._config.get(consts.CONFIG_REPORT) or consts.REPORT_ALL
+
+    @property
+    def output_file(self):
+        """Return the file text results are appended to, if any."""
+        return self._config.get(consts.CONFIG_OUTPUT_FILE)
+
+    @property
+    def record_timings(self):
+        """Return whether phase timings are added to the results."""
+        return bool(self._config.get(consts.CONFIG_RECORD_TIMINGS, False))
+
+    @property
+    def record_query_stats(self):
+        """Return whether source and target query stats are added to the results."""
+        return bool(self._config.get(consts.CONFIG_RECORD_QUERY_STATS, False))
+
+    @property
+    def memory_budget(self):
+        """Return the bytes row validations may use in memory, or None."""
+        memory_budget = self._config.get(consts.CONFIG_MEMORY_BUDGET)
+        return memory.parse_memory_size(memory_budget) if memory_budget else None
+
     @property
     def threshold(self):
         """Return threshold from Config"""
@@ -295,11 +327,21 @@ class ConfigManager(object):
     def get_source_ibis_table(self):
         """Return IbisTable from source."""
         if not hasattr(self, "_source_ibis_table"):
+            self._set_chunked_file_dtypes(
+                self.source_client, self.target_client, self.get_target_ibis_table
+            )
             self._source_ibis_table = clients.get_ibis_table(
                 self.source_client, self.source_schema, self.source_table
             )
         return self._source_ibis_table
 
+    def _set_chunked_file_dtypes(self, client, other_client, get_other_table):
+        """Read a chunked file with the column types of the other side."""
+        if isinstance(client, ChunkedFileClient) and not isinstance(
+            other_client, ChunkedFileClient
+        ):
+            client.set_dtypes(get_other_table().schema())
+
     def get_source_ibis_calculated_table(self, depth=None):
         """Return mutated IbisTable from source
         n: Int the depth of subquery requested"""
@@ -314,6 +356,9 @@ class ConfigManager(object):
     def get_target_ibis_table(self):
         """Return IbisTable from target."""
         if not hasattr(self, "_target_ibis_table"):
+            self._set_chunked_file_dtypes(
+                self.target_client, self.source_client, self.get_source_ibis_table
+            )
             self._target_ibis_table = clients.get_ibis_table(
                 self.target_client, self.target_schema, self.target_table
             )
@@ -352,7 +397,9 @@ class ConfigManager(object):
             else:
                 cols_filter_list = consts.COLUMN_FILTER_LIST
             return TextResultHandler(
-                self._config.get(consts.CONFIG_FORMAT, "table"), cols_filter_list
+                self._config.get(consts.CONFIG_FORMAT, "table"),
+                cols_filter_list,
+                output_file=self.output_file,
             )
 
         result_type = self.result_handler_config[consts.CONFIG_TYPE]
@@ -370,8 +417,31 @@ class ConfigManager(object):
                 )
             else:
                 credentials = None
+            buffer_options = {
+                option: self.result_handler_config[option]
+                for option in (
+                    consts.RESULT_HANDLER_BUFFERED,
+                    consts.RESULT_HANDLER_FLUSH_ROWS,
+                    consts.RESULT_HANDLER_FLUSH_SECONDS,
+                    consts.RESULT_HANDLER_SOURCE_FORMAT,
+                )
+                if self.result_handler_config.get(option) is not None
+            }
             return BigQueryResultHandler.get_handler_for_project(
-                project_id, table_id=table_id, credentials=credentials
+                project_id,
+                table_id=table_id,
+                credentials=credentials,
+                **buffer_options,
+            )
+        elif result_type == "Parquet":
+            return ParquetResultHandler(
+                self.result_handler_config[consts.RESULT_HANDLER_PATH]
+            )
+        elif result_type == "SQLite":
+            return SQLiteResultHandler(
+                self.result_handler_config[consts.RESULT_HANDLER_PATH],
+                table_id=self.result_handler_config.get(consts.TABLE_ID)
+                or DEFAULT_SQLITE_TABLE,
             )
         else:
             raise ValueError(f"Unknown ResultHandler Class: {result_type}")
@@ -392,6 +462,11 @@ class ConfigManager(object):
         result_handler_config=None,
         filter_config=None,
         verbose=False,
+        report=None,
+        output_file=None,
+        record_timings=False,
+        record_query_stats=False,
+        memory_budget=None,
     ):
         if isinstance(filter_config, dict):
             filter_config = [filter_config]
@@ -419,6 +494,16 @@ class ConfigManager(object):
             consts.CONFIG_USE_RANDOM_ROWS: use_random_rows,
             consts.CONFIG_RANDOM_ROW_BATCH_SIZE: random_row_batch_size,
         }
+        if report:
+            config[consts.CONFIG_REPORT] = report
+        if output_file:
+            config[consts.CONFIG_OUTPUT_FILE] = output_file
+        if record_timings:
+            config[consts.CONFIG_RECORD_TIMINGS] = record_timings
+        if record_query_stats:
+            config[consts.CONFIG_RECORD_QUERY_STATS] = record_query_stats
+        if memory_budget:
+            config[consts.CONFIG_MEMORY_BUDGET] = memory_budget
 
         return ConfigManager(
             config,
@@ -44,6 +44,11 @@ CONFIG_THRESHOLD = "threshold"
 CONFIG_CAST = "cast"
 CONFIG_DEPTH = "depth"
 CONFIG_FORMAT = "format"
+CONFIG_REPORT = "report"
+CONFIG_OUTPUT_FILE = "output_file"
+CONFIG_RECORD_TIMINGS = "record_timings"
+CONFIG_RECORD_QUERY_STATS = "record_query_stats"
+CONFIG_MEMORY_BUDGET = "memory_budget"
 CONFIG_LIMIT = "limit"
 CONFIG_FILTERS = "filters"
 CONFIG_FILTER_SOURCE = "source"
@@ -70,6 +75,8 @@ DEFAULT_NUM_RANDOM_ROWS = 10000
 FILTER_TYPE_CUSTOM = "custom"
 FILTER_TYPE_EQUALS = "equals"
 FILTER_TYPE_ISIN = "isin"
+FILTER_TYPE_RANGE = "range"
+FILTER_TYPE_ISNULL = "isnull"
 
 # Validation Types
 COLUMN_VALIDATION = "Column"
@@ -89,6 +96,8 @@ CONFIG_TYPES = [
 # State Manager Fields
 DEFAULT_ENV_DIRECTORY = "~/.config/google-pso-data-validator/"
 ENV_DIRECTORY_VAR = "PSO_DV_CONFIG_HOME"
+DEFAULT_CACHE_DIRECTORY = "~/.cache/google-pso-data-validator/"
+ENV_CACHE_DIRECTORY_VAR = "PSO_DV_CACHE_DIR"
 
 # Yaml File Config Fields
 YAML_RESULT_HANDLER = "result_handler"
@@ -100,9 +109,19 @@ YAML_VALIDATIONS = "validations"
 PROJECT_ID = "project_id"
 TABLE_ID = "table_id"
 GOOGLE_SERVICE_ACCOUNT_KEY_PATH = "google_service_account_key_path"
+RESULT_HANDLER_BUFFERED = "buffered"
+RESULT_HANDLER_FLUSH_ROWS = "flush_rows"
+RESULT_HANDLER_FLUSH_SECONDS = "flush_seconds"
+RESULT_HANDLER_SOURCE_FORMAT = "source_format"
+RESULT_HANDLER_PATH = "path"
 
 # BigQuery Output Table Fields
+RUN_ID = "run_id"
+VALIDATION_NAME = "validation_name"
 VALIDATION_TYPE = "validation_type"
+START_TIME = "start_time"
+END_TIME = "end_time"
+NUM_RANDOM_ROWS = "num_random_rows"
 AGGREGATION_TYPE = "aggregation_type"
 GROUP_BY_COLUMNS = "group_by_columns"
 
@@ -115,6 +134,13 @@ TARGET_COLUMN_NAME = "target_column_name"
 TARGET_AGG_VALUE = "target_agg_value"
 
 VALIDATION_STATUS = "validation_status"
+ROWS_COMPARED = "rows_compared"
+MISSING_SOURCE = "missing_source"
+MISSING_TARGET = "missing_target"
+MISMATCHED = "mismatched"
+PHASE_TIMINGS = "phase_timings"
+QUERY_STATS = "query_stats"
+PEAK_RSS = "peak_rss"
 VALIDATION_STATUS_SUCCESS = "success"
 VALIDATION_STATUS_FAIL = "fail"
 
@@ -126,7 +152,13 @@ COUNT_STAR = "{count_star}"
 RESULT_TYPE_SOURCE = "source"
 RESULT_TYPE_TARGET = "target"
 
-FORMAT_TYPES = ["csv", "json", "table", "text"]
+FORMAT_TYPES = ["csv", "json", "jsonl", "table", "text"]
+
+# Report modes
+REPORT_ALL = "all"
+REPORT_FAILURES = "failures"
+REPORT_SUMMARY = "summary"
+REPORT_TYPES = [REPORT_FAILURES, REPORT_SUMMARY, REPORT_ALL]
 
 # Text Result Handler column filter list
 COLUMN_FILTER_LIST = [
@@ -142,6 +174,9 @@ COLUMN_FILTER_LIST = [
     "primary_keys",
     "group_by_columns",
     "num_random_rows",
+    "phase_timings",
+    "query_stats",
+    "peak_rss",
 ]
 SCHEMA_VALIDATION_COLUMN_FILTER_LIST = [
     "run_id",
@@ -150,4 +185,7 @@ SCHEMA_VALIDATION_COLUMN_FILTER_LIST = [
     "aggregation_type",
     "source_agg_value",
     "target_agg_value",
+    "phase_timings",
+    "query_stats",
+    "peak_rss",
 ]
@@ -20,7 +20,11 @@ import numpy
 import pandas
 import logging
 
-from data_validation import combiner, consts, metadata
+import dataclasses
+import math
+import numbers
+
+from data_validation import clients, combiner, consts, memory, metadata
 from data_validation.config_manager import ConfigManager
 from data_validation.query_builder.random_row_builder import RandomRowBuilder
 from data_validation.schema_validation import SchemaValidation
@@ -43,6 +47,10 @@ class DataValidation(object):
         schema_validator=None,
         result_handler=None,
         verbose=False,
+        source_client=None,
+        target_client=None,
+        schema_results=None,
+        shared_scan=None,
     ):
         """Initialize a DataValidation client
 
@@ -52,53 +60,174 @@ class DataValidation(object):
             schema_validator (SchemaValidation): Optional instance of a SchemaValidation.
             result_handler (ResultHandler): Optional instance of as ResultHandler client.
             verbose (bool): If verbose, the Data Validation client will print the queries run.
+            source_client (IbisClient): Optional source client, eg. shared between validations.
+            target_client (IbisClient): Optional target client, eg. shared between validations.
+            schema_results (DataFrame): Optional comparison of the schemas for a schema
+                validation, eg. from a BulkSchemaValidation.
+            shared_scan (ScanMember): Optional shared scan or BatchMember of a union
+                batch, which runs the queries of a column validation with others.
         """
         self.verbose = verbose
 
         # Data Client Management
         self.config = config
 
-        self.config_manager = ConfigManager(config, verbose=self.verbose)
+        self.config_manager = ConfigManager(
+            config,
+            source_client=source_client,
+            target_client=target_client,
+            verbose=self.verbose,
+        )
 
         self.run_metadata = metadata.RunMetadata()
         self.run_metadata.labels = self.config_manager.labels
 
         # Initialize Validation Builder if None was supplied
-        self.validation_builder = validation_builder or ValidationBuilder(
-            self.config_manager
-        )
+        if validation_builder is None:
+            with self.run_metadata.span("build_validation"):
+                validation_builder = ValidationBuilder(self.config_manager)
+        self.validation_builder = validation_builder
+        self.shared_scan = shared_scan
 
         self.schema_validator = schema_validator or SchemaValidation(
-            self.config_manager, run_metadata=self.run_metadata, verbose=self.verbose
+            self.config_manager,
+            run_metadata=self.run_metadata,
+            verbose=self.verbose,
+            results=schema_results,
         )
 
         # Initialize the default Result Handler if None was supplied
+        self._owns_result_handler = result_handler is None
         self.result_handler = result_handler or self.config_manager.get_result_handler()
 
     # TODO(dhercher) we planned on shifting this to use an Execution Handler.
     # Leaving to to swast on the design of how this should look.
     def execute(self):
         """Execute Queries and Store Results"""
+        memory.start_peak_rss()
+        try:
+            result_df = self._execute_validations()
+        finally:
+            self.run_metadata.peak_rss = memory.stop_peak_rss()
+
+        memory_budget = self.config_manager.memory_budget
+        if memory_budget and result_df is not None:
+            result_df = result_df.assign(
+                **{consts.PEAK_RSS: self.run_metadata.peak_rss}
+            )
+            if (self.run_metadata.peak_rss or 0) > memory_budget:
+                logging.warning(
+                    "Peak memory of %d bytes exceeded the memory budget of %d bytes",
+                    self.run_metadata.peak_rss,
+                    memory_budget,
+                )
+
+        if self.config_manager.record_timings and result_df is not None:
+            result_df = result_df.assign(
+                **{
+                    consts.PHASE_TIMINGS: json.dumps(
+                        {
+                            phase: round(duration, 6)
+                            for phase, duration in self.run_metadata.phase_durations().items()
+                        }
+                    )
+                }
+            )
+
+        if self.config_manager.record_query_stats and result_df is not None:
+            result_df = result_df.assign(
+                **{
+                    consts.QUERY_STATS: json.dumps(
+                        [
+                            dataclasses.asdict(stats)
+                            for stats in self.run_metadata.query_stats
+                        ],
+                        default=str,
+                    )
+                }
+            )
+
+        # Call Result Handler to Manage Results
+        with self.run_metadata.span("result_handler"):
+            result_df = self.result_handler.execute(self.config, result_df)
+
+            # Buffered results are written by whoever created the Result Handler
+            if self._owns_result_handler and getattr(
+                self.result_handler, "buffered", False
+            ):
+                self.result_handler.flush()
+
+        if self.verbose:
+            self._log_timings()
+        return result_df
+
+    def _execute_validations(self):
+        """Return the results of the validation type of the config."""
         # Apply random row filter before validations run
         if self.config_manager.use_random_rows():
-            self._add_random_row_filter()
+            with self.run_metadata.span("random_rows"):
+                self._add_random_row_filter()
 
         # Run correct execution for the given validation type
         if self.config_manager.validation_type == consts.ROW_VALIDATION:
             grouped_fields = self.validation_builder.pop_grouped_fields()
-            result_df = self.execute_recursive_validation(
-                self.validation_builder, grouped_fields
-            )
+            if grouped_fields:
+                # Recursion needs every result to find the groups to split.
+                result_df = self._apply_report(
+                    self.execute_recursive_validation(
+                        self.validation_builder,
+                        grouped_fields,
+                        report=consts.REPORT_ALL,
+                    )
+                )
+            else:
+                result_df = self.execute_recursive_validation(
+                    self.validation_builder,
+                    grouped_fields,
+                    report=self.config_manager.report,
+                )
         elif self.config_manager.validation_type == consts.SCHEMA_VALIDATION:
             """Perform only schema validation"""
-            result_df = self.schema_validator.execute()
+            result_df = self._apply_report(self.schema_validator.execute())
         else:
             result_df = self._execute_validation(
-                self.validation_builder, process_in_memory=True
+                self.validation_builder,
+                process_in_memory=True,
+                report=self.config_manager.report,
+                shared_scan=self.shared_scan,
             )
+        return result_df
 
-        # Call Result Handler to Manage Results
-        return self.result_handler.execute(self.config, result_df)
+    def _log_timings(self):
+        logging.info("-- ** Phase Timings and Query Stats ** --")
+        for phase, duration in self.run_metadata.phase_durations().items():
+            logging.info("%s: %.3fs", phase, duration)
+        for stats in self.run_metadata.query_stats:
+            logging.info(
+                "%s query: %d rows, %d bytes in %.3fs %s",
+                stats.result_type,
+                stats.rows,
+                stats.bytes,
+                stats.duration,
+                stats.engine_stats or "",
+            )
+        if self.run_metadata.peak_rss is not None:
+            logging.info("peak RSS: %d bytes", self.run_metadata.peak_rss)
+
+    def _apply_report(self, result_df):
+        """Apply the report mode to results which were combined in full."""
+        if result_df is None or self.config_manager.report == consts.REPORT_ALL:
+            return result_df
+        elif self.config_manager.report == consts.REPORT_FAILURES:
+            return result_df[
+                result_df[consts.VALIDATION_STATUS] != consts.VALIDATION_STATUS_SUCCESS
+            ]
+        if self.config_manager.validation_type == consts.SCHEMA_VALIDATION:
+            # A schema summary covers every column.
+            result_df = result_df.assign(
+                **{consts.SOURCE_COLUMN_NAME: None, consts.TARGET_COLUMN_NAME: None}
+            )
+        return combiner.summarize_report(result_df, self.run_metadata)
 
     def _add_random_row_filter(self):
         """Add random row filters to the validation builder."""
@@ -166,13 +295,36 @@ class DataValidation(object):
 
         return False
 
-    def execute_recursive_validation(self, validation_builder, grouped_fields):
+    def _get_row_count(self, rows_df):
+        """Return the source plus target rows of a group, or None if unknown."""
+        try:
+            count_df = rows_df[
+                rows_df[consts.AGGREGATION_TYPE] == consts.CONFIG_TYPE_COUNT
+            ]
+            return max(
+                float(row[consts.SOURCE_AGG_VALUE] or 0)
+                + float(row[consts.TARGET_AGG_VALUE] or 0)
+                for row in count_df.to_dict(orient="records")
+            )
+        except (ValueError, TypeError):
+            return None
+
+    def execute_recursive_validation(
+        self,
+        validation_builder,
+        grouped_fields,
+        report=consts.REPORT_ALL,
+        row_count=None,
+    ):
         """Recursive execution for Row validations.
 
         This method executes aggregate queries, such as sum-of-hashes, on the
         source and target tables. Where they differ, add to the GROUP BY
         clause recursively until the individual row differences can be
         identified.
+
+        The row_count of the source plus target rows, where the count of a
+        group is already known, is used to check the memory budget.
         """
         process_in_memory = self.config_manager.process_in_memory()
         past_results = []
@@ -210,15 +362,31 @@ class DataValidation(object):
                     )
                     past_results.append(
                         self.execute_recursive_validation(
-                            recursive_validation_builder, grouped_fields[1:]
+                            recursive_validation_builder,
+                            grouped_fields[1:],
+                            report,
+                            row_count=self._get_row_count(grouped_key_df),
                         )
                     )
         elif self.config_manager.primary_keys and len(grouped_fields) == 0:
-            past_results.append(
-                self._execute_validation(
-                    validation_builder, process_in_memory=process_in_memory
+            partitions = self._count_partitions(validation_builder, row_count)
+            if partitions > 1:
+                past_results.append(
+                    self._execute_partitioned_validation(
+                        validation_builder,
+                        partitions,
+                        process_in_memory=process_in_memory,
+                        report=report,
+                    )
+                )
+            else:
+                past_results.append(
+                    self._execute_validation(
+                        validation_builder,
+                        process_in_memory=process_in_memory,
+                        report=report,
+                    )
                 )
-            )
 
         # elif self.config_manager.primary_keys:
         #     validation_builder.add_config_query_groups(self.config_manager.primary_keys)
@@ -232,6 +400,151 @@ class DataValidation(object):
 
         return pandas.concat(past_results)
 
+    def _count_partitions(self, validation_builder, row_count=None):
+        """Return the partitions needed to validate rows within the memory budget.
+
+        Without a known row_count, the source and target rows are counted
+        with a COUNT(*) of the validation queries.
+        """
+        memory_budget = self.config_manager.memory_budget
+        if not memory_budget:
+            return 1
+
+        with self.run_metadata.span("estimate_memory"):
+            source_query = validation_builder.get_source_query()
+            target_query = validation_builder.get_target_query()
+            if row_count is None:
+                row_count = self.config_manager.source_client.execute(
+                    source_query.count()
+                ) + self.config_manager.target_client.execute(target_query.count())
+            estimate = memory.estimate_validation_bytes(
+                row_count, memory.estimate_row_width(source_query.schema())
+            )
+
+        partitions = math.ceil(estimate / memory_budget)
+        if self.verbose:
+            logging.info(
+                "Estimated %d bytes to validate %d rows in memory, %d partition(s)",
+                estimate,
+                row_count,
+                partitions,
+            )
+        return partitions
+
+    def _get_partition_ranges(self, validation_builder, partitions):
+        """Return (lower, upper) ranges of the first primary key, or None.
+
+        Ranges split the primary key values evenly between the minimum and
+        maximum of the source and target, so only numeric keys are supported.
+        A single (None, None) range is returned when all keys are equal.
+        """
+        alias = self.config_manager.primary_keys[0][consts.CONFIG_FIELD_ALIAS]
+        bounds = []
+        for client, query in (
+            (self.config_manager.source_client, validation_builder.get_source_query()),
+            (self.config_manager.target_client, validation_builder.get_target_query()),
+        ):
+            bounds_df = client.execute(
+                query.aggregate(
+                    [query[alias].min().name("lower"), query[alias].max().name("upper")]
+                )
+            )
+            bounds.extend(bounds_df.iloc[0].dropna().tolist())
+
+        if not bounds or not all(
+            isinstance(bound, numbers.Number) and not isinstance(bound, bool)
+            for bound in bounds
+        ):
+            return None
+
+        lower, upper = min(bounds), max(bounds)
+        if isinstance(lower, numbers.Integral) and isinstance(upper, numbers.Integral):
+            edges = [
+                lower + (upper - lower) * i // partitions for i in range(partitions)
+            ]
+        else:
+            edges = [
+                lower + (upper - lower) * i / partitions for i in range(partitions)
+            ]
+        edges = sorted(set(edges))
+        # The outer ranges are unbounded, so no rows are lost to rounding.
+        return list(zip([None] + edges[1:], edges[1:] + [None]))
+
+    def _execute_partitioned_validation(
+        self, validation_builder, partitions, process_in_memory=True, report=None
+    ):
+        """Validate rows one primary key range at a time to bound memory."""
+        primary_key = self.config_manager.primary_keys[0]
+        ranges = self._get_partition_ranges(validation_builder, partitions)
+        if ranges is None:
+            logging.warning(
+                "Rows exceed the memory budget, but cannot be partitioned by the "
+                "non-numeric primary key %s, validating them in memory.",
+                primary_key[consts.CONFIG_SOURCE_COLUMN],
+            )
+            return self._execute_validation(
+                validation_builder, process_in_memory=process_in_memory, report=report
+            )
+        if len(ranges) < 2:
+            # Every primary key has the same value, so there is nothing to split.
+            return self._execute_validation(
+                validation_builder, process_in_memory=process_in_memory, report=report
+            )
+
+        partition_filters = [
+            {
+                consts.CONFIG_TYPE: consts.FILTER_TYPE_RANGE,
+                consts.CONFIG_FILTER_SOURCE_VALUE: partition_range,
+                consts.CONFIG_FILTER_TARGET_VALUE: partition_range,
+            }
+            for partition_range in ranges
+        ]
+        partition_filters.append({consts.CONFIG_TYPE: consts.FILTER_TYPE_ISNULL})
+
+        results = []
+        for partition_filter in partition_filters:
+            partition_filter[consts.CONFIG_FILTER_SOURCE_COLUMN] = primary_key[
+                consts.CONFIG_SOURCE_COLUMN
+            ]
+            partition_filter[consts.CONFIG_FILTER_TARGET_COLUMN] = primary_key[
+                consts.CONFIG_TARGET_COLUMN
+            ]
+            partition_builder = validation_builder.clone()
+            partition_builder.add_filter(partition_filter)
+            results.append(
+                self._execute_validation(
+                    partition_builder,
+                    process_in_memory=process_in_memory,
+                    report=report,
+                )
+            )
+
+        result_df = pandas.concat(results, ignore_index=True)
+        if report == consts.REPORT_SUMMARY:
+            result_df = self._merge_summaries(result_df)
+        return result_df
+
+    def _merge_summaries(self, result_df):
+        """Return one summary per validation from the summaries of partitions."""
+        counts = [
+            consts.ROWS_COMPARED,
+            consts.MISSING_SOURCE,
+            consts.MISSING_TARGET,
+            consts.MISMATCHED,
+        ]
+        aggregations = {name: "first" for name in result_df.columns}
+        aggregations.update({name: "sum" for name in counts})
+        aggregations[consts.VALIDATION_STATUS] = lambda statuses: (
+            consts.VALIDATION_STATUS_SUCCESS
+            if (statuses == consts.VALIDATION_STATUS_SUCCESS).all()
+            else consts.VALIDATION_STATUS_FAIL
+        )
+        del aggregations[consts.VALIDATION_NAME]
+        merged_df = result_df.groupby(
+            consts.VALIDATION_NAME, sort=False, as_index=False, dropna=False
+        ).agg(aggregations)
+        return merged_df[result_df.columns]
+
     def _add_recursive_validation_filter(self, validation_builder, row):
         """Return ValidationBuilder Configured for Next Recursive Search"""
         group_by_columns = json.loads(row[consts.GROUP_BY_COLUMNS])
@@ -279,12 +592,29 @@ class DataValidation(object):
 
         return pd_schema
 
-    def _execute_validation(self, validation_builder, process_in_memory=True):
-        """Execute Against a Supplied Validation Builder"""
+    def _execute_validation(
+        self,
+        validation_builder,
+        process_in_memory=True,
+        report=consts.REPORT_ALL,
+        shared_scan=None,
+    ):
+        """Execute Against a Supplied Validation Builder
+
+        The results of a shared scan are used, where it ran, rather than
+        running the source and target queries.
+        """
         self.run_metadata.validations = validation_builder.get_metadata()
 
-        source_query = validation_builder.get_source_query()
-        target_query = validation_builder.get_target_query()
+        scan_results = None
+        if shared_scan is not None and process_in_memory:
+            with self.run_metadata.span("shared_scan"):
+                scan_results = shared_scan.get_results()
+
+        if scan_results is None:
+            with self.run_metadata.span("build_queries"):
+                source_query = validation_builder.get_source_query()
+                target_query = validation_builder.get_target_query()
 
         join_on_fields = (
             set(validation_builder.get_primary_keys())
@@ -307,32 +637,55 @@ class DataValidation(object):
         )
 
         if process_in_memory:
-            source_df = self.config_manager.source_client.execute(source_query)
-            target_df = self.config_manager.target_client.execute(target_query)
+            if scan_results is not None:
+                source_df = scan_results.source_df
+                target_df = scan_results.target_df
+                self.run_metadata.query_stats.extend(scan_results.query_stats)
+            else:
+                with self.run_metadata.span("source_query"):
+                    source_df = self._execute_query(
+                        self.config_manager.source_client,
+                        source_query,
+                        consts.RESULT_TYPE_SOURCE,
+                    )
+                with self.run_metadata.span("target_query"):
+                    target_df = self._execute_query(
+                        self.config_manager.target_client,
+                        target_query,
+                        consts.RESULT_TYPE_TARGET,
+                    )
 
-            # Drop excess fields for row validation to avoid pandas errors for unsupported column data types (i.e structs)
-            if (
-                self.config_manager.validation_type == consts.ROW_VALIDATION
-                and self.config_manager.dependent_aliases
-            ):
-                source_df.drop(
-                    source_df.columns.difference(self.config_manager.dependent_aliases),
-                    axis=1,
-                    inplace=True,
-                )
-                target_df.drop(
-                    target_df.columns.difference(self.config_manager.dependent_aliases),
-                    axis=1,
-                    inplace=True,
-                )
+            with self.run_metadata.span("pandas_conversion"):
+                # Drop excess fields for row validation to avoid pandas errors for unsupported column data types (i.e structs)
+                if (
+                    self.config_manager.validation_type == consts.ROW_VALIDATION
+                    and self.config_manager.dependent_aliases
+                ):
+                    source_df.drop(
+                        source_df.columns.difference(
+                            self.config_manager.dependent_aliases
+                        ),
+                        axis=1,
+                        inplace=True,
+                    )
+                    target_df.drop(
+                        target_df.columns.difference(
+                            self.config_manager.dependent_aliases
+                        ),
+                        axis=1,
+                        inplace=True,
+                    )
 
-            pd_schema = self._get_pandas_schema(
-                source_df, target_df, join_on_fields, verbose=self.verbose
-            )
+                pd_schema = self._get_pandas_schema(
+                    source_df, target_df, join_on_fields, verbose=self.verbose
+                )
 
-            pandas_client = ibis.backends.pandas.connect(
-                {combiner.DEFAULT_SOURCE: source_df, combiner.DEFAULT_TARGET: target_df}
-            )
+                pandas_client = ibis.backends.pandas.connect(
+                    {
+                        combiner.DEFAULT_SOURCE: source_df,
+                        combiner.DEFAULT_TARGET: target_df,
+                    }
+                )
 
             try:
                 result_df = combiner.generate_report(
@@ -343,6 +696,7 @@ class DataValidation(object):
                     join_on_fields=join_on_fields,
                     is_value_comparison=is_value_comparison,
                     verbose=self.verbose,
+                    report=report,
                 )
             except Exception as e:
                 if self.verbose:
@@ -362,10 +716,17 @@ class DataValidation(object):
                 join_on_fields=join_on_fields,
                 is_value_comparison=is_value_comparison,
                 verbose=self.verbose,
+                report=report,
             )
 
         return result_df
 
+    def _execute_query(self, client, query, result_type):
+        """Execute a source or target query and record its QueryStats."""
+        df, stats = clients.execute_with_stats(client, query, result_type)
+        self.run_metadata.query_stats.append(stats)
+        return df
+
     def combine_data(self, source_df, target_df, join_on_fields):
         """TODO: Return List of Dictionaries"""
         # Clean Data to Standardize
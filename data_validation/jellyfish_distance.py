@@ -12,7 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+"""Approximate string matching of table names with Jaro similarity.
+
+extract_closest_matches matches many names at once. Rather than scoring every
+pair, it bounds the Jaro similarity of all pairs with vectorized character
+counts: two strings have at most as many matching characters as characters
+in common. Pairs whose bound is below the cutoff, or below the best score
+found so far, are never scored, so the matches are the same as scoring every
+pair with extract_closest_match.
+"""
+
 import jellyfish
+import numpy
+
+# Characters beyond this many distinct characters share count columns, which
+# only loosens the bound.
+MAX_PROFILE_CHARACTERS = 96
+# Pairs bounded per numpy operation, to bound memory.
+BOUND_CHUNK_PAIRS = 2**22
+# Slack for floating point rounding, so a bound never falls below a score.
+_EPSILON = 1e-9
 
 
 def extract_closest_match(search_key, target_list, score_cutoff=0):
@@ -33,3 +52,118 @@ def extract_closest_match(search_key, target_list, score_cutoff=0):
             highest_value_key = target_key
 
     return highest_value_key
+
+
+def _character_profiles(strings, vocabulary, dtype):
+    """Return a matrix of the count of each vocabulary character per string."""
+    profiles = numpy.zeros(
+        (len(strings), min(len(vocabulary), MAX_PROFILE_CHARACTERS) or 1),
+        dtype=dtype,
+    )
+    rows = [index for index, string in enumerate(strings) for _ in string]
+    columns = [
+        vocabulary[character] % MAX_PROFILE_CHARACTERS
+        for string in strings
+        for character in string
+    ]
+    numpy.add.at(profiles, (rows, columns), 1)
+    return profiles
+
+
+def _jaro_bounds(search_profiles, search_lengths, target_profiles, target_lengths):
+    """Return the upper bound of the Jaro similarity of each pair of strings.
+
+    With m matching characters and t transpositions, the Jaro similarity is
+    (m / len(a) + m / len(b) + (m - t) / m) / 3, and m is at most the number
+    of characters in common.
+    """
+    common = numpy.zeros(
+        (len(search_lengths), len(target_lengths)), target_profiles.dtype
+    )
+    for column in range(search_profiles.shape[1]):
+        common += numpy.minimum(
+            search_profiles[:, column, None], target_profiles[None, :, column]
+        )
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        bounds = (
+            common / search_lengths[:, None] + common / target_lengths[None, :] + 1
+        ) / 3
+    bounds[common == 0] = 0.0
+    # Empty strings are scored rather than bounded.
+    bounds[search_lengths == 0, :] = 1.0
+    bounds[:, target_lengths == 0] = 1.0
+    return bounds + _EPSILON
+
+
+def extract_closest_matches(search_keys, target_list, score_cutoff=0):
+    """Return the closest match in target_list of each search key, or None.
+
+    The result is a list, in the order of search_keys, of the value
+    extract_closest_match returns for each key.
+
+     search_keys (list): Strings used to search for closest matches.
+     target_list (list): A list of strings for comparison.
+     score_cutoff (float): A score cutoff (betwen 0 and 1) to be met.
+    """
+    search_keys = list(search_keys)
+    targets = list(target_list)
+    if not search_keys or not targets:
+        return [None] * len(search_keys)
+
+    vocabulary = {}
+    for string in search_keys + targets:
+        for character in string:
+            vocabulary.setdefault(character, len(vocabulary))
+    target_lengths = numpy.array([len(target) for target in targets])
+    # Narrow counts halve the memory traffic of the bounds.
+    max_length = max(max(map(len, search_keys)), target_lengths.max())
+    dtype = numpy.int16 if max_length < 2**15 else numpy.int64
+    target_profiles = _character_profiles(targets, vocabulary, dtype)
+    # Identical strings, and only those, have a similarity of 1.
+    exact_matches = {target: target for target in targets}
+
+    matches = []
+    chunk_size = max(BOUND_CHUNK_PAIRS // len(targets), 1)
+    for start in range(0, len(search_keys), chunk_size):
+        chunk = search_keys[start : start + chunk_size]
+        bounds = _jaro_bounds(
+            _character_profiles(chunk, vocabulary, dtype),
+            numpy.array([len(search_key) for search_key in chunk]),
+            target_profiles,
+            target_lengths,
+        )
+        for search_key, search_bounds in zip(chunk, bounds):
+            if search_key and search_key in exact_matches and score_cutoff <= 1:
+                matches.append(exact_matches[search_key])
+                continue
+            matches.append(
+                _closest_candidate(search_key, targets, search_bounds, score_cutoff)
+            )
+    return matches
+
+
+def _closest_candidate(search_key, targets, bounds, score_cutoff):
+    """Return the best scoring target, scoring targets by descending bound.
+
+    As in extract_closest_match, ties are won by the last target.
+    """
+    candidates = numpy.flatnonzero(bounds >= score_cutoff)
+    # Descending bound, then descending position for the tie break.
+    candidates = candidates[numpy.lexsort((-candidates, -bounds[candidates]))]
+    highest_score = score_cutoff
+    highest_index = None
+    for index in candidates:
+        if bounds[index] < highest_score:
+            break
+        if highest_index is not None and bounds[index] <= highest_score:
+            # Only a later target with an equal score could still win.
+            if index < highest_index:
+                continue
+        score = jellyfish.jaro_similarity(search_key, targets[index])
+        if score > highest_score or (
+            score == highest_score and (highest_index is None or index > highest_index)
+        ):
+            highest_score = score
+            highest_index = index
+
+    return None if highest_index is None else targets[highest_index]
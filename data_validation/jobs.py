@@ -0,0 +1,433 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run validations as background jobs on a bounded pool of workers.
+
+A JobManager queues validation configs as jobs for a pool of worker threads
+and keeps their results, so a service can return a job id straight away and
+serve the status and pages of results of the job later. It also runs
+batches, the validations of a YAML config document, in parallel and yields
+their results as each completes. Data clients are pooled by connection, so
+jobs and batches against the same connections reuse clients, each client
+used by one validation at a time.
+"""
+
+import concurrent.futures
+import contextlib
+import dataclasses
+import datetime
+import json
+import logging
+import threading
+import typing
+import uuid
+from collections import OrderedDict, defaultdict
+
+from data_validation import clients, consts, state_manager
+from data_validation.data_validation import DataValidation
+
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_WORKERS = 32
+DEFAULT_MAX_QUEUED = 100
+DEFAULT_MAX_FINISHED = 1000
+DEFAULT_MAX_RESULT_BYTES = 1024**3
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_CANCELLING = "cancelling"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED, STATUS_CANCELLED)
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while max_queued jobs are waiting."""
+
+
+class _KeepResults(object):
+    """Result handler which only returns the results, to keep them in the job."""
+
+    def execute(self, config, result_df):
+        return result_df
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+@dataclasses.dataclass
+class Job(object):
+    """A validation config run by a JobManager and its results."""
+
+    config: dict
+    job_id: str = dataclasses.field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = STATUS_QUEUED
+    created_time: datetime.datetime = dataclasses.field(default_factory=_now)
+    start_time: typing.Optional[datetime.datetime] = None
+    end_time: typing.Optional[datetime.datetime] = None
+    run_id: typing.Optional[str] = None
+    error: typing.Optional[str] = None
+    result_df: typing.Any = None
+    result_bytes: int = 0
+    future: typing.Optional[concurrent.futures.Future] = None
+
+    @property
+    def total_rows(self):
+        return None if self.result_df is None else len(self.result_df)
+
+    def to_dict(self):
+        """Return the status of the job, without its results."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_time": self.created_time.isoformat(),
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "run_id": self.run_id,
+            "error": self.error,
+            "total_rows": self.total_rows,
+        }
+
+    def results_json(self, offset=0, limit=None):
+        """Return a page of results as a JSON array of records.
+
+        Results are encoded by pandas in one vectorized call, rather than
+        converted to Python objects row by row.
+        """
+        page = self.result_df.iloc[offset : offset + limit if limit else None]
+        return page.to_json(orient="records", date_format="iso", date_unit="us")
+
+
+@dataclasses.dataclass
+class BatchResult(object):
+    """The result of one validation of a batch."""
+
+    index: int
+    config: dict
+    run_id: typing.Optional[str] = None
+    error: typing.Optional[str] = None
+    result_df: typing.Any = None
+
+    def to_json(self):
+        """Return the result as one line of JSON.
+
+        Results are encoded by pandas and spliced in, rather than converted
+        to Python objects row by row.
+        """
+        line = {
+            "index": self.index,
+            "type": self.config.get(consts.CONFIG_TYPE),
+            "schema_name": self.config.get(consts.CONFIG_SCHEMA_NAME),
+            "table_name": self.config.get(consts.CONFIG_TABLE_NAME),
+            "status": STATUS_FAILED if self.error else STATUS_SUCCEEDED,
+            "run_id": self.run_id,
+            "error": self.error,
+            "total_rows": None if self.result_df is None else len(self.result_df),
+        }
+        results = (
+            "null"
+            if self.result_df is None
+            else self.result_df.to_json(
+                orient="records", date_format="iso", date_unit="us"
+            )
+        )
+        return json.dumps(line)[:-1] + ', "results": ' + results + "}"
+
+
+def get_connection_config(connection):
+    """Return a connection config, given one or the name of a stored connection."""
+    if isinstance(connection, dict):
+        return connection
+    return state_manager.StateManager().get_connection_config(connection)
+
+
+def get_batch_configs(document):
+    """Return the validation configs of a YAML config document.
+
+    The document has the same source, target, result_handler and validations
+    keys as a YAML config file. Connections are given by name, as in a YAML
+    config file, or as connection configs.
+    """
+    if not isinstance(document, dict) or not document.get(consts.YAML_VALIDATIONS):
+        raise ValueError("Expected a document with a list of validations")
+    for key in (consts.YAML_SOURCE, consts.YAML_TARGET):
+        if not document.get(key):
+            raise ValueError(f"Expected a {key} connection")
+
+    source_conn = get_connection_config(document[consts.YAML_SOURCE])
+    target_conn = get_connection_config(document[consts.YAML_TARGET])
+    configs = []
+    for validation in document[consts.YAML_VALIDATIONS]:
+        config = dict(validation)
+        config[consts.CONFIG_SOURCE_CONN] = source_conn
+        config[consts.CONFIG_TARGET_CONN] = target_conn
+        config[consts.CONFIG_RESULT_HANDLER] = document.get(consts.YAML_RESULT_HANDLER)
+        configs.append(config)
+    return configs
+
+
+class ClientPool(object):
+    """Data clients reused between jobs, pooled by connection config.
+
+    Clients keep state between executes, eg. the frames of file clients or
+    the single connection of some drivers, so a client is checked out by one
+    validation at a time. A client is created when every client of the
+    connection is checked out, so there are at most as many clients of a
+    connection as validations running at the same time.
+    """
+
+    def __init__(self):
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def checkout(self, connection_config):
+        """Return a context manager holding a client of the connection."""
+        key = json.dumps(connection_config, sort_keys=True, default=str)
+        with self._lock:
+            client = self._idle[key].pop() if self._idle[key] else None
+        if client is None:
+            client = clients.get_data_client(connection_config)
+        try:
+            yield client
+        finally:
+            with self._lock:
+                self._idle[key].append(client)
+
+
+class JobManager(object):
+    """Run validation jobs on a bounded pool of worker threads.
+
+    Arguments:
+        workers (int): Number of validations run at the same time.
+        batch_workers (int): Number of validations of all batches run at the
+            same time.
+        max_queued (int): Jobs waiting for a worker before submit raises
+            QueueFullError.
+        max_finished (int): Finished jobs kept, with their results, before
+            the oldest are dropped.
+        max_result_bytes (int): Memory the results of finished jobs may use
+            before the oldest jobs are dropped. The results of the last
+            finished job are kept, even when they are larger.
+    """
+
+    def __init__(
+        self,
+        workers=DEFAULT_WORKERS,
+        max_queued=DEFAULT_MAX_QUEUED,
+        max_finished=DEFAULT_MAX_FINISHED,
+        batch_workers=DEFAULT_BATCH_WORKERS,
+        max_result_bytes=DEFAULT_MAX_RESULT_BYTES,
+    ):
+        if workers < 1:
+            raise ValueError(f"At least one worker is required: {workers}")
+        if batch_workers < 1:
+            raise ValueError(f"At least one batch worker is required: {batch_workers}")
+        self.workers = workers
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self.max_result_bytes = max_result_bytes
+        self.client_pool = ClientPool()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="validation-job"
+        )
+        self._batch_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=batch_workers, thread_name_prefix="validation-batch"
+        )
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, config):
+        """Queue a validation config as a job and return the Job."""
+        job = Job(config)
+        with self._lock:
+            queued = sum(
+                queued_job.status == STATUS_QUEUED for queued_job in self._jobs.values()
+            )
+            if queued >= self.max_queued:
+                raise QueueFullError(f"{queued} jobs are already queued")
+            self._jobs[job.job_id] = job
+            job.future = self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        """Return the Job with the given id, or None."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self):
+        """Return every job, oldest first."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id):
+        """Cancel a job and return it, or None if there is no such job.
+
+        Queued jobs never start. A running validation cannot be interrupted,
+        so a running job is marked cancelling and its results are discarded
+        once the validation returns.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATUSES:
+                return job
+            if job.future.cancel():
+                self._finish(job, STATUS_CANCELLED)
+            else:
+                job.status = STATUS_CANCELLING
+        return job
+
+    def run_batch(self, configs, workers=DEFAULT_WORKERS):
+        """Run validation configs in parallel, yield a BatchResult as each completes.
+
+        Batches run on a pool of batch_workers threads shared by every
+        batch, rather than the job workers, so a batch starts straight away
+        and its results can be streamed. A batch submits up to workers
+        validations at a time to the pool, so concurrent batches run at most
+        batch_workers validations in total. Validations not yet started when
+        the generator is closed are cancelled.
+        """
+        pending = enumerate(configs)
+        futures = set()
+
+        def submit_next():
+            for index, config in pending:
+                futures.add(
+                    self._batch_executor.submit(
+                        self._run_batch_validation, index, config
+                    )
+                )
+                return
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while futures:
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    futures.remove(future)
+                    submit_next()
+                    yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _run_batch_validation(self, index, config):
+        result = BatchResult(index, config)
+        try:
+            with self._create_validator(config) as validator:
+                result.run_id = validator.run_metadata.run_id
+                result.result_df = validator.execute()
+        except Exception as e:
+            logging.exception("Error running validation %d of batch", index)
+            result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    def shutdown(self, wait=True):
+        """Stop accepting jobs, cancel queued jobs and wait for running jobs."""
+        for job in self.list_jobs():
+            if job.status == STATUS_QUEUED:
+                self.cancel(job.job_id)
+        self._executor.shutdown(wait=wait)
+        self._batch_executor.shutdown(wait=wait)
+
+    def _run(self, job):
+        with self._lock:
+            # Cancelled after the worker picked the job, but before it started.
+            if job.status == STATUS_CANCELLING:
+                self._finish(job, STATUS_CANCELLED)
+            if job.status != STATUS_QUEUED:
+                return
+            job.status = STATUS_RUNNING
+            job.start_time = _now()
+
+        try:
+            result_df = self._validate(job)
+        except Exception as e:
+            logging.exception("Error running validation job %s", job.job_id)
+            with self._lock:
+                job.error = f"{type(e).__name__}: {e}"
+                self._finish(job, STATUS_FAILED)
+            return
+
+        result_bytes = (
+            0 if result_df is None else int(result_df.memory_usage(deep=True).sum())
+        )
+        with self._lock:
+            if job.status == STATUS_CANCELLING:
+                self._finish(job, STATUS_CANCELLED)
+            else:
+                job.result_df = result_df
+                job.result_bytes = result_bytes
+                self._finish(job, STATUS_SUCCEEDED)
+
+    def _validate(self, job):
+        with self._create_validator(job.config) as validator:
+            job.run_id = validator.run_metadata.run_id
+            return validator.execute()
+
+    @contextlib.contextmanager
+    def _create_validator(self, config):
+        """Return a context manager holding a DataValidation of the config.
+
+        The clients of the validation are checked out of the client pool
+        until the context exits.
+        """
+        source_conn = get_connection_config(
+            config.get(consts.CONFIG_SOURCE_CONN)
+            or config[consts.CONFIG_SOURCE_CONN_NAME]
+        )
+        target_conn = get_connection_config(
+            config.get(consts.CONFIG_TARGET_CONN)
+            or config[consts.CONFIG_TARGET_CONN_NAME]
+        )
+        # Results are kept, unless the config has a result handler.
+        result_handler = (
+            None if config.get(consts.CONFIG_RESULT_HANDLER) else _KeepResults()
+        )
+        with self.client_pool.checkout(source_conn) as source_client:
+            with self.client_pool.checkout(target_conn) as target_client:
+                yield DataValidation(
+                    config,
+                    result_handler=result_handler,
+                    source_client=source_client,
+                    target_client=target_client,
+                )
+
+    def _finish(self, job, status):
+        """Record a finished job and drop the oldest finished jobs.
+
+        Jobs are dropped while there are more than max_finished, or their
+        results use more than max_result_bytes. Must be called with the lock
+        held.
+        """
+        job.status = status
+        job.end_time = _now()
+        finished = [
+            finished_job
+            for finished_job in self._jobs.values()
+            if finished_job.status in FINISHED_STATUSES
+        ]
+        over_count = len(finished) - self.max_finished
+        result_bytes = sum(finished_job.result_bytes for finished_job in finished)
+        for finished_job in finished:
+            if over_count > 0 or (
+                result_bytes > self.max_result_bytes and finished_job is not job
+            ):
+                over_count -= 1
+                result_bytes -= finished_job.result_bytes
+                del self._jobs[finished_job.job_id]
@@ -0,0 +1,144 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Estimate and measure the memory used by validations."""
+
+import re
+import sys
+import threading
+
+import ibis.expr.datatypes as dt
+
+try:
+    import resource
+except ImportError:
+    # The resource module is only available on Unix.
+    resource = None
+
+# Bytes of a pandas object column value, eg. a Python string of ~50 characters.
+DEFAULT_OBJECT_WIDTH = 100
+# Source and target DataFrames are held while the combiner builds its pivots
+# and join, which take about twice as much memory again.
+WORKING_SET_FACTOR = 3
+
+_FIXED_WIDTHS = (
+    (dt.Boolean, 1),
+    (dt.Int8, 1),
+    (dt.Int16, 2),
+    (dt.Int32, 4),
+    (dt.Float32, 4),
+    (dt.Integer, 8),
+    (dt.Floating, 8),
+    (dt.Timestamp, 8),
+    (dt.Date, 8),
+)
+_UNITS = {
+    "": 1,
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+_MEMORY_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?B?)\s*$", re.IGNORECASE)
+# Number of running measurements of start_peak_rss.
+_measurements = 0
+_measurements_lock = threading.Lock()
+
+
+def parse_memory_size(value):
+    """Return the bytes of a memory size such as 512MB, 2GB or 1073741824."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _MEMORY_SIZE.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid memory size, expected eg. 512MB or 2GB: {value}")
+    number, unit = match.groups()
+    unit = unit.upper()
+    if unit and not unit.endswith("B"):
+        unit += "B"
+    return int(float(number) * _UNITS[unit])
+
+
+def estimate_row_width(schema):
+    """Return the estimated bytes of a row with the given Ibis schema in pandas."""
+    width = 0
+    for data_type in schema.types:
+        for fixed_type, fixed_width in _FIXED_WIDTHS:
+            if isinstance(data_type, fixed_type):
+                width += fixed_width
+                break
+        else:
+            width += DEFAULT_OBJECT_WIDTH
+    return width
+
+
+def estimate_validation_bytes(rows, row_width):
+    """Return the estimated peak bytes to validate rows in memory."""
+    return int(rows * row_width * WORKING_SET_FACTOR)
+
+
+def reset_peak_rss():
+    """Reset the peak resident set size of the process, where supported.
+
+    Only Linux can reset the peak, elsewhere get_peak_rss returns the peak
+    since the process started. The peak is of the whole process, so it is
+    not per validation while other validations run in other threads.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def get_peak_rss():
+    """Return the peak resident set size of the process in bytes, or None."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def start_peak_rss():
+    """Start measuring the peak resident set size of a validation.
+
+    The peak is of the whole process, so it is only reset when no other
+    measurement is running, eg. of validations in other threads. The peak of
+    concurrent validations is best effort: it includes the memory of the
+    others, since the first of them started.
+    """
+    global _measurements
+    with _measurements_lock:
+        if not _measurements:
+            reset_peak_rss()
+        _measurements += 1
+
+
+def stop_peak_rss():
+    """Stop a measurement of start_peak_rss and return its peak in bytes."""
+    global _measurements
+    with _measurements_lock:
+        _measurements -= 1
+    return get_peak_rss()
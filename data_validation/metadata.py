@@ -15,8 +15,11 @@
 """Metadata classes with data about the validation run."""
 
 
+import contextlib
 import dataclasses
 import datetime
+import logging
+import time
 import typing
 import uuid
 
@@ -62,6 +65,52 @@ class ValidationMetadata(object):
             raise ValueError(f"Unexpected result_type: {result_type}")
 
 
+@dataclasses.dataclass
+class PhaseTiming(object):
+    """Wall clock time spent in one phase of a validation run."""
+
+    phase: str
+    start_time: datetime.datetime
+    duration: float
+    details: dict = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class QueryStats(object):
+    """Rows and bytes returned by a source or target query.
+
+    engine_stats holds statistics reported by the database, where the client
+    collects them, eg. the BigQuery job id, bytes processed and slot
+    milliseconds or the Snowflake query id. shared_by is the number of
+    validations whose results one query returned, eg. of a shared scan, and
+    each of them records the same stats, so they count once for the run.
+    """
+
+    result_type: str
+    rows: int
+    bytes: int
+    duration: float
+    engine_stats: dict = dataclasses.field(default_factory=dict)
+    shared_by: int = 1
+
+
+_TIMING_HOOKS = []
+
+
+def add_timing_hook(hook):
+    """Call hook(run_metadata, phase_timing) whenever a phase finishes.
+
+    Hooks can forward phase timings to a metrics system. Exceptions raised
+    by a hook are logged and do not fail the validation.
+    """
+    _TIMING_HOOKS.append(hook)
+
+
+def remove_timing_hook(hook):
+    """Stop calling a hook added with add_timing_hook."""
+    _TIMING_HOOKS.remove(hook)
+
+
 @dataclasses.dataclass
 class RunMetadata(object):
     run_id: str = dataclasses.field(default_factory=lambda: str(uuid.uuid4()))
@@ -71,3 +120,31 @@ class RunMetadata(object):
         default_factory=lambda: datetime.datetime.now(datetime.timezone.utc)
     )
     end_time: typing.Optional[datetime.datetime] = None
+    timings: list = dataclasses.field(default_factory=list)
+    query_stats: list = dataclasses.field(default_factory=list)
+    peak_rss: typing.Optional[int] = None
+
+    @contextlib.contextmanager
+    def span(self, phase, **details):
+        """Record the time spent in the with block as a PhaseTiming."""
+        start_time = datetime.datetime.now(datetime.timezone.utc)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = PhaseTiming(
+                phase, start_time, time.perf_counter() - start, details
+            )
+            self.timings.append(timing)
+            for hook in list(_TIMING_HOOKS):
+                try:
+                    hook(self, timing)
+                except Exception:
+                    logging.exception("Error in timing hook %s", hook)
+
+    def phase_durations(self):
+        """Return the total seconds spent in each phase, in the order run."""
+        durations = {}
+        for timing in self.timings:
+            durations[timing.phase] = durations.get(timing.phase, 0.0) + timing.duration
+        return durations
@@ -0,0 +1,476 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Plan shared queries, to run column validations with fewer queries per side.
+
+The validations of a YAML config often aggregate the same table with the same
+filters, eg. a validation of counts and sums next to one grouped by date. Each
+ran its own queries, so the table was scanned once per validation and side.
+plan_shared_scans groups column validations by connection, table, filters,
+calculated fields and grouped columns and fuses their aggregates into one
+query per side. The results are split back into the columns of each
+validation before they are combined, so each validation reports as if it ran
+its own queries.
+
+A validation without grouped columns also shares the scan of a grouped
+validation, where its aggregates can be rolled up exactly from the groups:
+counts, minimums, maximums and sums of integers. Row and custom query
+validations compare rows rather than aggregates and run their own queries.
+
+Validations of many tables, eg. a count of every table of a dataset, pay the
+fixed latency of a query per table and side. plan_union_batches tags the
+queries of column validations with their validation and runs them in batches
+as UNION ALL queries per connection, then splits the rows of each table out.
+"""
+
+import copy
+import dataclasses
+import functools
+import json
+import logging
+import threading
+
+import ibis
+import ibis.expr.datatypes as dt
+import pandas
+
+from data_validation import clients, consts
+from data_validation.validation_builder import ValidationBuilder
+
+ROLLUP_AGGREGATES = ("count", "min", "max", "sum")
+SHARED_ALIAS_PREFIX = "shared_scan__"
+UNION_INDEX = "union_batch__index"
+
+
+@dataclasses.dataclass
+class ScanResults(object):
+    """The source and target results of one validation of a shared scan."""
+
+    source_df: pandas.DataFrame
+    target_df: pandas.DataFrame
+    query_stats: list
+
+
+@dataclasses.dataclass
+class _Member(object):
+    config_manager: object
+    rollup: bool = False
+    # Alias of each aggregate in the shared queries to the validation's alias.
+    aliases: dict = dataclasses.field(default_factory=dict)
+    results: ScanResults = None
+
+
+class SharedScan(object):
+    """Column validations which share one source and one target query.
+
+    The queries run when the results of the first validation are requested,
+    and results are released as each validation takes them.
+    """
+
+    def __init__(self, config_managers, rollups):
+        self._members = [
+            _Member(config_manager, rollup)
+            for config_manager, rollup in zip(config_managers, rollups)
+        ]
+        self._executed = False
+        self._lock = threading.Lock()
+
+    def member(self, index):
+        return ScanMember(self, index)
+
+    def get_results(self, index):
+        """Return the ScanResults of a validation, or None to run its own queries."""
+        with self._lock:
+            if not self._executed:
+                self._executed = True
+                try:
+                    self._execute()
+                except Exception:
+                    logging.warning(
+                        "Error running the shared queries of %s, running its "
+                        "validations one by one",
+                        self._members[0].config_manager.full_source_table,
+                        exc_info=True,
+                    )
+                    for member in self._members:
+                        member.results = None
+            member = self._members[index]
+            results, member.results = member.results, None
+            return results
+
+    def _execute(self):
+        members = self._members
+        builder = self._build_queries(members)
+        source_query = builder.get_source_query()
+        target_query = builder.get_target_query()
+
+        exact_members = [
+            member
+            for member in members
+            if not member.rollup
+            or _has_exact_rollup(member, source_query.schema(), target_query.schema())
+        ]
+        if len(exact_members) < len(members):
+            members = exact_members
+            if len(members) < 2:
+                return
+            builder = self._build_queries(members)
+            source_query = builder.get_source_query()
+            target_query = builder.get_target_query()
+
+        config_manager = builder.config_manager
+        source_df, source_stats = clients.execute_with_stats(
+            config_manager.source_client, source_query, consts.RESULT_TYPE_SOURCE
+        )
+        target_df, target_stats = clients.execute_with_stats(
+            config_manager.target_client, target_query, consts.RESULT_TYPE_TARGET
+        )
+
+        # Each query's stats are recorded by every member, marked as shared.
+        source_stats.shared_by = target_stats.shared_by = len(members)
+        group_aliases = builder.get_group_aliases()
+        for member in members:
+            if member.rollup and not (
+                _has_exact_sums(source_df, member)
+                and _has_exact_sums(target_df, member)
+            ):
+                continue
+            member.results = ScanResults(
+                _split_results(source_df, member, group_aliases),
+                _split_results(target_df, member, group_aliases),
+                [source_stats, target_stats],
+            )
+
+    @staticmethod
+    def _build_queries(members):
+        """Return a ValidationBuilder with the aggregates of every member.
+
+        Aggregates are renamed, since validations often use the same aliases.
+        """
+        base = next(member for member in members if not member.rollup)
+        builder = ValidationBuilder(base.config_manager)
+        builder.source_builder.aggregate_fields = []
+        builder.target_builder.aggregate_fields = []
+        for member in members:
+            member.aliases = {}
+            member_builder = ValidationBuilder(member.config_manager)
+            for source_field, target_field in zip(
+                member_builder.source_builder.aggregate_fields,
+                member_builder.target_builder.aggregate_fields,
+            ):
+                alias = SHARED_ALIAS_PREFIX + str(
+                    len(builder.source_builder.aggregate_fields)
+                )
+                member.aliases[alias] = source_field.alias
+                builder.source_builder.add_aggregate_field(
+                    _rename_aggregate(source_field, alias)
+                )
+                builder.target_builder.add_aggregate_field(
+                    _rename_aggregate(target_field, alias)
+                )
+        return builder
+
+
+@dataclasses.dataclass
+class ScanMember(object):
+    """One validation of a SharedScan."""
+
+    scan: SharedScan
+    index: int
+
+    def get_results(self):
+        return self.scan.get_results(self.index)
+
+
+def _rename_aggregate(aggregate_field, alias):
+    renamed = copy.copy(aggregate_field)
+    renamed.alias = alias
+    return renamed
+
+
+def _get_aggregate_types(config_manager):
+    return {
+        aggregate[consts.CONFIG_FIELD_ALIAS]: aggregate[consts.CONFIG_TYPE]
+        for aggregate in config_manager.aggregates
+    }
+
+
+def _has_exact_rollup(member, source_schema, target_schema):
+    """Return whether every sum of a member is of integers, so rolls up exactly."""
+    aggregate_types = _get_aggregate_types(member.config_manager)
+    return all(
+        isinstance(schema[alias], (dt.Integer, dt.Decimal))
+        for alias, aggregate_alias in member.aliases.items()
+        if aggregate_types[aggregate_alias] == "sum"
+        for schema in (source_schema, target_schema)
+    )
+
+
+def _has_exact_sums(df, member):
+    """Return whether the group sums of a member add up exactly in pandas.
+
+    Sums of integers are fetched as floats when a group's sum is NULL, which
+    are only exact while the total stays below 2**53.
+    """
+    aggregate_types = _get_aggregate_types(member.config_manager)
+    for alias, aggregate_alias in member.aliases.items():
+        if aggregate_types[aggregate_alias] != "sum":
+            continue
+        column = df[alias]
+        if pandas.api.types.is_float_dtype(column) and column.abs().sum() >= 2**53:
+            return False
+    return True
+
+
+def _split_results(df, member, group_aliases):
+    """Return the columns of a member's aggregates, under their own aliases."""
+    if member.rollup:
+        return _roll_up(df, member)
+    return df[group_aliases + list(member.aliases)].rename(columns=member.aliases)
+
+
+def _roll_up(df, member):
+    """Return one row of the member's aggregates over every group."""
+    aggregate_types = _get_aggregate_types(member.config_manager)
+    columns = {}
+    for alias, aggregate_alias in member.aliases.items():
+        aggregate_type = aggregate_types[aggregate_alias]
+        values = df[alias].dropna()
+        if aggregate_type == "count":
+            value = values.sum()
+        elif values.empty:
+            value = None
+        else:
+            value = getattr(values, aggregate_type)()
+        try:
+            columns[aggregate_alias] = pandas.Series([value], dtype=df[alias].dtype)
+        except (TypeError, ValueError):
+            # Integers have no missing value, an aggregate of no rows is None.
+            columns[aggregate_alias] = pandas.Series([value], dtype=object)
+    return pandas.DataFrame(columns)
+
+
+def _can_share_scan(config_manager):
+    return (
+        config_manager.validation_type == consts.COLUMN_VALIDATION
+        and bool(config_manager.aggregates)
+        and not config_manager.use_random_rows()
+    )
+
+
+def _can_roll_up(config_manager):
+    return config_manager.query_limit is None and all(
+        aggregate[consts.CONFIG_TYPE] in ROLLUP_AGGREGATES
+        and not aggregate.get(consts.CONFIG_CAST)
+        for aggregate in config_manager.aggregates
+    )
+
+
+def _get_scan_key(config_manager):
+    """Return what validations have in common to share a scan, and their groups."""
+    scan = [
+        id(config_manager.source_client),
+        id(config_manager.target_client),
+        config_manager.source_schema,
+        config_manager.source_table,
+        config_manager.target_schema,
+        config_manager.target_table,
+        config_manager.filters,
+        config_manager.calculated_fields,
+        config_manager.primary_keys,
+        config_manager.query_limit,
+    ]
+    return (
+        json.dumps(scan, sort_keys=True, default=str),
+        json.dumps(config_manager.query_groups, sort_keys=True, default=str),
+    )
+
+
+def plan_shared_scans(config_managers):
+    """Return the ScanMember of each validation which shares a scan, by config manager id.
+
+    Column validations with the same connections, table, filters, calculated
+    fields and grouped columns share a scan. Validations without grouped
+    columns join the scan of a grouped validation, where their aggregates
+    roll up.
+    """
+    scans = {}
+    for config_manager in config_managers:
+        if _can_share_scan(config_manager):
+            scans.setdefault(_get_scan_key(config_manager), []).append(config_manager)
+
+    grouped_scans = {}
+    for (scan_key, groups_key), group in scans.items():
+        if groups_key != "[]":
+            grouped_scans.setdefault(scan_key, group)
+
+    rollups = {}
+    for (scan_key, groups_key), group in list(scans.items()):
+        if (
+            groups_key == "[]"
+            and scan_key in grouped_scans
+            and all(_can_roll_up(config_manager) for config_manager in group)
+        ):
+            grouped_scans[scan_key].extend(group)
+            rollups.update((id(config_manager), True) for config_manager in group)
+            del scans[(scan_key, groups_key)]
+
+    shared_scans = {}
+    for group in scans.values():
+        if len(group) < 2:
+            continue
+        scan = SharedScan(
+            group, [rollups.get(id(config_manager), False) for config_manager in group]
+        )
+        for index, config_manager in enumerate(group):
+            shared_scans[id(config_manager)] = scan.member(index)
+    return shared_scans
+
+
+class UnionBatch(object):
+    """The queries of one side of column validations of different tables.
+
+    The queries are tagged with the index of their validation and run as
+    UNION ALL queries, one per distinct result schema, when the results of
+    the first validation are requested.
+    """
+
+    def __init__(self, config_managers, result_type):
+        self.config_managers = config_managers
+        self.result_type = result_type
+        self._results = None
+        self._query_stats = []
+        self._lock = threading.Lock()
+
+    def get_results(self, index):
+        """Return the results of a validation and stats of its query, or None."""
+        with self._lock:
+            if self._results is None:
+                self._results = {}
+                try:
+                    self._execute()
+                except Exception:
+                    logging.warning(
+                        "Error running a UNION ALL query of %d validations, running "
+                        "them one by one",
+                        len(self.config_managers),
+                        exc_info=True,
+                    )
+                    self._results = {}
+            return self._results.pop(index, None)
+
+    def _execute(self):
+        source = self.result_type == consts.RESULT_TYPE_SOURCE
+        client = (
+            self.config_managers[0].source_client
+            if source
+            else self.config_managers[0].target_client
+        )
+
+        queries = {}
+        for index, config_manager in enumerate(self.config_managers):
+            builder = ValidationBuilder(config_manager)
+            query = builder.get_source_query() if source else builder.get_target_query()
+            queries.setdefault(_get_schema_key(query.schema()), []).append(
+                (index, query)
+            )
+
+        for batch in queries.values():
+            union_query = functools.reduce(
+                lambda union, query: union.union(query, distinct=False),
+                [
+                    query.mutate([ibis.literal(index, type="int64").name(UNION_INDEX)])
+                    for index, query in batch
+                ],
+            )
+            df, stats = clients.execute_with_stats(
+                client, union_query, self.result_type
+            )
+            frames = dict(iter(df.groupby(UNION_INDEX, sort=False)))
+            for index, query in batch:
+                # Rebuilt as if fetched by its own query, since a union has
+                # the column types of every table, eg. floats for integers
+                # with nulls.
+                frame = frames.get(index, df.iloc[:0]).drop(columns=UNION_INDEX)
+                rebuilt = _rebuild_results(frame, query.schema())
+                # Rows and bytes are the validation's own, the duration and
+                # engine stats are of the whole UNION ALL query.
+                validation_stats = dataclasses.replace(
+                    stats,
+                    rows=len(rebuilt),
+                    bytes=int(rebuilt.memory_usage(index=False).sum()),
+                    engine_stats=dict(stats.engine_stats),
+                    shared_by=len(batch),
+                )
+                self._results[index] = (rebuilt, validation_stats)
+
+
+@dataclasses.dataclass
+class BatchMember(object):
+    """One validation of a source and a target UnionBatch."""
+
+    source_batch: UnionBatch
+    source_index: int
+    target_batch: UnionBatch
+    target_index: int
+
+    def get_results(self):
+        source = self.source_batch.get_results(self.source_index)
+        target = self.target_batch.get_results(self.target_index)
+        if source is None or target is None:
+            return None
+        return ScanResults(source[0], target[0], [source[1], target[1]])
+
+
+def _get_schema_key(schema):
+    return tuple(zip(schema.names, (str(dtype) for dtype in schema.types)))
+
+
+def _rebuild_results(df, schema):
+    """Return the rows of a query as a DataFrame, as ibis fetches them."""
+    records = df.astype(object).where(df.notna(), None).values.tolist()
+    rebuilt = pandas.DataFrame.from_records(
+        records, columns=list(df.columns), coerce_float=True
+    )
+    return schema.apply_to(rebuilt)
+
+
+def _can_union(config_manager):
+    return _can_share_scan(config_manager) and config_manager.query_limit is None
+
+
+def plan_union_batches(config_managers, batch_size):
+    """Return the BatchMember of each validation which is batched, by config manager id.
+
+    The source and target queries of column validations are batched by
+    connection, up to batch_size queries per UNION ALL query.
+    """
+    batches = {}
+    members = {}
+    for config_manager in config_managers:
+        if not _can_union(config_manager):
+            continue
+        member = []
+        for result_type, client in (
+            (consts.RESULT_TYPE_SOURCE, config_manager.source_client),
+            (consts.RESULT_TYPE_TARGET, config_manager.target_client),
+        ):
+            batch = batches.get((result_type, id(client)))
+            if batch is None or len(batch.config_managers) >= batch_size:
+                batch = UnionBatch([], result_type)
+                batches[(result_type, id(client))] = batch
+            member.extend([batch, len(batch.config_managers)])
+            batch.config_managers.append(config_manager)
+        members[id(config_manager)] = BatchMember(*member)
+    return members
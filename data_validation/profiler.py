@@ -0,0 +1,173 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Profile the time and memory of each validation in a run."""
+
+import contextlib
+import cProfile
+import dataclasses
+import os
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+import typing
+
+DEFAULT_PROFILE_DIRECTORY = "dvt-profiles"
+DEFAULT_TOP = 10
+
+_UNSAFE_FILE_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclasses.dataclass
+class ValidationProfile(object):
+    """The profiles of one validation.
+
+    The caller sets run_id once the validation's run metadata exists, it is
+    used with the label to name the profile files. Only the top functions
+    and allocation sites are kept, the full profiles are in the files.
+    """
+
+    label: str
+    run_id: typing.Optional[str] = None
+    seconds: float = 0.0
+    peak_memory: int = 0
+    functions: list = dataclasses.field(default_factory=list)
+    allocations: list = dataclasses.field(default_factory=list)
+    stats_path: typing.Optional[str] = None
+    snapshot_path: typing.Optional[str] = None
+
+
+class ValidationProfiler(object):
+    """Profiles validations with cProfile and tracemalloc.
+
+    Each validation writes a pstats file (<run_id>_<table>.prof, which can be
+    read with pstats or snakeviz) and a tracemalloc snapshot
+    (<run_id>_<table>.tracemalloc, read with tracemalloc.Snapshot.load) to
+    the profile directory.
+    """
+
+    def __init__(self, directory=DEFAULT_PROFILE_DIRECTORY, top=DEFAULT_TOP):
+        self.directory = directory
+        self.top = top
+        self.profiles = []
+        os.makedirs(directory, exist_ok=True)
+
+    @contextlib.contextmanager
+    def profile(self, label):
+        """Profile the with block as one validation, yield its ValidationProfile.
+
+        The profiles are written when the block exits, even if the validation
+        fails, so they are not held in memory for the rest of the run.
+        """
+        validation_profile = ValidationProfile(label)
+        profiler = cProfile.Profile()
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield validation_profile
+        finally:
+            profiler.disable()
+            validation_profile.seconds = time.perf_counter() - start
+            validation_profile.peak_memory = tracemalloc.get_traced_memory()[1]
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            self._write(validation_profile, profiler, snapshot)
+            validation_profile.functions = top_functions(
+                pstats.Stats(profiler), self.top
+            )
+            validation_profile.allocations = top_allocations(snapshot, self.top)
+            self.profiles.append(validation_profile)
+
+    def _write(self, validation_profile, profiler, snapshot):
+        name = _UNSAFE_FILE_CHARACTERS.sub(
+            "_",
+            f"{validation_profile.run_id or len(self.profiles)}_"
+            f"{validation_profile.label}",
+        )
+        validation_profile.stats_path = os.path.join(self.directory, f"{name}.prof")
+        validation_profile.snapshot_path = os.path.join(
+            self.directory, f"{name}.tracemalloc"
+        )
+        profiler.dump_stats(validation_profile.stats_path)
+        snapshot.dump(validation_profile.snapshot_path)
+
+    def print_summary(self, file=None):
+        """Print the top functions and allocations of each validation.
+
+        Functions are ordered by the time spent in them, excluding the
+        functions they call. The summary is printed to stderr by default,
+        to keep it apart from validation results printed to stdout.
+        """
+        file = file or sys.stderr
+        for validation_profile in self.profiles:
+            print(
+                f"\nProfile of {validation_profile.label} "
+                f"(run_id {validation_profile.run_id}): "
+                f"{validation_profile.seconds:.3f}s, peak traced memory "
+                f"{validation_profile.peak_memory / 1024 ** 2:.1f} MiB",
+                file=file,
+            )
+            print(f"  {validation_profile.stats_path}", file=file)
+            print(f"  {validation_profile.snapshot_path}", file=file)
+            print(
+                f"  {'ncalls':>10}{'tottime':>10}{'cumtime':>10}  function", file=file
+            )
+            for ncalls, tottime, cumtime, function in validation_profile.functions:
+                print(
+                    f"  {ncalls:>10}{tottime:>10.3f}{cumtime:>10.3f}  {function}",
+                    file=file,
+                )
+            print(f"  {'size':>10}{'count':>10}  allocated at", file=file)
+            for size, count, location in validation_profile.allocations:
+                print(
+                    f"  {size / 1024 ** 2:>7.1f}MiB{count:>10}  {location}",
+                    file=file,
+                )
+
+
+def top_functions(stats, top=DEFAULT_TOP):
+    """Return (ncalls, tottime, cumtime, function) of the top functions by tottime."""
+    rows = []
+    for (filename, lineno, name), (
+        _,
+        ncalls,
+        tottime,
+        cumtime,
+        _,
+    ) in stats.stats.items():
+        # Built in functions have no file, eg. <method 'join' of 'str' objects>.
+        function = name if filename == "~" else f"{filename}:{lineno}({name})"
+        rows.append((ncalls, tottime, cumtime, function))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top]
+
+
+def top_allocations(snapshot, top=DEFAULT_TOP):
+    """Return (size, count, location) of the top allocation sites by size."""
+    rows = []
+    for statistic in snapshot.statistics("lineno")[:top]:
+        frame = statistic.traceback[0]
+        rows.append(
+            (statistic.size, statistic.count, f"{frame.filename}:{frame.lineno}")
+        )
+    return rows
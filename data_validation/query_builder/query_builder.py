@@ -111,6 +111,25 @@ class AggregateField(object):
         return agg_field
 
 
+def _in_range(column, bounds):
+    """Return a filter for lower <= column < upper, where None is unbounded.
+
+    None is returned, ie. no filter, when both bounds are None.
+    """
+    lower, upper = bounds
+    if lower is None and upper is None:
+        return None
+    elif lower is None:
+        return column < upper
+    elif upper is None:
+        return column >= lower
+    return (column >= lower) & (column < upper)
+
+
+def _is_null(column, _):
+    return column.isnull()
+
+
 class FilterField(object):
     def __init__(
         self, ibis_expr, left=None, right=None, left_field=None, right_field=None
@@ -161,6 +180,15 @@ class FilterField(object):
             ibis.expr.types.ColumnExpr.isin, left_field=field_name, right=values
         )
 
+    @staticmethod
+    def in_range(field_name, lower, upper):
+        """Filter for lower <= field < upper, a bound of None is unbounded."""
+        return FilterField(_in_range, left_field=field_name, right=(lower, upper))
+
+    @staticmethod
+    def is_null(field_name):
+        return FilterField(_is_null, left_field=field_name)
+
     @staticmethod
     def custom(expr):
         """Returns a FilterField instance built for any custom SQL using a supported operator.
@@ -452,7 +480,8 @@ class QueryBuilder(object):
         return aggs
 
     def compile_filter_fields(self, table):
-        return [field.compile(table) for field in self.filters]
+        compiled_filters = [field.compile(table) for field in self.filters]
+        return [expr for expr in compiled_filters if expr is not None]
 
     def compile_group_fields(self, table):
         return [field.compile(table) for field in self.grouped_fields]
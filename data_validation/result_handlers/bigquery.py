@@ -14,11 +14,120 @@
 
 """Output validation report to BigQuery tables"""
 
+import io
+import logging
+import math
+import time
+
+import pandas
+import pyarrow
+import pyarrow.parquet
 from google.cloud import bigquery
 
 from data_validation import client_info
 from data_validation.result_handlers.text import TextResultHandler
 
+try:
+    import fastavro
+except ImportError:
+    fastavro = None
+
+DEFAULT_FLUSH_ROWS = 500000
+DEFAULT_FLUSH_SECONDS = 300
+DEFAULT_STREAMING_THRESHOLD = 1000
+SOURCE_FORMATS = (bigquery.SourceFormat.PARQUET, bigquery.SourceFormat.AVRO)
+
+_ARROW_TYPES = {
+    "STRING": pyarrow.string(),
+    "INTEGER": pyarrow.int64(),
+    "INT64": pyarrow.int64(),
+    "FLOAT": pyarrow.float64(),
+    "FLOAT64": pyarrow.float64(),
+    "NUMERIC": pyarrow.float64(),
+    "BOOLEAN": pyarrow.bool_(),
+    "BOOL": pyarrow.bool_(),
+    "TIMESTAMP": pyarrow.timestamp("us", tz="UTC"),
+    "DATETIME": pyarrow.timestamp("us"),
+    "DATE": pyarrow.date32(),
+}
+_AVRO_TYPES = {
+    "STRING": "string",
+    "INTEGER": "long",
+    "INT64": "long",
+    "FLOAT": "double",
+    "FLOAT64": "double",
+    "NUMERIC": "double",
+    "BOOLEAN": "boolean",
+    "BOOL": "boolean",
+    "TIMESTAMP": {"type": "long", "logicalType": "timestamp-micros"},
+    "DATETIME": "string",
+    "DATE": {"type": "int", "logicalType": "date"},
+}
+
+
+def _arrow_type(field):
+    if field.field_type in ("RECORD", "STRUCT"):
+        arrow_type = pyarrow.struct([_arrow_field(child) for child in field.fields])
+    else:
+        arrow_type = _ARROW_TYPES[field.field_type]
+    return pyarrow.list_(arrow_type) if field.mode == "REPEATED" else arrow_type
+
+
+def _arrow_field(field):
+    return pyarrow.field(field.name, _arrow_type(field))
+
+
+def _avro_field(field, path=""):
+    if field.field_type in ("RECORD", "STRUCT"):
+        avro_type = {
+            "type": "record",
+            "name": f"{path}{field.name}",
+            "fields": [
+                _avro_field(child, f"{path}{field.name}_") for child in field.fields
+            ],
+        }
+    else:
+        avro_type = _AVRO_TYPES[field.field_type]
+    if field.mode == "REPEATED":
+        return {"name": field.name, "type": {"type": "array", "items": avro_type}}
+    return {"name": field.name, "type": ["null", avro_type], "default": None}
+
+
+def _is_null(value):
+    return (
+        value is None
+        or value is pandas.NaT
+        or (isinstance(value, float) and math.isnan(value))
+    )
+
+
+def _avro_value(field, value):
+    """Convert a DataFrame value to the Avro representation of a field."""
+    if field.mode == "REPEATED":
+        return [] if _is_null(value) else [_avro_item(field, item) for item in value]
+    return _avro_item(field, value)
+
+
+def _avro_item(field, value):
+    if _is_null(value):
+        return None
+    if field.field_type in ("RECORD", "STRUCT"):
+        if not isinstance(value, dict):
+            value = dict(zip([child.name for child in field.fields], value))
+        return {
+            child.name: _avro_value(child, value.get(child.name))
+            for child in field.fields
+        }
+    if field.field_type == "TIMESTAMP":
+        return pandas.Timestamp(value).to_pydatetime()
+    if field.field_type == "DATETIME":
+        return pandas.Timestamp(value).isoformat()
+    if field.field_type in ("INTEGER", "INT64"):
+        return int(value)
+    if field.field_type in ("FLOAT", "FLOAT64", "NUMERIC"):
+        return float(value)
+    return value
+
 
 class BigQueryResultHandler(object):
     """Write results of data validation to BigQuery.
@@ -29,15 +138,57 @@ class BigQueryResultHandler(object):
         table_id (str):
             Fully-qualified table ID (``project-id.dataset.table``) of
             destination table for results.
+        buffered (bool):
+            Buffer results across validations and write them with load jobs
+            instead of streaming inserts. Call ``flush`` after the last
+            validation to write any buffered results.
+        flush_rows (int):
+            Number of buffered rows which triggers a flush.
+        flush_seconds (float):
+            Age in seconds of the oldest buffered result which triggers a
+            flush when the next result is added.
+        source_format (str):
+            Load job file format, ``PARQUET`` or ``AVRO``.
+        streaming_threshold (int):
+            Flushes of fewer rows than this are streamed, as a load job is
+            slower than a streaming insert for small results.
     """
 
-    def __init__(self, bigquery_client, table_id="pso_data_validator.results"):
+    def __init__(
+        self,
+        bigquery_client,
+        table_id="pso_data_validator.results",
+        buffered=False,
+        flush_rows=DEFAULT_FLUSH_ROWS,
+        flush_seconds=DEFAULT_FLUSH_SECONDS,
+        source_format=bigquery.SourceFormat.PARQUET,
+        streaming_threshold=DEFAULT_STREAMING_THRESHOLD,
+    ):
+        source_format = source_format.upper()
+        if source_format not in SOURCE_FORMATS:
+            raise ValueError(f"Unknown Load Job Source Format: {source_format}")
+        if source_format == bigquery.SourceFormat.AVRO and fastavro is None:
+            raise ImportError(
+                "Writing results as Avro requires fastavro: pip install fastavro"
+            )
         self._bigquery_client = bigquery_client
         self._table_id = table_id
+        self._buffered = buffered
+        self._flush_rows = int(flush_rows)
+        self._flush_seconds = float(flush_seconds)
+        self._source_format = source_format
+        self._streaming_threshold = int(streaming_threshold)
+        self._buffer = []
+        self._buffered_rows = 0
+        self._buffer_started = None
+        self._table = None
 
     @staticmethod
     def get_handler_for_project(
-        project_id, table_id="pso_data_validator.results", credentials=None
+        project_id,
+        table_id="pso_data_validator.results",
+        credentials=None,
+        **kwargs,
     ):
         """Return BigQueryResultHandler instance for given project.
 
@@ -47,18 +198,115 @@ class BigQueryResultHandler(object):
             credentials (google.auth.credentials.Credentials):
                 Explicit credentials to use in case default credentials
                 aren't working properly.
+            kwargs: Buffering options passed to BigQueryResultHandler.
         """
         info = client_info.get_http_client_info()
         client = bigquery.Client(
             project=project_id, client_info=info, credentials=credentials
         )
-        return BigQueryResultHandler(client, table_id=table_id)
+        return BigQueryResultHandler(client, table_id=table_id, **kwargs)
+
+    @property
+    def buffered(self):
+        return self._buffered
 
     def execute(self, config, result_df):
         text_handler = TextResultHandler("table")
         text_handler.print_formatted_(result_df)
 
-        table = self._bigquery_client.get_table(self._table_id)
+        if not self._buffered:
+            self._insert_rows(result_df)
+            return result_df
+
+        if not self._buffer:
+            self._buffer_started = time.monotonic()
+        self._buffer.append(result_df)
+        self._buffered_rows += len(result_df)
+        if (
+            self._buffered_rows >= self._flush_rows
+            or time.monotonic() - self._buffer_started >= self._flush_seconds
+        ):
+            self.flush()
+
+        return result_df
+
+    def flush(self):
+        """Write all buffered results to BigQuery."""
+        if not self._buffer:
+            return
+        result_df = pandas.concat(self._buffer, ignore_index=True)
+        self._buffer = []
+        self._buffered_rows = 0
+        self._buffer_started = None
+
+        if len(result_df) < self._streaming_threshold:
+            self._insert_rows(result_df)
+        else:
+            self._load_rows(result_df)
+
+    def _get_table(self):
+        if self._table is None:
+            self._table = self._bigquery_client.get_table(self._table_id)
+        return self._table
+
+    def _load_rows(self, result_df):
+        """Write results with a load job from an in memory Parquet or Avro file."""
+        table = self._get_table()
+        fields = [field for field in table.schema if field.name in result_df.columns]
+        unknown = set(result_df.columns) - {field.name for field in table.schema}
+        if unknown:
+            raise RuntimeError(
+                f"Please update your BigQuery results table schema, it is missing columns: {sorted(unknown)}"
+            )
+
+        if self._source_format == bigquery.SourceFormat.AVRO:
+            data = self._to_avro(result_df, fields)
+        else:
+            data = self._to_parquet(result_df, fields)
+
+        job_config = bigquery.LoadJobConfig(
+            source_format=self._source_format,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            schema=table.schema,
+        )
+        if self._source_format == bigquery.SourceFormat.AVRO:
+            job_config.use_avro_logical_types = True
+        else:
+            # Load Parquet lists, eg. labels, as repeated fields.
+            job_config._set_sub_prop("parquetOptions", {"enableListInference": True})
+        logging.info("Loading %s result rows into %s", len(result_df), self._table_id)
+        job = self._bigquery_client.load_table_from_file(
+            data, table, rewind=True, job_config=job_config
+        )
+        job.result()
+
+    @staticmethod
+    def _to_parquet(result_df, fields):
+        schema = pyarrow.schema([_arrow_field(field) for field in fields])
+        table = pyarrow.Table.from_pandas(
+            result_df[schema.names], schema=schema, preserve_index=False
+        )
+        data = io.BytesIO()
+        pyarrow.parquet.write_table(table, data, compression="snappy")
+        return data
+
+    @staticmethod
+    def _to_avro(result_df, fields):
+        schema = {
+            "type": "record",
+            "name": "result",
+            "fields": [_avro_field(field) for field in fields],
+        }
+        records = (
+            {field.name: _avro_value(field, row[field.name]) for field in fields}
+            for row in result_df.to_dict("records")
+        )
+        data = io.BytesIO()
+        fastavro.writer(data, fastavro.parse_schema(schema), records)
+        return data
+
+    def _insert_rows(self, result_df):
+        table = self._get_table()
         chunk_errors = self._bigquery_client.insert_rows_from_dataframe(
             table, result_df
         )
@@ -80,5 +328,3 @@ class BigQueryResultHandler(object):
                     f"The latest release of DVT has added two fields 'primary_keys' and 'num_random_rows': {chunk_errors}"
                 )
             raise RuntimeError(f"could not write rows: {chunk_errors}")
-
-        return result_df
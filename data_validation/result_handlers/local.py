@@ -0,0 +1,208 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Output validation report to local Parquet files or a SQLite database.
+
+Results are appended chunk by chunk and only a summary is printed, so very
+large row validation reports can be stored quickly and queried afterwards,
+eg. for the failed rows of a run.
+"""
+
+import json
+import os
+import sqlite3
+import uuid
+
+import pandas
+import pyarrow
+import pyarrow.parquet
+
+from data_validation import consts
+
+DEFAULT_CHUNK_SIZE = 100000
+DEFAULT_SQLITE_TABLE = "results"
+
+_LABEL_TYPE = pyarrow.struct([("key", pyarrow.string()), ("value", pyarrow.string())])
+_RESULT_TYPES = {
+    consts.RUN_ID: pyarrow.string(),
+    consts.VALIDATION_NAME: pyarrow.string(),
+    consts.VALIDATION_TYPE: pyarrow.string(),
+    consts.START_TIME: pyarrow.timestamp("us", tz="UTC"),
+    consts.END_TIME: pyarrow.timestamp("us", tz="UTC"),
+    consts.SOURCE_TABLE_NAME: pyarrow.string(),
+    consts.TARGET_TABLE_NAME: pyarrow.string(),
+    consts.SOURCE_COLUMN_NAME: pyarrow.string(),
+    consts.TARGET_COLUMN_NAME: pyarrow.string(),
+    consts.AGGREGATION_TYPE: pyarrow.string(),
+    consts.GROUP_BY_COLUMNS: pyarrow.string(),
+    consts.CONFIG_PRIMARY_KEYS: pyarrow.string(),
+    consts.NUM_RANDOM_ROWS: pyarrow.int64(),
+    consts.SOURCE_AGG_VALUE: pyarrow.string(),
+    consts.TARGET_AGG_VALUE: pyarrow.string(),
+    "difference": pyarrow.float64(),
+    "pct_difference": pyarrow.float64(),
+    "pct_threshold": pyarrow.float64(),
+    consts.VALIDATION_STATUS: pyarrow.string(),
+    consts.ROWS_COMPARED: pyarrow.int64(),
+    consts.MISSING_SOURCE: pyarrow.int64(),
+    consts.MISSING_TARGET: pyarrow.int64(),
+    consts.MISMATCHED: pyarrow.int64(),
+    consts.PHASE_TIMINGS: pyarrow.string(),
+    consts.QUERY_STATS: pyarrow.string(),
+    consts.PEAK_RSS: pyarrow.int64(),
+    consts.CONFIG_LABELS: pyarrow.list_(_LABEL_TYPE),
+}
+
+
+def _labels(value):
+    """Return labels, stored as (key, value) pairs, as a list of dicts."""
+    if not isinstance(value, (list, tuple)):
+        return []
+    return [
+        label if isinstance(label, dict) else {"key": label[0], "value": label[1]}
+        for label in value
+    ]
+
+
+def _chunks(result_df, chunk_size):
+    for start in range(0, max(len(result_df), 1), chunk_size):
+        yield result_df.iloc[start : start + chunk_size]
+
+
+def _print_summary(result_df, location):
+    statuses = result_df[consts.VALIDATION_STATUS].value_counts().to_dict()
+    counts = ", ".join(f"{status}: {count}" for status, count in statuses.items())
+    print(f"Wrote {len(result_df)} validation results ({counts}) to {location}")
+
+
+class ParquetResultHandler(object):
+    """Append validation results to Parquet files partitioned by run_id.
+
+    Each result is written to a new file under ``<path>/run_id=<run_id>/``,
+    so the directory can be read as a Hive partitioned dataset, eg. with
+    ``pyarrow.parquet.read_table(path, filters=[("run_id", "=", run_id)])``.
+
+    Arguments:
+        path (str): Directory to write results to.
+        chunk_size (int): Rows written per Parquet row group.
+    """
+
+    def __init__(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = int(chunk_size)
+
+    def _schema(self, result_df):
+        """Return the Arrow schema of results, other than the run_id partition."""
+        return pyarrow.schema(
+            [
+                pyarrow.field(
+                    name,
+                    _RESULT_TYPES.get(name)
+                    or pyarrow.Schema.from_pandas(result_df[[name]]).field(name).type,
+                )
+                for name in result_df.columns
+                if name != consts.RUN_ID
+            ]
+        )
+
+    def execute(self, config, result_df):
+        df = result_df.copy()
+        if consts.CONFIG_LABELS in df:
+            df[consts.CONFIG_LABELS] = df[consts.CONFIG_LABELS].map(_labels)
+
+        for run_id, run_df in df.groupby(consts.RUN_ID, dropna=False):
+            directory = os.path.join(self.path, f"{consts.RUN_ID}={run_id}")
+            os.makedirs(directory, exist_ok=True)
+            file_path = os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet")
+            schema = self._schema(run_df)
+            with pyarrow.parquet.ParquetWriter(file_path, schema) as writer:
+                for chunk in _chunks(run_df[schema.names], self.chunk_size):
+                    writer.write_table(
+                        pyarrow.Table.from_pandas(
+                            chunk, schema=schema, preserve_index=False
+                        )
+                    )
+
+        _print_summary(result_df, self.path)
+        return result_df
+
+
+class SQLiteResultHandler(object):
+    """Append validation results to a table in a SQLite database.
+
+    The table is indexed on run_id and validation_status, so the failures of
+    a run can be queried quickly. Labels are stored as JSON text.
+
+    Arguments:
+        path (str): SQLite database file, created if it does not exist.
+        table_id (str): Table to append results to.
+        chunk_size (int): Rows inserted per statement batch.
+    """
+
+    def __init__(
+        self, path, table_id=DEFAULT_SQLITE_TABLE, chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        self.path = path
+        self.table_id = table_id
+        self.chunk_size = int(chunk_size)
+
+    def _quote(self, name):
+        return '"{}"'.format(name.replace('"', '""'))
+
+    def _prepare_table(self, connection, columns):
+        """Add any columns missing from an existing results table."""
+        table = self._quote(self.table_id)
+        existing = [row[1] for row in connection.execute(f"PRAGMA table_info({table})")]
+        if not existing:
+            return
+        for column in columns:
+            if column not in existing:
+                connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {self._quote(column)}"
+                )
+
+    def _create_indexes(self, connection):
+        table = self._quote(self.table_id)
+        for column in (consts.RUN_ID, consts.VALIDATION_STATUS):
+            index = self._quote(f"{self.table_id}_{column}")
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {index} ON {table} ({self._quote(column)})"
+            )
+
+    def execute(self, config, result_df):
+        df = result_df.copy()
+        if consts.CONFIG_LABELS in df:
+            df[consts.CONFIG_LABELS] = df[consts.CONFIG_LABELS].map(
+                lambda value: json.dumps(_labels(value))
+            )
+        for name in (consts.START_TIME, consts.END_TIME):
+            if name in df:
+                df[name] = pandas.to_datetime(df[name], utc=True).map(
+                    lambda value: None if pandas.isnull(value) else value.isoformat()
+                )
+
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                self._prepare_table(connection, df.columns)
+                for chunk in _chunks(df, self.chunk_size):
+                    chunk.to_sql(
+                        self.table_id, connection, if_exists="append", index=False
+                    )
+                self._create_indexes(connection)
+        finally:
+            connection.close()
+
+        _print_summary(result_df, f"{self.path} ({self.table_id})")
+        return result_df
@@ -0,0 +1,141 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Write validation results in the background while validations run.
+
+Validations hand their results to a ResultPipeline, which queues them for
+writer threads calling the real result handlers. The queues are bounded, so
+validations block when the writers fall behind. All results of a result
+handler are written by the same writer, in the order they were queued.
+"""
+
+import logging
+import queue
+import threading
+
+DEFAULT_QUEUE_SIZE = 4
+
+_STOP = object()
+
+
+class QueuedResultHandler(object):
+    """Result handler which queues results for a ResultPipeline writer."""
+
+    def __init__(self, pipeline, result_handler):
+        self._pipeline = pipeline
+        self.result_handler = result_handler
+
+    def execute(self, config, result_df):
+        self._pipeline.put(self.result_handler, config, result_df)
+        return result_df
+
+
+class ResultPipeline(object):
+    """Queue validation results for result handlers running on writer threads.
+
+    Arguments:
+        max_queue_size (int):
+            Results each writer queues before validations block.
+        workers (int):
+            Number of writer threads. Result handlers are assigned to writers
+            in turn, so separate handlers can be written concurrently.
+    """
+
+    def __init__(self, max_queue_size=DEFAULT_QUEUE_SIZE, workers=1):
+        if workers < 1:
+            raise ValueError(f"At least one writer is required: {workers}")
+        self._queues = [queue.Queue(maxsize=max_queue_size) for _ in range(workers)]
+        self._threads = [
+            threading.Thread(
+                target=self._write,
+                args=(results,),
+                name=f"result-writer-{index}",
+                daemon=True,
+            )
+            for index, results in enumerate(self._queues)
+        ]
+        self._handlers = []
+        self._writers = {}
+        self._error = None
+        self._closed = False
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(raise_errors=exc_type is None)
+
+    def handler(self, result_handler):
+        """Return a result handler which writes through this pipeline."""
+        return QueuedResultHandler(self, result_handler)
+
+    def put(self, result_handler, config, result_df):
+        """Queue a result, blocking while the handler's writer is busy.
+
+        Raises the error of any failed writer, so a validation run stops at
+        the first result which cannot be written.
+        """
+        if self._closed:
+            raise RuntimeError("ResultPipeline is closed")
+        self._raise_error()
+        if id(result_handler) not in self._writers:
+            self._writers[id(result_handler)] = len(self._handlers) % len(self._queues)
+            self._handlers.append(result_handler)
+        self._queues[self._writers[id(result_handler)]].put(
+            (result_handler, config, result_df)
+        )
+
+    def close(self, raise_errors=True):
+        """Write all queued results, then flush buffered result handlers.
+
+        Buffered handlers are flushed in the order they were first used.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for results in self._queues:
+            results.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+        for result_handler in self._handlers:
+            if getattr(result_handler, "buffered", False):
+                try:
+                    result_handler.flush()
+                except Exception as e:
+                    logging.exception("Error flushing validation results")
+                    self._error = self._error or e
+        if raise_errors:
+            self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _write(self, results):
+        while True:
+            item = results.get()
+            if item is _STOP:
+                return
+            # Keep draining after an error so that validations do not block.
+            if self._error is not None:
+                continue
+            result_handler, config, result_df = item
+            try:
+                result_handler.execute(config, result_df)
+            except Exception as e:
+                logging.exception("Error writing validation results")
+                self._error = e
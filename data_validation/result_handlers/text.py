@@ -22,41 +22,143 @@ from the validation run.
 Output validation report to text-based log
 """
 
+import contextlib
+import sys
+
 from data_validation import consts
 
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_TABLE_MAX_ROWS = 10000
+
+
+def _chunks(result_df, chunk_size):
+    for start in range(0, len(result_df), chunk_size):
+        yield result_df.iloc[start : start + chunk_size]
+
 
 class TextResultHandler(object):
-    def __init__(self, format, cols_filter_list=consts.COLUMN_FILTER_LIST):
+    """Print validation results, or append them to a file.
+
+    Results are formatted and written chunk by chunk, so output starts
+    immediately and memory stays bounded for very large reports. The table
+    format renders a single grid, so it shows at most max_rows rows.
+
+    Arguments:
+        format (str): One of text, csv, json, jsonl or table.
+        cols_filter_list (list): Columns hidden in the table format.
+        output_file (str): File to append results to, instead of stdout.
+        chunk_size (int): Rows formatted and written at a time.
+        max_rows (int): Rows shown in the table format, or None for all.
+    """
+
+    def __init__(
+        self,
+        format,
+        cols_filter_list=consts.COLUMN_FILTER_LIST,
+        output_file=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        max_rows=DEFAULT_TABLE_MAX_ROWS,
+    ):
         self.format = format
         self.cols_filter_list = cols_filter_list
+        self.output_file = output_file
+        self.chunk_size = int(chunk_size)
+        self.max_rows = max_rows
+
+    @contextlib.contextmanager
+    def _open(self):
+        if self.output_file:
+            with open(self.output_file, "a", encoding="utf-8") as output:
+                yield output
+        else:
+            yield sys.stdout
 
     def print_formatted_(self, result_df):
         """
         Utility for printing formatted results
         :param result_df
         """
-        if self.format == "text":
-            print(result_df.to_string(index=False))
-        elif self.format == "csv":
-            print(result_df.to_csv(index=False))
-        elif self.format == "json":
-            print(result_df.to_json(orient="index"))
-        else:
-            print(
-                result_df.drop(self.cols_filter_list, axis=1).to_markdown(
-                    tablefmt="fancy_grid", index=False
-                )
-            )
+        with self._open() as output:
+            if self.format == "text":
+                self._write_text(result_df, output)
+            elif self.format == "csv":
+                self._write_csv(result_df, output)
+            elif self.format == "json":
+                self._write_json(result_df, output)
+            elif self.format == "jsonl":
+                self._write_jsonl(result_df, output)
+            else:
+                self._write_table(result_df, output)
 
         if self.format not in consts.FORMAT_TYPES:
             error_msg = (
                 f"format [{self.format}] not supported, results printed in default(table) mode. "
-                f"Supported formats are [text, csv, json, table]"
+                f"Supported formats are [{', '.join(consts.FORMAT_TYPES)}]"
             )
             raise ValueError(error_msg)
 
         return result_df
 
+    def _write_text(self, result_df, output):
+        if result_df.empty:
+            output.write(result_df.to_string(index=False) + "\n")
+            return
+        # Pad later chunks to the column widths of the first chunk, so the
+        # columns line up without formatting the whole report at once.
+        col_space = None
+        for chunk in _chunks(result_df, self.chunk_size):
+            if col_space is None:
+                col_space = {
+                    name: max(
+                        len(line)
+                        for line in chunk[[name]].to_string(index=False).splitlines()
+                    )
+                    for name in chunk.columns
+                }
+                text = chunk.to_string(index=False, col_space=col_space)
+            else:
+                text = chunk.to_string(index=False, header=False, col_space=col_space)
+            output.write(text + "\n")
+
+    def _write_csv(self, result_df, output):
+        header = True
+        for chunk in _chunks(result_df, self.chunk_size):
+            chunk.to_csv(output, index=False, header=header)
+            header = False
+        if header:
+            result_df.to_csv(output, index=False)
+
+    def _write_json(self, result_df, output):
+        # Each chunk is a JSON object keyed by index, so the chunks are joined
+        # into a single object without their braces.
+        output.write("{")
+        separator = ""
+        for chunk in _chunks(result_df, self.chunk_size):
+            output.write(separator + chunk.to_json(orient="index")[1:-1])
+            separator = ","
+        output.write("}\n")
+
+    def _write_jsonl(self, result_df, output):
+        for chunk in _chunks(result_df, self.chunk_size):
+            output.write(chunk.to_json(orient="records", lines=True).rstrip("\n"))
+            output.write("\n")
+
+    def _write_table(self, result_df, output):
+        shown_df = result_df
+        if self.max_rows is not None and len(result_df) > self.max_rows:
+            shown_df = result_df.head(self.max_rows)
+        output.write(
+            shown_df.drop(self.cols_filter_list, axis=1, errors="ignore").to_markdown(
+                tablefmt="fancy_grid", index=False
+            )
+            + "\n"
+        )
+        if len(shown_df) < len(result_df):
+            output.write(
+                f"Showing {len(shown_df)} of {len(result_df)} rows, "
+                "use the csv, jsonl or text format to output every row.\n"
+            )
+
     def execute(self, config, result_df):
         self.print_formatted_(result_df)
         return result_df
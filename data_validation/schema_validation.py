@@ -13,58 +13,43 @@
 # limitations under the License.
 
 import datetime
+import numpy
 import pandas
 
 from data_validation import metadata, consts, clients
 
+RESULT_COLUMNS = [
+    "source_column_name",
+    "target_column_name",
+    "source_agg_value",
+    "target_agg_value",
+    "validation_status",
+    "error_result.details",
+]
+
 
 class SchemaValidation(object):
-    def __init__(self, config_manager, run_metadata=None, verbose=False):
+    def __init__(self, config_manager, run_metadata=None, verbose=False, results=None):
         """Initialize a SchemaValidation client
 
         Args:
             config_manager (ConfigManager): The ConfigManager for the validation.
             run_metadata (RunMetadata): The RunMetadata for the validation.
             verbose (bool): If verbose, the Data Validation client will print the queries run
+            results (DataFrame): Optional comparison of the schemas, eg. from a
+                BulkSchemaValidation, used instead of reading the schemas.
         """
         self.verbose = verbose
         self.config_manager = config_manager
         self.run_metadata = run_metadata or metadata.RunMetadata()
+        self.results = results
 
     def execute(self):
         """Performs a validation between source and a target schema"""
-        ibis_source_schema = clients.get_ibis_table_schema(
-            self.config_manager.source_client,
-            self.config_manager.source_schema,
-            self.config_manager.source_table,
-        )
-        ibis_target_schema = clients.get_ibis_table_schema(
-            self.config_manager.target_client,
-            self.config_manager.target_schema,
-            self.config_manager.target_table,
-        )
-
-        source_fields = {}
-        for field_name, data_type in ibis_source_schema.items():
-            source_fields[field_name] = data_type
-        target_fields = {}
-        for field_name, data_type in ibis_target_schema.items():
-            target_fields[field_name] = data_type
-
-        results = schema_validation_matching(
-            source_fields, target_fields, self.config_manager.exclusion_columns
-        )
-        df = pandas.DataFrame(
-            results,
-            columns=[
-                "source_column_name",
-                "target_column_name",
-                "source_agg_value",
-                "target_agg_value",
-                "validation_status",
-                "error_result.details",
-            ],
-        )
+        if self.results is None:
+            df = self._compare_schemas()
+        else:
+            df = self.results[RESULT_COLUMNS].reset_index(drop=True)
 
         # Update and Assign Metadata Values
         self.run_metadata.end_time = datetime.datetime.now(datetime.timezone.utc)
@@ -105,6 +90,33 @@ class SchemaValidation(object):
 
         return df
 
+    def _compare_schemas(self):
+        """Return the comparison of the source and target schemas."""
+        with self.run_metadata.span("source_query"):
+            ibis_source_schema = clients.get_ibis_table_schema(
+                self.config_manager.source_client,
+                self.config_manager.source_schema,
+                self.config_manager.source_table,
+            )
+        with self.run_metadata.span("target_query"):
+            ibis_target_schema = clients.get_ibis_table_schema(
+                self.config_manager.target_client,
+                self.config_manager.target_schema,
+                self.config_manager.target_table,
+            )
+
+        source_fields = {}
+        for field_name, data_type in ibis_source_schema.items():
+            source_fields[field_name] = data_type
+        target_fields = {}
+        for field_name, data_type in ibis_target_schema.items():
+            target_fields[field_name] = data_type
+
+        results = schema_validation_matching(
+            source_fields, target_fields, self.config_manager.exclusion_columns
+        )
+        return pandas.DataFrame(results, columns=RESULT_COLUMNS)
+
 
 def schema_validation_matching(source_fields, target_fields, exclusion_fields):
     """Compare schemas between two dictionary objects"""
@@ -184,3 +196,163 @@ def schema_validation_matching(source_fields, target_fields, exclusion_fields):
                 ]
             )
     return results
+
+
+class BulkSchemaValidation(object):
+    def __init__(self, config_managers, run_metadata=None, verbose=False):
+        """Initialize a schema validation of many tables
+
+        The schemas of all tables are read with one catalog query per side,
+        where the client supports it, and compared at once.
+
+        Args:
+            config_managers (list[ConfigManager]): Schema validations, which
+                share their source and target clients.
+            run_metadata (RunMetadata): The RunMetadata for the queries.
+            verbose (bool): If verbose, the Data Validation client will print the queries run
+        """
+        self.verbose = verbose
+        self.config_managers = list(config_managers)
+        self.run_metadata = run_metadata or metadata.RunMetadata()
+
+    def execute(self):
+        """Return a list of the comparison of each validation's schemas.
+
+        Each comparison is the same as SchemaValidation compares for the
+        validation, to pass to it as results.
+        """
+        if not self.config_managers:
+            return []
+        source_client = self.config_managers[0].source_client
+        target_client = self.config_managers[0].target_client
+        source_tables = [
+            (config_manager.source_schema, config_manager.source_table)
+            for config_manager in self.config_managers
+        ]
+        target_tables = [
+            (config_manager.target_schema, config_manager.target_table)
+            for config_manager in self.config_managers
+        ]
+        with self.run_metadata.span("source_query"):
+            source_schemas = clients.get_ibis_table_schemas(
+                source_client, source_tables
+            )
+        with self.run_metadata.span("target_query"):
+            target_schemas = clients.get_ibis_table_schemas(
+                target_client, target_tables
+            )
+
+        exclusion_columns = [
+            config_manager.exclusion_columns for config_manager in self.config_managers
+        ]
+        results = schema_validation_frame(
+            _get_fields_frame(
+                [source_schemas[table] for table in source_tables], exclusion_columns
+            ),
+            _get_fields_frame(
+                [target_schemas[table] for table in target_tables], exclusion_columns
+            ),
+        )
+        validation_results = dict(
+            tuple(results.groupby("validation", sort=False)[RESULT_COLUMNS])
+        )
+        empty = pandas.DataFrame(columns=RESULT_COLUMNS)
+        return [
+            validation_results.get(index, empty)
+            for index in range(len(self.config_managers))
+        ]
+
+
+def _get_fields_frame(ibis_schemas, exclusion_columns):
+    """Return a frame of the fields of each validation's schema.
+
+    As in schema_validation_matching, field names are casefolded, a name
+    keeps the position of its first field and the type of its last, and
+    excluded names are dropped.
+    """
+    fields = pandas.DataFrame(
+        [
+            (validation, position, field_name.casefold(), data_type)
+            for validation, ibis_schema in enumerate(ibis_schemas)
+            for position, (field_name, data_type) in enumerate(ibis_schema.items())
+        ],
+        columns=["validation", "position", "field_name", "data_type"],
+    )
+    fields = fields.groupby(
+        ["validation", "field_name"], as_index=False, sort=False
+    ).agg(position=("position", "first"), data_type=("data_type", "last"))
+
+    excluded = pandas.DataFrame(
+        [
+            (validation, field_name)
+            for validation, field_names in enumerate(exclusion_columns)
+            for field_name in field_names or []
+        ],
+        columns=["validation", "field_name"],
+    )
+    if excluded.empty:
+        return fields
+    fields = fields.merge(excluded, how="left", indicator=True)
+    return fields[fields["_merge"] == "left_only"].drop(columns="_merge")
+
+
+def schema_validation_frame(source_fields, target_fields):
+    """Compare the fields of many validations' schemas at once.
+
+    Fields are frames of validation, position, field_name and data_type. The
+    result has the validation and the RESULT_COLUMNS of each field, in the
+    order of schema_validation_matching: source fields, then fields only
+    in the target.
+    """
+    fields = source_fields.merge(
+        target_fields,
+        on=["validation", "field_name"],
+        how="outer",
+        suffixes=("_source", "_target"),
+        indicator=True,
+    )
+    in_source = fields["_merge"] != "right_only"
+    in_target = fields["_merge"] != "left_only"
+    both = (in_source & in_target).to_numpy()
+
+    source_types = fields["data_type_source"].astype(str)
+    target_types = fields["data_type_target"].astype(str)
+    types_match = numpy.zeros(len(fields), dtype=bool)
+    types_match[both] = (
+        fields["data_type_source"].to_numpy()[both]
+        == fields["data_type_target"].to_numpy()[both]
+    )
+    type_details = "Source_type:" + source_types + " Target_type:" + target_types
+
+    results = pandas.DataFrame(
+        {
+            "validation": fields["validation"],
+            "source_column_name": fields["field_name"].where(in_source, "N/A"),
+            "target_column_name": fields["field_name"].where(in_target, "N/A"),
+            "source_agg_value": numpy.where(in_source, "1", "0"),
+            "target_agg_value": numpy.where(in_target, "1", "0"),
+            "validation_status": numpy.where(
+                types_match,
+                consts.VALIDATION_STATUS_SUCCESS,
+                consts.VALIDATION_STATUS_FAIL,
+            ),
+            "error_result.details": numpy.select(
+                [types_match, both, in_source],
+                [
+                    type_details,
+                    "Data type mismatch between source and target. " + type_details,
+                    "Target doesn't have a matching field name",
+                ],
+                "Source doesn't have a matching field name",
+            ),
+            "target_only": ~in_source,
+            "position": fields["position_source"].where(
+                in_source, fields["position_target"]
+            ),
+        }
+    )
+    return (
+        results.sort_values(["validation", "target_only", "position"], kind="stable")
+        .drop(columns=["target_only", "position"])
+        .reset_index(drop=True)
+    )
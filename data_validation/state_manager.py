@@ -15,25 +15,136 @@
 
 The majority of this work is file system management of connections
 and validation files.
+
+Files on GCS are cached in memory and on disk. Cached files are revalidated
+with a download conditional on the object's generation, which returns no
+content when the file is unchanged, and files read within
+CACHE_MAX_AGE_SECONDS by the same process are not revalidated at all.
 """
 
+import concurrent.futures
+import dataclasses
 import enum
+import hashlib
 import json
 import os
 import logging
+import threading
+import time
+from google.api_core import exceptions
 from google.cloud import storage
-from typing import Dict, List
+from typing import Dict, List, Optional
 from yaml import dump, load, Dumper, Loader
 
 from data_validation import client_info
 from data_validation import consts
 
+CACHE_MAX_AGE_SECONDS = 30
+MAX_FETCH_WORKERS = 8
+
+_storage_client = None
+_storage_client_lock = threading.Lock()
+
+
+def _get_storage_client():
+    """Return the GCS client of the process, created on first use."""
+    global _storage_client
+    with _storage_client_lock:
+        if _storage_client is None:
+            info = client_info.get_http_client_info()
+            _storage_client = storage.Client(client_info=info)
+        return _storage_client
+
 
 class FileSystem(enum.Enum):
     LOCAL = 1
     GCS = 2
 
 
+@dataclasses.dataclass
+class CachedFile(object):
+    content: bytes
+    generation: int
+    # time.monotonic() of the last download or revalidation, None if read from disk.
+    validated_time: Optional[float] = None
+
+
+class GCSFileCache(object):
+    """Cache of GCS files in memory, shared by the process, and on disk.
+
+    Connection files may hold credentials, so files on disk are only
+    readable by the user.
+
+    Args:
+        directory (String): Directory of the on disk cache, or None to only
+            cache files in memory.
+    """
+
+    _memory = {}
+    _memory_lock = threading.Lock()
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.expanduser(directory) if directory else None
+
+    def get(self, path: str) -> Optional[CachedFile]:
+        with self._memory_lock:
+            cached = self._memory.get(path)
+        if cached is None and self.directory:
+            cached = self._read_disk(path)
+        return cached
+
+    def put(self, path: str, content: bytes, generation: int):
+        cached = CachedFile(content, generation, time.monotonic())
+        with self._memory_lock:
+            self._memory[path] = cached
+        if self.directory:
+            self._write_disk(path, cached)
+
+    def revalidated(self, path: str, cached: CachedFile):
+        """Record that the cached file is still current."""
+        cached.validated_time = time.monotonic()
+        with self._memory_lock:
+            self._memory[path] = cached
+
+    @classmethod
+    def clear_memory(cls):
+        with cls._memory_lock:
+            cls._memory.clear()
+
+    def _disk_paths(self, path: str):
+        key = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base, base + ".generation"
+
+    def _read_disk(self, path: str) -> Optional[CachedFile]:
+        content_path, generation_path = self._disk_paths(path)
+        try:
+            with open(generation_path) as generation_file:
+                generation = int(generation_file.read())
+            with open(content_path, "rb") as content_file:
+                return CachedFile(content_file.read(), generation)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, path: str, cached: CachedFile):
+        content_path, generation_path = self._disk_paths(path)
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            # The generation is written last, so a partly written file is
+            # never read with the generation of a complete one.
+            if os.path.exists(generation_path):
+                os.remove(generation_path)
+            for file_path, data in (
+                (content_path, cached.content),
+                (generation_path, str(cached.generation).encode("utf-8")),
+            ):
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "wb") as cache_file:
+                    cache_file.write(data)
+        except OSError as e:
+            logging.warning("Unable to cache %s on disk: %s", path, e)
+
+
 class StateManager(object):
     def __init__(self, file_system_root_path: str = None, verbose: bool = False):
         """Initialize a StateManager which handles configuration
@@ -51,6 +162,7 @@ class StateManager(object):
         self.file_system_root_path = os.path.expanduser(raw_dir_path)
         self.file_system = self._get_file_system()
         self.verbose = verbose
+        self._gcs_bucket = None
         self.setup()
 
     def create_connection(self, name: str, config: Dict[str, str]):
@@ -76,6 +188,16 @@ class StateManager(object):
 
         return json.loads(conn_str)
 
+    def get_connection_configs(self, names: List[str]) -> Dict[str, Dict[str, str]]:
+        """Get the configurations of several connections, fetched concurrently.
+
+        Args:
+            names: The names of the connections.
+        Returns:
+            A dict of the connection values of each name.
+        """
+        return self._map_files(self.get_connection_config, names)
+
     def list_connections(self) -> List[str]:
         """Returns a list of the connection names that exist."""
         file_names = self._list_directory(self._get_connections_directory())
@@ -125,6 +247,25 @@ class StateManager(object):
         validation_bytes = self._read_file(validation_path)
         return load(validation_bytes, Loader=Loader)
 
+    def get_validation_configs(self, names: List[str]) -> Dict[str, Dict[str, str]]:
+        """Get several validation configurations, fetched concurrently.
+
+        Args:
+            names: The names of the validations.
+        Returns:
+            A dict of the validation values of each name.
+        """
+        return self._map_files(self.get_validation_config, names)
+
+    def _map_files(self, get_config, names: List[str]) -> Dict[str, Dict[str, str]]:
+        unique_names = list(dict.fromkeys(names))
+        if self.file_system != FileSystem.GCS or len(unique_names) < 2:
+            return {name: get_config(name) for name in unique_names}
+
+        workers = min(len(unique_names), MAX_FETCH_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique_names, executor.map(get_config, unique_names)))
+
     def list_validations(self):
         file_names = self._list_directory(self._get_validations_directory())
         return [
@@ -184,14 +325,26 @@ class StateManager(object):
 
     # GCS File Management Section
     def setup_gcs(self):
-        info = client_info.get_http_client_info()
-        self.storage_client = storage.Client(client_info=info)
-        try:
-            self.gcs_bucket = self._get_gcs_bucket()
-        except ValueError as e:
-            raise ValueError(
-                "GCS Path Failure {} -> {}".format(self.file_system_root_path, e)
-            )
+        """Set up the GCS file cache. The GCS client is created on first use."""
+        cache_directory = os.environ.get(
+            consts.ENV_CACHE_DIRECTORY_VAR, consts.DEFAULT_CACHE_DIRECTORY
+        )
+        self.file_cache = GCSFileCache(cache_directory or None)
+
+    @property
+    def storage_client(self):
+        return _get_storage_client()
+
+    @property
+    def gcs_bucket(self):
+        if self._gcs_bucket is None:
+            try:
+                self._gcs_bucket = self._get_gcs_bucket()
+            except ValueError as e:
+                raise ValueError(
+                    "GCS Path Failure {} -> {}".format(self.file_system_root_path, e)
+                )
+        return self._gcs_bucket
 
     def _get_gcs_bucket(self):
         bucket_name = self.file_system_root_path[5:].split("/")[0]
@@ -200,22 +353,44 @@ class StateManager(object):
     def _get_gcs_file_path(self, gcs_file_path: str):
         return str.join("", gcs_file_path[5:].split("/", 1)[1:])
 
-    def _read_gcs_file(self, file_path: str) -> str:
+    def _read_gcs_file(self, file_path: str) -> bytes:
+        cached = self.file_cache.get(file_path)
+        if (
+            cached is not None
+            and cached.validated_time is not None
+            and time.monotonic() - cached.validated_time < CACHE_MAX_AGE_SECONDS
+        ):
+            return cached.content
+
         gcs_file_path = self._get_gcs_file_path(file_path)
-        blob = self.gcs_bucket.get_blob(gcs_file_path)
+        blob = self.gcs_bucket.blob(gcs_file_path)
+        try:
+            content = blob.download_as_bytes(
+                if_generation_not_match=cached.generation if cached else None
+            )
+        except exceptions.NotModified:
+            self.file_cache.revalidated(file_path, cached)
+            return cached.content
 
-        return blob.download_as_bytes()
+        self.file_cache.put(file_path, content, blob.generation)
+        return content
 
     def _write_gcs_file(self, file_path: str, data: str):
         gcs_file_path = self._get_gcs_file_path(file_path)
         blob = self.gcs_bucket.blob(gcs_file_path)
         blob.upload_from_string(data)
+        self.file_cache.put(file_path, data.encode("utf-8"), blob.generation)
 
     def _list_gcs_directory(self, directory_path: str) -> List[str]:
         gcs_prefix = self._get_gcs_file_path(directory_path)
         blobs = [
             f.name.replace(gcs_prefix, "")
-            for f in self.gcs_bucket.list_blobs(prefix=gcs_prefix, delimiter="/")
+            for f in self.gcs_bucket.list_blobs(
+                prefix=gcs_prefix,
+                delimiter="/",
+                # Only file names are needed, not the rest of their metadata.
+                fields="items(name),prefixes,nextPageToken",
+            )
             if f.name.replace(gcs_prefix, "")
         ]
 
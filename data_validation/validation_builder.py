@@ -280,6 +280,23 @@ class ValidationBuilder(object):
                 filter_field[consts.CONFIG_FILTER_TARGET_COLUMN],
                 filter_field[consts.CONFIG_FILTER_TARGET_VALUE],
             )
+        elif filter_field[consts.CONFIG_TYPE] == consts.FILTER_TYPE_RANGE:
+            # Values are (lower, upper) bounds, see FilterField.in_range
+            source_filter = FilterField.in_range(
+                filter_field[consts.CONFIG_FILTER_SOURCE_COLUMN],
+                *filter_field[consts.CONFIG_FILTER_SOURCE_VALUE],
+            )
+            target_filter = FilterField.in_range(
+                filter_field[consts.CONFIG_FILTER_TARGET_COLUMN],
+                *filter_field[consts.CONFIG_FILTER_TARGET_VALUE],
+            )
+        elif filter_field[consts.CONFIG_TYPE] == consts.FILTER_TYPE_ISNULL:
+            source_filter = FilterField.is_null(
+                filter_field[consts.CONFIG_FILTER_SOURCE_COLUMN]
+            )
+            target_filter = FilterField.is_null(
+                filter_field[consts.CONFIG_FILTER_TARGET_COLUMN]
+            )
 
         # TODO(issues/40): Add metadata around filters
         self.source_builder.add_filter_field(source_filter)
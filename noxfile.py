@@ -33,7 +33,14 @@ DEFAULT_PYTHON_VERSION = "3.9"
 # Python versions used for testing.
 PYTHON_VERSIONS = ["3.7", "3.8", "3.9"]
 
-BLACK_PATHS = ("data_validation", "samples", "tests", "noxfile.py", "setup.py")
+BLACK_PATHS = (
+    "benchmarks",
+    "data_validation",
+    "samples",
+    "tests",
+    "noxfile.py",
+    "setup.py",
+)
 LINT_PACKAGES = ["flake8", "black==22.3.0"]
 
 
@@ -99,6 +106,7 @@ def lint(session):
     session.install("--upgrade", "pip", "wheel")
     session.run("flake8", "data_validation")
     session.run("flake8", "tests")
+    session.run("flake8", "benchmarks")
     session.run("black", "--check", *BLACK_PATHS)
     session.run("python", "setup.py", "check", "--strict")
 
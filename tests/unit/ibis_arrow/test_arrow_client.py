@@ -0,0 +1,189 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import ibis
+import pandas
+import pyarrow
+import pyarrow.feather
+import pyarrow.parquet
+import pytest
+
+from data_validation import consts
+
+DF = pandas.DataFrame(
+    {
+        "id": range(100),
+        "int_value": [i % 7 for i in range(100)],
+        "text_value": ["abcd"[i % 4] for i in range(100)],
+    }
+)
+
+COLUMN_CONFIG = {
+    consts.CONFIG_TYPE: consts.COLUMN_VALIDATION,
+    "schema_name": None,
+    "table_name": "my_table",
+    "target_schema_name": None,
+    "target_table_name": "my_table",
+    consts.CONFIG_AGGREGATES: [
+        {
+            consts.CONFIG_SOURCE_COLUMN: None,
+            consts.CONFIG_TARGET_COLUMN: None,
+            consts.CONFIG_FIELD_ALIAS: "count",
+            consts.CONFIG_TYPE: "count",
+        },
+        {
+            consts.CONFIG_SOURCE_COLUMN: "int_value",
+            consts.CONFIG_TARGET_COLUMN: "int_value",
+            consts.CONFIG_FIELD_ALIAS: "sum__int_value",
+            consts.CONFIG_TYPE: "sum",
+        },
+    ],
+    consts.CONFIG_RESULT_HANDLER: None,
+    consts.CONFIG_FORMAT: "table",
+}
+
+
+@pytest.fixture
+def module_under_test():
+    from third_party.ibis.ibis_arrow import client
+
+    return client
+
+
+def _write_parquet(path, df=DF, row_group_size=10):
+    pyarrow.parquet.write_table(
+        pyarrow.Table.from_pandas(df), str(path), row_group_size=row_group_size
+    )
+
+
+def test_table_schema_excludes_pandas_index(module_under_test, tmp_path):
+    _write_parquet(tmp_path / "data.parquet", DF.set_index("id"))
+    client = module_under_test.ArrowFileClient(
+        "my_table", str(tmp_path / "data.parquet")
+    )
+
+    assert list(client.table("my_table").schema().names) == [
+        "int_value",
+        "text_value",
+    ]
+
+
+def test_table_schema_from_arrow_schema(module_under_test, tmp_path):
+    table = pyarrow.table(
+        {
+            "id": pyarrow.array([1, 2], pyarrow.int32()),
+            "note": pyarrow.array([None, None], pyarrow.string()),
+            "amount": pyarrow.array([None, None], pyarrow.decimal128(10, 2)),
+            "code": pyarrow.array(["a", "b"]).dictionary_encode(),
+        }
+    )
+    pyarrow.parquet.write_table(table, str(tmp_path / "data.parquet"))
+    client = module_under_test.ArrowFileClient(
+        "my_table", str(tmp_path / "data.parquet")
+    )
+
+    schema = client.table("my_table").schema()
+
+    # Types of null columns are not lost, as they would be inferring from rows.
+    assert schema["id"] == ibis.expr.datatypes.int32
+    assert schema["note"] == ibis.expr.datatypes.string
+    assert schema["amount"] == ibis.expr.datatypes.Decimal(10, 2)
+    assert schema["code"] == ibis.expr.datatypes.category
+
+
+def test_not_equals_keeps_null_rows(module_under_test, tmp_path):
+    df = pandas.DataFrame({"id": [1, 2, 3], "code": ["a", None, "b"]})
+    _write_parquet(tmp_path / "data.parquet", df)
+    client = module_under_test.ArrowFileClient(
+        "my_table", str(tmp_path / "data.parquet")
+    )
+    table = client.table("my_table")
+    expr = table[table.code != "a"]
+
+    assert module_under_test.plan_scans(expr, module_under_test.ArrowFileTable)[
+        "my_table"
+    ] == (None, None)
+    assert expr.execute().id.tolist() == df[df.code != "a"].id.tolist()
+
+
+def test_execute_reads_only_used_columns(module_under_test, tmp_path):
+    _write_parquet(tmp_path / "data.parquet")
+    client = module_under_test.ArrowFileClient(
+        "my_table", str(tmp_path / "data.parquet")
+    )
+    table = client.table("my_table")
+    expr = table[table.id >= 90].int_value.sum()
+
+    with mock.patch.object(client, "read_table", wraps=client.read_table) as read_table:
+        assert expr.execute() == DF[DF.id >= 90].int_value.sum()
+
+    _, kwargs = read_table.call_args
+    assert kwargs["columns"] == ["id", "int_value"]
+    assert str(kwargs["filter"]) == "(id >= 90)"
+
+
+def test_filter_not_pushed_when_table_also_read_unfiltered(module_under_test):
+    table = ibis.table([("id", "int64"), ("x", "int64")], name="t")
+    expr = table[table.id > 1].x.sum() + table.x.sum()
+
+    scans = module_under_test.plan_scans(expr, type(table.op()))
+    assert scans["t"] == (["id", "x"], None)
+
+
+def test_glob_reads_partitioned_directory(module_under_test, tmp_path):
+    for part in range(4):
+        (tmp_path / f"part={part}").mkdir()
+        _write_parquet(
+            tmp_path / f"part={part}" / "data.parquet", DF[DF.id % 4 == part]
+        )
+    client = module_under_test.ArrowFileClient(
+        "my_table", str(tmp_path / "part=*" / "*.parquet")
+    )
+
+    assert client.table("my_table").count().execute() == len(DF)
+
+
+def test_feather_file(module_under_test, tmp_path):
+    pyarrow.feather.write_feather(DF, str(tmp_path / "data.feather"))
+    client = module_under_test.ArrowFileClient(
+        "my_table", str(tmp_path / "data.feather"), file_type="feather"
+    )
+
+    result = client.table("my_table").text_value.nunique().execute()
+    assert result == 4
+
+
+def test_column_validation_on_parquet(tmp_path):
+    from data_validation.data_validation import DataValidation
+
+    _write_parquet(tmp_path / "source.parquet")
+    _write_parquet(tmp_path / "target.parquet")
+    config = dict(COLUMN_CONFIG)
+    for side in ("source", "target"):
+        config[f"{side}_conn"] = {
+            "source_type": "FileSystem",
+            "table_name": "my_table",
+            "file_path": str(tmp_path / f"{side}.parquet"),
+            "file_type": "parquet",
+        }
+
+    result_df = DataValidation(config).execute().sort_values("validation_name")
+
+    assert result_df.source_agg_value.astype(float).tolist() == [
+        len(DF),
+        DF.int_value.sum(),
+    ]
+    assert (result_df.validation_status == consts.VALIDATION_STATUS_SUCCESS).all()
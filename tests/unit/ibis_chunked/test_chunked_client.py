@@ -0,0 +1,233 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import ibis
+import pandas
+import pytest
+
+from data_validation import consts
+
+DF = pandas.DataFrame(
+    {
+        "id": range(100),
+        "int_value": [i % 7 for i in range(100)],
+        "text_value": ["abcd"[i % 4] for i in range(100)],
+    }
+)
+
+COLUMN_CONFIG = {
+    consts.CONFIG_TYPE: consts.COLUMN_VALIDATION,
+    "schema_name": None,
+    "table_name": "my_table",
+    "target_schema_name": None,
+    "target_table_name": "my_table",
+    consts.CONFIG_AGGREGATES: [
+        {
+            consts.CONFIG_SOURCE_COLUMN: None,
+            consts.CONFIG_TARGET_COLUMN: None,
+            consts.CONFIG_FIELD_ALIAS: "count",
+            consts.CONFIG_TYPE: "count",
+        },
+        {
+            consts.CONFIG_SOURCE_COLUMN: "int_value",
+            consts.CONFIG_TARGET_COLUMN: "int_value",
+            consts.CONFIG_FIELD_ALIAS: "sum__int_value",
+            consts.CONFIG_TYPE: "sum",
+        },
+    ],
+    consts.CONFIG_RESULT_HANDLER: None,
+    consts.CONFIG_FORMAT: "table",
+}
+
+
+@pytest.fixture
+def module_under_test():
+    from third_party.ibis.ibis_chunked import client
+
+    return client
+
+
+@pytest.fixture
+def csv_client(module_under_test, tmp_path):
+    DF.to_csv(tmp_path / "data.csv", index=False)
+    return module_under_test.ChunkedFileClient(
+        "my_table", str(tmp_path / "data.csv"), chunk_size=30
+    )
+
+
+def test_aggregates_merged_across_chunks(csv_client):
+    table = csv_client.table("my_table")
+    expr = table.aggregate(
+        [
+            table.count().name("count"),
+            table.int_value.sum().name("sum"),
+            table.id.min().name("min"),
+            table.id.max().name("max"),
+        ]
+    )
+
+    with mock.patch.object(
+        csv_client, "iter_chunks", wraps=csv_client.iter_chunks
+    ) as iter_chunks:
+        result = expr.execute()
+
+    assert iter_chunks.call_args[0][0] == ["id", "int_value"]
+    assert result.to_dict("records") == [
+        {"count": 100, "sum": DF.int_value.sum(), "min": 0, "max": 99}
+    ]
+
+
+def test_count_reads_rows_without_columns(csv_client):
+    assert csv_client.table("my_table").count().execute() == len(DF)
+
+
+def test_grouped_aggregates_merged_across_chunks(csv_client):
+    table = csv_client.table("my_table")
+    expr = table.groupby("text_value").aggregate(
+        [table.count().name("count"), table.int_value.max().name("max")]
+    )
+
+    result = expr.execute().sort_values("text_value").reset_index(drop=True)
+    expected = (
+        DF.groupby("text_value")
+        .agg(count=("id", "count"), max=("int_value", "max"))
+        .reset_index()
+    )
+    assert result.to_dict("records") == expected.to_dict("records")
+
+
+def test_scalar_reduction_merged_across_chunks(csv_client):
+    table = csv_client.table("my_table")
+
+    assert table[table.id >= 50].int_value.sum().execute() == (
+        DF[DF.id >= 50].int_value.sum()
+    )
+
+
+def test_rows_hashed_per_chunk(csv_client):
+    table = csv_client.table("my_table")
+    expr = table[table.id, table.text_value.hashbytes("sha256").name("hash")]
+
+    result = expr.execute()
+
+    assert len(result) == len(DF)
+    assert result.id.tolist() == DF.id.tolist()
+    assert result.hash[0] == (
+        "ca978112ca1bbdcafac231b39a23dc4da786eff8147c4e72b9807785afee48bb"
+    )
+
+
+def test_unsupported_expression_reads_whole_file(csv_client):
+    table = csv_client.table("my_table")
+
+    assert table.text_value.nunique().execute() == 4
+
+
+def test_set_dtypes_reads_with_other_schema(module_under_test, tmp_path):
+    (tmp_path / "data.csv").write_text("ID,code,amount\n1,007,1\n2,010,\n")
+    client = module_under_test.ChunkedFileClient(
+        "my_table", str(tmp_path / "data.csv"), chunk_size=1
+    )
+    client.set_dtypes(
+        ibis.schema([("id", "int32"), ("code", "string"), ("amount", "int64")])
+    )
+
+    schema = client.table("my_table").schema()
+    result = client.table("my_table").execute()
+
+    assert schema["code"] == ibis.expr.datatypes.string
+    assert result.code.tolist() == ["007", "010"]
+    assert result.amount.isnull().tolist() == [False, True]
+
+
+def test_column_validation_on_chunked_json(tmp_path):
+    from data_validation.data_validation import DataValidation
+
+    DF.to_json(tmp_path / "source.json", orient="records", lines=True)
+    DF.to_csv(tmp_path / "target.csv", index=False)
+    config = dict(COLUMN_CONFIG)
+    for side, file_type in (("source", "json"), ("target", "csv")):
+        config[f"{side}_conn"] = {
+            "source_type": "FileSystem",
+            "table_name": "my_table",
+            "file_path": str(tmp_path / f"{side}.{file_type}"),
+            "file_type": file_type,
+            "chunk_size": "40",
+        }
+
+    result_df = DataValidation(config).execute().sort_values("validation_name")
+
+    assert result_df.source_agg_value.astype(float).tolist() == [
+        len(DF),
+        DF.int_value.sum(),
+    ]
+    assert (result_df.validation_status == consts.VALIDATION_STATUS_SUCCESS).all()
+
+
+@pytest.mark.parametrize("file_type", ["csv", "json"])
+def test_set_dtypes_decided_for_whole_file(module_under_test, tmp_path, file_type):
+    df = pandas.DataFrame({"id": [1, 2, 3, 4], "amount": [10, 20, 30, None]})
+    if file_type == "csv":
+        df.to_csv(tmp_path / "data.csv", index=False)
+    else:
+        df.to_json(tmp_path / "data.json", orient="records", lines=True)
+    client = module_under_test.ChunkedFileClient(
+        "my_table", str(tmp_path / f"data.{file_type}"), file_type, chunk_size=2
+    )
+    client.set_dtypes(ibis.schema([("id", "int64"), ("amount", "int64")]))
+
+    table = client.table("my_table")
+    result = table[table.id, table.amount.cast("string").name("amount")].execute()
+
+    # The null in the second chunk makes the column float64 in the first too.
+    assert result.amount.tolist()[:3] == ["10.0", "20.0", "30.0"]
+    assert result.id.tolist() == [1, 2, 3, 4]
+
+
+def test_inferred_dtypes_decided_for_whole_file(module_under_test, tmp_path):
+    (tmp_path / "data.csv").write_text("id,code\n1,10\n2,20\n3,x3\n")
+    client = module_under_test.ChunkedFileClient(
+        "my_table", str(tmp_path / "data.csv"), chunk_size=2
+    )
+
+    schema = client.table("my_table").schema()
+    result = client.table("my_table").execute()
+
+    assert schema["code"] == ibis.expr.datatypes.string
+    assert result.code.tolist() == ["10", "20", "x3"]
+
+
+def test_inferred_dtypes_cached_per_file(module_under_test, tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,code\n1,10\n2,20\n")
+    clients = [
+        module_under_test.ChunkedFileClient("my_table", str(path), chunk_size=1)
+        for _ in range(3)
+    ]
+
+    with mock.patch.object(
+        module_under_test.ChunkedFileClient,
+        "_scan_dtypes",
+        autospec=True,
+        side_effect=module_under_test.ChunkedFileClient._scan_dtypes,
+    ) as scan_dtypes:
+        assert clients[0].table("my_table").execute().code.tolist() == [10, 20]
+        assert clients[1].table("my_table").execute().code.tolist() == [10, 20]
+        # A modified file is passed over again.
+        path.write_text("id,code\n1,10\n2,x20\n")
+        assert clients[2].table("my_table").execute().code.tolist() == ["10", "x20"]
+
+    assert scan_dtypes.call_count == 2
@@ -0,0 +1,166 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+from google.api_core import exceptions
+from google.cloud.spanner_v1 import TypeCode
+
+FIELDS = [
+    ("id", TypeCode.INT64),
+    ("score", TypeCode.FLOAT64),
+    ("name", TypeCode.STRING),
+]
+ROWS = [[1, 1.5, "a"], [2, None, "b"], [3, 3.5, None]]
+
+
+class FakeField(object):
+    def __init__(self, name, code):
+        self.name = name
+        self.type_ = mock.Mock(code=code)
+
+
+class FakeResultSet(object):
+    """Mimic a StreamedResultSet where fields are set once iterated."""
+
+    def __init__(self, rows, fields=FIELDS):
+        self._rows = rows
+        self._fields = fields
+        self.fields = None
+
+    def __iter__(self):
+        self.fields = [FakeField(name, code) for name, code in self._fields]
+        return iter(self._rows)
+
+
+class FakeSnapshot(object):
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute_sql(self, sql, params=None, param_types=None):
+        return FakeResultSet(self.rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+@pytest.fixture
+def module_under_test():
+    from third_party.ibis.ibis_cloud_spanner import to_pandas
+
+    return to_pandas
+
+
+def test_to_pandas_builds_typed_columns(module_under_test):
+    df = module_under_test.pandas_df.to_pandas(FakeSnapshot(ROWS), "SELECT 1", None)
+
+    assert list(df.columns) == ["id", "score", "name"]
+    assert str(df["id"].dtype) == "int64"
+    assert str(df["score"].dtype) == "float64"
+    assert df["name"].tolist() == ["a", "b", None]
+
+
+def test_to_pandas_empty_result_has_columns(module_under_test):
+    df = module_under_test.pandas_df.to_pandas(FakeSnapshot([]), "SELECT 1", None)
+
+    assert list(df.columns) == ["id", "score", "name"]
+    assert len(df) == 0
+
+
+def test_iter_batches_respects_batch_size(module_under_test):
+    batches = list(
+        module_under_test.pandas_df.iter_batches(FakeResultSet(ROWS), batch_size=2)
+    )
+
+    assert [len(df) for df in batches] == [2, 1]
+    assert str(batches[1]["id"].dtype) == "int64"
+
+
+def test_to_pandas_partitioned_reads_all_partitions(module_under_test):
+    partitions = {"p1": ROWS[:2], "p2": ROWS[2:]}
+    batch_snapshot = mock.Mock()
+    batch_snapshot.generate_query_batches.return_value = list(partitions)
+    batch_snapshot.process_query_batch.side_effect = lambda batch: FakeResultSet(
+        partitions[batch]
+    )
+    database = mock.Mock()
+    database.batch_snapshot.return_value = batch_snapshot
+
+    df = module_under_test.pandas_df.to_pandas_partitioned(
+        database, "SELECT 1", None, max_workers=2
+    )
+
+    assert sorted(df["id"].tolist()) == [1, 2, 3]
+    batch_snapshot.close.assert_called_once()
+    database.snapshot.assert_not_called()
+
+
+def test_to_pandas_partitioned_falls_back(module_under_test):
+    batch_snapshot = mock.Mock()
+    batch_snapshot.generate_query_batches.side_effect = exceptions.InvalidArgument(
+        "Query is not root partitionable"
+    )
+    database = mock.Mock()
+    database.batch_snapshot.return_value = batch_snapshot
+    database.snapshot.return_value = FakeSnapshot(ROWS)
+
+    df = module_under_test.pandas_df.to_pandas_partitioned(database, "SELECT 1", None)
+
+    assert df["id"].tolist() == [1, 2, 3]
+    batch_snapshot.close.assert_called_once()
+
+
+def _partitioned_database(partitions):
+    batch_snapshot = mock.Mock()
+    batch_snapshot.generate_query_batches.return_value = list(partitions)
+    batch_snapshot.process_query_batch.side_effect = lambda batch: (
+        partitions[batch]
+        if isinstance(partitions[batch], FakeResultSet)
+        else FakeResultSet(partitions[batch])
+    )
+    database = mock.Mock()
+    database.batch_snapshot.return_value = batch_snapshot
+    database.snapshot.return_value = FakeSnapshot(ROWS)
+    return database, batch_snapshot
+
+
+def test_iter_partitioned_batches_streams_through_bounded_queue(module_under_test):
+    partitions = {f"p{i}": ROWS for i in range(4)}
+    database, batch_snapshot = _partitioned_database(partitions)
+
+    batches = list(
+        module_under_test.pandas_df.iter_partitioned_batches(
+            database, "SELECT 1", None, max_workers=2, batch_size=1, max_queued=1
+        )
+    )
+
+    assert len(batches) == 12
+    batch_snapshot.close.assert_called_once()
+
+
+def test_iter_partitioned_batches_stops_when_closed(module_under_test):
+    partitions = {f"p{i}": ROWS for i in range(4)}
+    database, batch_snapshot = _partitioned_database(partitions)
+
+    batches = module_under_test.pandas_df.iter_partitioned_batches(
+        database, "SELECT 1", None, max_workers=2, batch_size=1, max_queued=1
+    )
+    next(batches)
+    batches.close()
+
+    batch_snapshot.close.assert_called_once()
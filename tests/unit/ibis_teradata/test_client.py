@@ -0,0 +1,92 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("teradatasql")
+
+DESCRIPTION = [("id",), ("hash__all",)]
+ROWS = [(1, "a"), (2, "b"), (3, "c")]
+
+
+class FakeCursor(object):
+    def __init__(self, rows):
+        self._rows = list(rows)
+        self.description = DESCRIPTION
+        self.sql = None
+
+    def execute(self, sql):
+        self.sql = sql
+
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+@pytest.fixture
+def module_under_test():
+    from third_party.ibis.ibis_teradata import client
+
+    return client
+
+
+def _client(module_under_test, rows, **kwargs):
+    cursor = FakeCursor(rows)
+    connection = mock.Mock()
+    connection.cursor.return_value = cursor
+    with mock.patch.object(
+        module_under_test.teradatasql, "connect", return_value=connection
+    ):
+        client = module_under_test.TeradataClient("host", "user", "pass", **kwargs)
+    return client, cursor
+
+
+def test_fastexport_query_fetches_in_chunks(module_under_test):
+    client, cursor = _client(module_under_test, ROWS, use_fastexport=True, fetch_size=2)
+    query = module_under_test.TeradataQuery(client, "SELECT id FROM t")
+
+    batches = list(query.iter_batches())
+    assert [len(df) for df in batches] == [2, 1]
+    assert cursor.sql == "{fn teradata_try_fastexport}SELECT id FROM t"
+
+
+def test_fastexport_execute_concatenates_chunks(module_under_test):
+    client, cursor = _client(
+        module_under_test,
+        ROWS,
+        use_fastexport=True,
+        use_no_lock_tables=True,
+        fetch_size=2,
+    )
+    df = module_under_test.TeradataQuery(client, "SELECT id FROM t").execute()
+
+    assert df["id"].tolist() == [1, 2, 3]
+    assert list(df.columns) == ["id", "hash__all"]
+    assert cursor.sql.endswith("LOCKING ROW FOR ACCESS SELECT id FROM t")
+
+
+def test_fastexport_empty_result_keeps_columns(module_under_test):
+    client, _ = _client(module_under_test, [], use_fastexport=True)
+    df = module_under_test.TeradataQuery(client, "SELECT id FROM t").execute()
+
+    assert list(df.columns) == ["id", "hash__all"]
+    assert len(df) == 0
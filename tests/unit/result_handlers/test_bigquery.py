@@ -15,6 +15,8 @@
 from unittest import mock
 
 from google.cloud import bigquery
+import pandas
+import pyarrow.parquet
 import pytest
 
 
@@ -34,3 +36,114 @@ def test_get_handler_for_project_sets_user_agent(module_under_test, monkeypatch)
     mock_client.assert_called_once()
     user_agent = mock_client.call_args[1]["client_info"].to_user_agent()
     assert "google-pso-tool/data-validator" in user_agent
+
+
+def _result_df(rows):
+    return pandas.DataFrame(
+        {
+            "run_id": ["run"] * rows,
+            "start_time": pandas.Timestamp("2022-01-01", tz="UTC"),
+            "num_random_rows": [None] * rows,
+            "difference": [float(i) for i in range(rows)],
+            "labels": [[("key", "value")]] * rows,
+        }
+    )
+
+
+@pytest.fixture
+def mock_client(module_under_test, monkeypatch):
+    monkeypatch.setattr(module_under_test, "TextResultHandler", mock.Mock())
+    client = mock.create_autospec(bigquery.Client)
+    client.get_table.return_value = bigquery.Table(
+        "project.dataset.results",
+        schema=[
+            bigquery.SchemaField("run_id", "STRING"),
+            bigquery.SchemaField("start_time", "TIMESTAMP"),
+            bigquery.SchemaField("num_random_rows", "INTEGER"),
+            bigquery.SchemaField("difference", "FLOAT"),
+            bigquery.SchemaField(
+                "labels",
+                "RECORD",
+                mode="REPEATED",
+                fields=[
+                    bigquery.SchemaField("key", "STRING"),
+                    bigquery.SchemaField("value", "STRING"),
+                ],
+            ),
+        ],
+    )
+    client.insert_rows_from_dataframe.return_value = [[]]
+    return client
+
+
+def test_execute_streams_rows_when_not_buffered(module_under_test, mock_client):
+    handler = module_under_test.BigQueryResultHandler(mock_client)
+
+    handler.execute(None, _result_df(3))
+
+    mock_client.insert_rows_from_dataframe.assert_called_once()
+    mock_client.load_table_from_file.assert_not_called()
+
+
+def test_buffered_results_loaded_as_parquet(module_under_test, mock_client):
+    handler = module_under_test.BigQueryResultHandler(
+        mock_client, buffered=True, flush_rows=100, streaming_threshold=10
+    )
+
+    handler.execute(None, _result_df(60))
+    mock_client.load_table_from_file.assert_not_called()
+    handler.execute(None, _result_df(60))
+
+    mock_client.load_table_from_file.assert_called_once()
+    data = mock_client.load_table_from_file.call_args[0][0]
+    job_config = mock_client.load_table_from_file.call_args[1]["job_config"]
+    loaded = pyarrow.parquet.read_table(data).to_pandas()
+    assert job_config.source_format == bigquery.SourceFormat.PARQUET
+    assert len(loaded) == 120
+    assert loaded.labels[0].tolist() == [{"key": "key", "value": "value"}]
+    mock_client.insert_rows_from_dataframe.assert_not_called()
+
+
+def test_buffered_results_flushed_after_flush_seconds(
+    module_under_test, mock_client, monkeypatch
+):
+    clock = iter([0, 10, 400])
+    monkeypatch.setattr(module_under_test.time, "monotonic", lambda: next(clock))
+    handler = module_under_test.BigQueryResultHandler(
+        mock_client, buffered=True, flush_seconds=300, streaming_threshold=1
+    )
+
+    handler.execute(None, _result_df(1))
+    mock_client.load_table_from_file.assert_not_called()
+    handler.execute(None, _result_df(1))
+
+    mock_client.load_table_from_file.assert_called_once()
+
+
+def test_small_buffered_results_streamed_on_flush(module_under_test, mock_client):
+    handler = module_under_test.BigQueryResultHandler(mock_client, buffered=True)
+
+    handler.execute(None, _result_df(3))
+    handler.execute(None, _result_df(3))
+    mock_client.insert_rows_from_dataframe.assert_not_called()
+    handler.flush()
+    handler.flush()
+
+    mock_client.insert_rows_from_dataframe.assert_called_once()
+    assert len(mock_client.insert_rows_from_dataframe.call_args[0][1]) == 6
+
+
+def test_buffered_results_loaded_as_avro(module_under_test, mock_client):
+    fastavro = pytest.importorskip("fastavro")
+    handler = module_under_test.BigQueryResultHandler(
+        mock_client, buffered=True, source_format="avro", streaming_threshold=1
+    )
+
+    handler.execute(None, _result_df(2))
+    handler.flush()
+
+    data = mock_client.load_table_from_file.call_args[0][0]
+    data.seek(0)
+    records = list(fastavro.reader(data))
+    assert records[1]["difference"] == 1.0
+    assert records[1]["labels"] == [{"key": "key", "value": "value"}]
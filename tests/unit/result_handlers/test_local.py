@@ -0,0 +1,84 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+
+import pandas
+import pyarrow.parquet
+import pytest
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation.result_handlers import local
+
+    return local
+
+
+def _result_df(run_id, statuses):
+    return pandas.DataFrame(
+        {
+            "run_id": run_id,
+            "validation_name": "count",
+            "start_time": pandas.Timestamp("2022-01-01", tz="UTC"),
+            "num_random_rows": None,
+            "difference": None,
+            "validation_status": statuses,
+            "labels": [[("team", "data")]] * len(statuses),
+        }
+    )
+
+
+def test_parquet_results_partitioned_by_run_id(module_under_test, tmp_path, capsys):
+    handler = module_under_test.ParquetResultHandler(str(tmp_path), chunk_size=2)
+
+    result_df = _result_df("run-1", ["success", "fail", "fail"])
+    assert handler.execute(None, result_df) is result_df
+    handler.execute(None, _result_df("run-2", ["success"]))
+
+    assert "Wrote 3 validation results (fail: 2, success: 1)" in capsys.readouterr().out
+    assert len(list((tmp_path / "run_id=run-1").glob("*.parquet"))) == 1
+    table = pyarrow.parquet.read_table(
+        str(tmp_path), filters=[("run_id", "=", "run-1")]
+    )
+    results = table.to_pandas()
+    assert results.validation_status.tolist() == ["success", "fail", "fail"]
+    assert results.labels[0].tolist() == [{"key": "team", "value": "data"}]
+    assert str(table.schema.field("difference").type) == "double"
+
+
+def test_sqlite_results_appended_and_indexed(module_under_test, tmp_path):
+    path = str(tmp_path / "results.db")
+    handler = module_under_test.SQLiteResultHandler(path, chunk_size=2)
+
+    handler.execute(None, _result_df("run-1", ["success", "fail", "fail"]))
+    result_df = _result_df("run-2", ["fail"])
+    result_df["primary_keys"] = "id"
+    handler.execute(None, result_df)
+
+    with sqlite3.connect(path) as connection:
+        failures = connection.execute(
+            "SELECT run_id, labels, primary_keys FROM results "
+            "WHERE validation_status = 'fail' ORDER BY run_id"
+        ).fetchall()
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM results "
+            "WHERE validation_status = 'fail'"
+        ).fetchall()
+    assert failures == [
+        ("run-1", '[{"key": "team", "value": "data"}]', None),
+        ("run-1", '[{"key": "team", "value": "data"}]', None),
+        ("run-2", '[{"key": "team", "value": "data"}]', "id"),
+    ]
+    assert "results_validation_status" in str(plan)
@@ -0,0 +1,101 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation.result_handlers import pipeline
+
+    return pipeline
+
+
+class RecordingHandler(object):
+    def __init__(self, buffered=False, fail_on=None):
+        self.buffered = buffered
+        self.fail_on = fail_on
+        self.results = []
+        self.flushed = False
+
+    def execute(self, config, result_df):
+        if result_df == self.fail_on:
+            raise ValueError(f"cannot write {result_df}")
+        self.results.append(result_df)
+        return result_df
+
+    def flush(self):
+        self.flushed = True
+
+
+def test_results_written_in_order(module_under_test):
+    first, second = RecordingHandler(), RecordingHandler(buffered=True)
+    with module_under_test.ResultPipeline(max_queue_size=2, workers=2) as pipeline:
+        for index in range(20):
+            handler = first if index % 2 else second
+            assert pipeline.handler(handler).execute(None, index) == index
+
+    assert first.results == list(range(1, 20, 2))
+    assert second.results == list(range(0, 20, 2))
+    assert second.flushed and not first.flushed
+
+
+def test_put_blocks_when_queue_is_full(module_under_test):
+    release = threading.Event()
+
+    class BlockingHandler(RecordingHandler):
+        def execute(self, config, result_df):
+            release.wait()
+            return super().execute(config, result_df)
+
+    handler = BlockingHandler()
+    pipeline = module_under_test.ResultPipeline(max_queue_size=1)
+    producer = threading.Thread(
+        target=lambda: [pipeline.put(handler, None, index) for index in range(3)]
+    )
+    producer.start()
+    producer.join(timeout=0.2)
+
+    # One result is being written and one is queued, the third must wait.
+    assert producer.is_alive()
+    release.set()
+    producer.join()
+    pipeline.close()
+    assert handler.results == [0, 1, 2]
+
+
+def test_writer_error_raised_to_producer(module_under_test):
+    handler = RecordingHandler(fail_on=1)
+    pipeline = module_under_test.ResultPipeline()
+    pipeline.put(handler, None, 0)
+    pipeline.put(handler, None, 1)
+
+    with pytest.raises(ValueError, match="cannot write 1"):
+        pipeline.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        pipeline.put(handler, None, 2)
+    assert handler.results == [0]
+
+
+def test_validation_error_not_masked_by_writer_error(module_under_test):
+    handler = RecordingHandler(fail_on=0, buffered=True)
+
+    with pytest.raises(KeyError):
+        with module_under_test.ResultPipeline() as pipeline:
+            pipeline.put(handler, None, 0)
+            raise KeyError("validation failed")
+
+    assert handler.flushed
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+
 import pytest
 
 from pandas import DataFrame
@@ -99,3 +101,63 @@ def test_columns_to_print(module_under_test, capsys):
         .replace("╘═════╧═════╛", "")
     )
     assert printed_text == grid_text
+
+
+@pytest.mark.parametrize("format", ["text", "csv", "json", "jsonl"])
+def test_chunked_output_matches_whole_output(module_under_test, capsys, format):
+    """Check chunked output contains every row once, in order"""
+    result_df = DataFrame(
+        {"A": range(25), "B": [f"value-{i}" for i in range(25)]},
+    )
+    chunked_handler = module_under_test.TextResultHandler(format, [], chunk_size=7)
+    chunked_handler.execute(SAMPLE_CONFIG, result_df)
+    chunked_text = capsys.readouterr().out
+
+    whole_handler = module_under_test.TextResultHandler(format, [], chunk_size=100)
+    whole_handler.execute(SAMPLE_CONFIG, result_df)
+    whole_text = capsys.readouterr().out
+
+    if format == "text":
+        # Later chunks are padded to the widths of the first chunk.
+        assert [line.split() for line in chunked_text.splitlines()] == [
+            line.split() for line in whole_text.splitlines()
+        ]
+    else:
+        assert chunked_text == whole_text
+    if format == "json":
+        assert list(json.loads(chunked_text)) == [str(i) for i in range(25)]
+    elif format == "jsonl":
+        lines = chunked_text.splitlines()
+        assert [json.loads(line)["A"] for line in lines] == list(range(25))
+    elif format == "csv":
+        assert chunked_text.splitlines()[0] == "A,B"
+        assert len(chunked_text.splitlines()) == 26
+
+
+def test_output_file(module_under_test, capsys, tmp_path):
+    """Check results are appended to the output file"""
+    output_file = tmp_path / "results.csv"
+    result_df = DataFrame(SAMPLE_RESULT_DATA, columns=SAMPLE_RESULT_COLUMNS)
+    result_handler = module_under_test.TextResultHandler(
+        "csv", [], output_file=str(output_file)
+    )
+
+    result_handler.execute(SAMPLE_CONFIG, result_df)
+    result_handler.execute(SAMPLE_CONFIG, result_df)
+
+    assert capsys.readouterr().out == ""
+    assert output_file.read_text() == result_df.to_csv(index=False) * 2
+
+
+def test_table_max_rows(module_under_test, capsys):
+    """Check the table format shows at most max_rows rows"""
+    result_df = DataFrame(SAMPLE_RESULT_DATA, columns=SAMPLE_RESULT_COLUMNS)
+    result_handler = module_under_test.TextResultHandler(
+        "table", SAMPLE_RESULT_COLUMNS_FILTER_LIST, max_rows=2
+    )
+    result_handler.execute(SAMPLE_CONFIG, result_df)
+
+    printed_text = capsys.readouterr().out
+    assert "│   4 │" in printed_text
+    assert "│   8 │" not in printed_text
+    assert "Showing 2 of 3 rows" in printed_text
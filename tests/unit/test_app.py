@@ -0,0 +1,191 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pandas
+import pytest
+
+from data_validation import jobs
+
+RESULT_DF = pandas.DataFrame({"validation_name": [f"v{i}" for i in range(5)]})
+
+
+class FakeJobManager(object):
+    def __init__(self, queue_full=False):
+        self.queue_full = queue_full
+        self.jobs = {}
+
+    def submit(self, config):
+        if self.queue_full:
+            raise jobs.QueueFullError("1 jobs are already queued")
+        job = jobs.Job(config)
+        self.jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        return list(self.jobs.values())
+
+    def run_batch(self, configs, workers=jobs.DEFAULT_WORKERS):
+        self.batch_workers = workers
+        for index, config in reversed(list(enumerate(configs))):
+            if config.get("fail"):
+                yield jobs.BatchResult(index, config, error="ValueError: failed")
+            else:
+                yield jobs.BatchResult(index, config, "run-id", result_df=RESULT_DF)
+
+    def cancel(self, job_id):
+        job = self.jobs.get(job_id)
+        if job:
+            job.status = jobs.STATUS_CANCELLED
+        return job
+
+
+@pytest.fixture
+def module_under_test(monkeypatch):
+    from data_validation import app
+
+    manager = FakeJobManager()
+    monkeypatch.setattr(app, "get_job_manager", lambda: manager)
+    return app
+
+
+@pytest.fixture
+def client(module_under_test):
+    return module_under_test.app.test_client()
+
+
+def _succeeded_job(module_under_test):
+    job = module_under_test.get_job_manager().submit({})
+    job.status = jobs.STATUS_SUCCEEDED
+    job.result_df = RESULT_DF
+    return job
+
+
+def test_clean_dataframe(module_under_test):
+    df = pandas.DataFrame(
+        {
+            "start_time": pandas.to_datetime(["2022-01-01 12:30:00"], utc=True),
+            "difference": [float("nan")],
+        }
+    )
+    assert json.loads(module_under_test._clean_dataframe(df)) == [
+        {"start_time": "2022-01-01T12:30:00.000000Z", "difference": None}
+    ]
+
+
+def test_submit_job(client):
+    response = client.post("/jobs", json={"type": "Column"})
+
+    assert response.status_code == 202
+    assert response.json["status"] == jobs.STATUS_QUEUED
+    assert client.get(f"/jobs/{response.json['job_id']}").json == response.json
+    assert client.get("/jobs").json == [response.json]
+
+
+def test_submit_job_invalid_config(client):
+    response = client.post("/jobs", data="[1]", content_type="application/json")
+    assert response.status_code == 400
+
+
+def test_submit_job_queue_full(module_under_test, client):
+    module_under_test.get_job_manager().queue_full = True
+    assert client.post("/jobs", json={}).status_code == 429
+
+
+def test_unknown_job(client):
+    assert client.get("/jobs/unknown").status_code == 404
+    assert client.delete("/jobs/unknown").status_code == 404
+    assert client.get("/jobs/unknown/results").status_code == 404
+
+
+def test_cancel_job(client):
+    job_id = client.post("/jobs", json={}).json["job_id"]
+
+    response = client.post(f"/jobs/{job_id}/cancel")
+
+    assert response.json["status"] == jobs.STATUS_CANCELLED
+    assert client.get(f"/jobs/{job_id}/results").status_code == 409
+
+
+def test_get_job_results_pages(module_under_test, client):
+    job = _succeeded_job(module_under_test)
+
+    first = client.get(f"/jobs/{job.job_id}/results?limit=3").json
+    second = client.get(f"/jobs/{job.job_id}/results?offset=3&limit=3").json
+
+    assert first["total_rows"] == 5
+    assert first["next_offset"] == 3
+    assert [row["validation_name"] for row in first["results"]] == ["v0", "v1", "v2"]
+    assert second["next_offset"] is None
+    assert [row["validation_name"] for row in second["results"]] == ["v3", "v4"]
+
+
+@pytest.mark.parametrize("query", ("offset=-1", "limit=0", "limit=10001", "limit=x"))
+def test_get_job_results_invalid_page(module_under_test, client, query):
+    job = _succeeded_job(module_under_test)
+    assert client.get(f"/jobs/{job.job_id}/results?{query}").status_code == 400
+
+
+BATCH_DOCUMENT = {
+    "source": {"source_type": "Example"},
+    "target": {"source_type": "Example"},
+    "result_handler": None,
+    "validations": [{"type": "Column", "table_name": "a"}, {"fail": True}],
+}
+
+
+def test_run_batch(module_under_test, client):
+    response = client.post("/batch?workers=2", json=BATCH_DOCUMENT)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert module_under_test.get_job_manager().batch_workers == 2
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [(line.get("index"), line.get("status")) for line in lines[:-1]] == [
+        (1, jobs.STATUS_FAILED),
+        (0, jobs.STATUS_SUCCEEDED),
+    ]
+    assert lines[1]["table_name"] == "a"
+    assert len(lines[1]["results"]) == 5
+    assert lines[-1] == {"done": True, "succeeded": 1, "failed": 1}
+
+
+@pytest.mark.parametrize(
+    ("query", "document"),
+    (
+        ("", {"validations": []}),
+        ("", [1]),
+        ("?workers=0", BATCH_DOCUMENT),
+        ("?workers=x", BATCH_DOCUMENT),
+    ),
+)
+def test_run_batch_invalid(client, query, document):
+    assert client.post(f"/batch{query}", json=document).status_code == 400
+
+
+def test_init_job_manager(module_under_test, monkeypatch):
+    monkeypatch.setattr(module_under_test, "_job_manager", None)
+
+    manager = module_under_test.init_job_manager(
+        workers=2, max_queued=3, batch_workers=5, max_result_bytes=1024
+    )
+    manager.shutdown()
+
+    assert (manager.workers, manager.max_queued) == (2, 3)
+    assert manager._batch_executor._max_workers == 5
+    assert manager.max_result_bytes == 1024
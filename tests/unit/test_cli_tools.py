@@ -143,6 +143,73 @@ def test_configure_arg_parser_list_and_run_validation_configs():
     assert args.validation_config_cmd == "run"
 
 
+@pytest.mark.parametrize(
+    "command",
+    (
+        ["validate", "schema", "-sc", "conn", "-tc", "conn"],
+        ["run-config", "-c", "example.yaml"],
+        ["configs", "run", "-c", "example.yaml"],
+    ),
+)
+def test_configure_arg_parser_profile(command):
+    parser = cli_tools.configure_arg_parser()
+
+    args = parser.parse_args(command)
+    assert args.profile is None
+
+    args = parser.parse_args(command + ["--profile"])
+    assert args.profile == "dvt-profiles"
+    assert args.profile_top == 10
+
+    args = parser.parse_args(command + ["--profile", "profiles", "--profile-top", "5"])
+    assert args.profile == "profiles"
+    assert args.profile_top == 5
+
+
+@pytest.mark.parametrize(
+    "command",
+    (
+        ["validate", "schema", "-sc", "conn", "-tc", "conn"],
+        ["run-config", "-c", "example.yaml"],
+        ["configs", "run", "-c", "example.yaml"],
+    ),
+)
+def test_configure_arg_parser_bulk(command):
+    parser = cli_tools.configure_arg_parser()
+
+    assert not parser.parse_args(command).bulk
+    assert parser.parse_args(command + ["--bulk"]).bulk
+
+
+@pytest.mark.parametrize(
+    "command",
+    (
+        ["run-config", "-c", "example.yaml"],
+        ["configs", "run", "-c", "example.yaml"],
+    ),
+)
+def test_configure_arg_parser_shared_scan(command):
+    parser = cli_tools.configure_arg_parser()
+
+    assert not parser.parse_args(command).shared_scan
+    assert parser.parse_args(command + ["--shared-scan"]).shared_scan
+
+
+@pytest.mark.parametrize(
+    "command",
+    (
+        ["validate", "column", "-sc", "conn", "-tc", "conn"],
+        ["run-config", "-c", "example.yaml"],
+        ["configs", "run", "-c", "example.yaml"],
+    ),
+)
+def test_configure_arg_parser_union_batch_size(command):
+    parser = cli_tools.configure_arg_parser()
+
+    assert parser.parse_args(command).union_batch_size is None
+    assert parser.parse_args(command + ["-ubs", "50"]).union_batch_size == 50
+
+
 def test_create_and_list_and_get_validations(caplog, fs):
 
     caplog.set_level(logging.INFO)
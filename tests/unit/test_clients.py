@@ -64,6 +64,29 @@ def test_get_all_tables():
     assert all_tables == TABLES_RESULT
 
 
+def test_get_all_tables_lists_schemas_concurrently():
+    """Tables keep the order of their schemas, schemas which fail are skipped."""
+    client = mock.Mock(spec=["list_databases", "list_tables"])
+    client.list_databases.return_value = ["first", "failing", "second", "skipped"]
+
+    def list_tables(database):
+        if database == "failing":
+            raise ValueError("No access")
+        return [f"{database}_a", f"{database}_b"]
+
+    client.list_tables.side_effect = list_tables
+    all_tables = clients.get_all_tables(
+        client, allowed_schemas=["first", "failing", "second"], max_workers=3
+    )
+
+    assert all_tables == [
+        ("first", "first_a"),
+        ("first", "first_b"),
+        ("second", "second_a"),
+        ("second", "second_b"),
+    ]
+
+
 def test_get_bigquery_client_sets_user_agent():
     mock_credentials = mock.create_autospec(credentials.Credentials)
     ibis_client = clients.get_bigquery_client(
@@ -73,6 +96,83 @@ def test_get_bigquery_client_sets_user_agent():
     assert "google-pso-tool/data-validator" in user_agent
 
 
+def test_get_bigquery_client_uses_storage_api():
+    mock_credentials = mock.create_autospec(credentials.Credentials)
+    ibis_client = clients.get_bigquery_client(
+        "test-project", dataset_id="some_dataset", credentials=mock_credentials
+    )
+    assert ibis_client.query_class is clients.BigQueryStorageQuery
+    assert ibis_client.bqstorage_client is not None
+
+
+def test_get_bigquery_client_without_storage_api():
+    mock_credentials = mock.create_autospec(credentials.Credentials)
+    ibis_client = clients.get_bigquery_client(
+        "test-project",
+        dataset_id="some_dataset",
+        credentials=mock_credentials,
+        use_storage_api=False,
+    )
+    assert ibis_client.bqstorage_client is None
+
+
+def test_bigquery_storage_query_fetch_passes_storage_client():
+    ibis_client = mock.Mock(bqstorage_client=mock.sentinel.bqstorage_client)
+    query = mock.Mock(client=ibis_client)
+    query.schema.return_value.apply_to.side_effect = lambda df: df
+    cursor = mock.Mock()
+    cursor.query.to_dataframe.return_value = pandas.DataFrame(DATA)
+
+    clients.BigQueryStorageQuery._fetch(query, cursor)
+
+    cursor.query.to_dataframe.assert_called_once_with(
+        bqstorage_client=mock.sentinel.bqstorage_client,
+        create_bqstorage_client=False,
+    )
+
+
+def test_bigquery_storage_query_fetch_records_job_stats():
+    ibis_client = mock.Mock(bqstorage_client=None)
+    query = mock.Mock(client=ibis_client)
+    query.schema.return_value.apply_to.side_effect = lambda df: df
+    cursor = mock.Mock()
+    cursor.query.to_dataframe.return_value = pandas.DataFrame(DATA)
+    cursor.query.job_id = "job-1"
+    cursor.query.total_bytes_processed = 1024
+    cursor.query.slot_millis = 50
+
+    df = clients.BigQueryStorageQuery._fetch(query, cursor)
+
+    assert df.attrs["engine_stats"]["job_id"] == "job-1"
+    assert df.attrs["engine_stats"]["total_bytes_processed"] == 1024
+    assert df.attrs["engine_stats"]["slot_millis"] == 50
+
+
+def test_execute_with_stats():
+    pandas_client = _get_pandas_client()
+    table = pandas_client.table(TABLE_NAME)
+
+    df, stats = clients.execute_with_stats(pandas_client, table, "source")
+
+    assert df.to_dict("records") == DATA
+    assert stats.result_type == "source"
+    assert stats.rows == 1
+    assert stats.bytes == df.memory_usage(index=False).sum()
+    assert stats.duration >= 0
+    assert stats.engine_stats == {}
+
+
+def test_execute_with_stats_returns_engine_stats_of_results():
+    df = pandas.DataFrame(DATA)
+    df.attrs["engine_stats"] = {"query_id": "query-1"}
+    client = mock.Mock()
+    client.execute.return_value = df
+
+    _, stats = clients.execute_with_stats(client, mock.Mock(), "target")
+
+    assert stats.engine_stats == {"query_id": "query-1"}
+
+
 def test_import_oracle_client():
     with pytest.raises(ModuleNotFoundError, match=r"No module named 'cx_Oracle'"):
         from third_party.ibis.ibis_oracle.client import OracleClient  # NOQA
@@ -91,3 +191,52 @@ def test_get_pandas_data_client(fs):
     ibis_client = clients.get_data_client(conn_config)
 
     assert isinstance(ibis_client, PandasClient)
+
+
+def test_get_duckdb_data_client_queries_file(tmp_path):
+    pytest.importorskip("duckdb_engine")
+    file_path = str(tmp_path / "data.json")
+    _create_table_file(file_path, JSON_DATA)
+    conn_config = {
+        "source_type": "DuckDB",
+        "table_name": TABLE_NAME,
+        "file_path": file_path,
+    }
+    ibis_client = clients.get_data_client(conn_config)
+    table = clients.get_ibis_table(ibis_client, "main", TABLE_NAME)
+
+    assert clients.list_tables(ibis_client, "main") == [TABLE_NAME]
+    assert table.col_a.sum().execute() == 1
+
+
+def test_get_ibis_table_schemas_reads_catalog(tmp_path):
+    """Schemas read with one catalog query are the same as per table."""
+    pytest.importorskip("duckdb_engine")
+    ibis_client = clients.get_data_client(
+        {"source_type": "DuckDB", "database": str(tmp_path / "test.duckdb")}
+    )
+    ibis_client.con.execute("CREATE SCHEMA other")
+    ibis_client.con.execute(
+        "CREATE TABLE first (id INTEGER NOT NULL, Name VARCHAR, amount DECIMAL(10,2))"
+    )
+    ibis_client.con.execute("CREATE TABLE other.second (ts TIMESTAMP, ids INTEGER[])")
+    tables = [("main", "first"), (None, "first"), ("other", "second")]
+
+    with mock.patch.object(
+        clients, "get_ibis_table_schema", wraps=clients.get_ibis_table_schema
+    ) as get_ibis_table_schema:
+        schemas = clients.get_ibis_table_schemas(ibis_client, tables)
+        get_ibis_table_schema.assert_not_called()
+
+    assert schemas == {
+        table: clients.get_ibis_table_schema(ibis_client, *table) for table in tables
+    }
+
+
+def test_get_ibis_table_schemas_falls_back_per_table():
+    client = _get_pandas_client()
+    schemas = clients.get_ibis_table_schemas(client, [(None, TABLE_NAME)])
+
+    assert schemas == {
+        (None, TABLE_NAME): clients.get_ibis_table_schema(client, None, TABLE_NAME)
+    }
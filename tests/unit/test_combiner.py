@@ -930,3 +930,142 @@ def test_generate_report_with_nan_agg_value(
         .reindex(sorted(expected.columns), axis=1)
     )
     pandas.testing.assert_frame_equal(report, expected)
+
+
+ROW_RUN_METADATA = metadata.RunMetadata(
+    validations={
+        "hash__all": metadata.ValidationMetadata(
+            source_table_name="test_source",
+            source_table_schema="bq-public.source_dataset",
+            source_column_name="hash__all",
+            target_table_name="test_target",
+            target_table_schema="bq-public.target_dataset",
+            target_column_name="hash__all",
+            validation_type="Row",
+            aggregation_type=None,
+            primary_keys=["id"],
+            num_random_rows=None,
+            threshold=0.0,
+        ),
+    },
+    start_time=datetime.datetime(1998, 9, 4, 7, 30, 1),
+    end_time=datetime.datetime(1998, 9, 4, 7, 31, 42),
+    labels=[],
+    run_id="test-run",
+)
+ROW_SOURCE_DF = pandas.DataFrame({"id": [1, 2, 3, 4], "hash__all": list("abcd")})
+ROW_TARGET_DF = pandas.DataFrame({"id": [1, 2, 3, 5], "hash__all": list("abxe")})
+
+
+def _generate_row_report(module_under_test, report):
+    pandas_client = ibis.backends.pandas.connect(
+        {"test_source": ROW_SOURCE_DF, "test_target": ROW_TARGET_DF}
+    )
+    return module_under_test.generate_report(
+        pandas_client,
+        ROW_RUN_METADATA,
+        join_on_fields=("id",),
+        source=pandas_client.table("test_source"),
+        target=pandas_client.table("test_target"),
+        is_value_comparison=True,
+        report=report,
+    )
+
+
+def test_generate_report_failures(module_under_test, patch_datetime_now):
+    report = _generate_row_report(module_under_test, consts.REPORT_FAILURES)
+
+    assert sorted(report.group_by_columns) == [
+        '{"id": "3"}',
+        '{"id": "4"}',
+        '{"id": "5"}',
+    ]
+    assert (report.validation_status == consts.VALIDATION_STATUS_FAIL).all()
+
+
+def test_generate_report_summary(module_under_test, patch_datetime_now):
+    report = _generate_row_report(module_under_test, consts.REPORT_SUMMARY)
+
+    assert report[
+        [
+            "validation_name",
+            "source_table_name",
+            "primary_keys",
+            consts.ROWS_COMPARED,
+            consts.MISSING_SOURCE,
+            consts.MISSING_TARGET,
+            consts.MISMATCHED,
+            "validation_status",
+            "run_id",
+        ]
+    ].to_dict("records") == [
+        {
+            "validation_name": "hash__all",
+            "source_table_name": "bq-public.source_dataset.test_source",
+            "primary_keys": "{id}",
+            consts.ROWS_COMPARED: 5,
+            consts.MISSING_SOURCE: 1,
+            consts.MISSING_TARGET: 1,
+            consts.MISMATCHED: 1,
+            "validation_status": consts.VALIDATION_STATUS_FAIL,
+            "run_id": "test-run",
+        }
+    ]
+    optional_columns = {consts.PHASE_TIMINGS, consts.QUERY_STATS, consts.PEAK_RSS}
+    assert set(consts.COLUMN_FILTER_LIST) - optional_columns <= set(report.columns)
+
+
+def test_summarize_report_matches_summary(module_under_test, patch_datetime_now):
+    full_report = _generate_row_report(module_under_test, consts.REPORT_ALL)
+    summary = _generate_row_report(module_under_test, consts.REPORT_SUMMARY)
+
+    result = module_under_test.summarize_report(full_report, ROW_RUN_METADATA)
+
+    pandas.testing.assert_frame_equal(
+        result[summary.columns].drop(columns="labels"),
+        summary.drop(columns="labels"),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "report", [consts.REPORT_SUMMARY, consts.REPORT_ALL], ids=["summary", "summarized"]
+)
+def test_summary_of_null_values_on_both_sides(
+    module_under_test, patch_datetime_now, report
+):
+    source_df = pandas.DataFrame({"id": [1, 2], "hash__all": [None, "b"]})
+    target_df = pandas.DataFrame({"id": [1, 2], "hash__all": [None, "b"]})
+    pandas_client = ibis.backends.pandas.connect(
+        {"test_source": source_df, "test_target": target_df}
+    )
+    result = module_under_test.generate_report(
+        pandas_client,
+        ROW_RUN_METADATA,
+        join_on_fields=("id",),
+        source=pandas_client.table("test_source"),
+        target=pandas_client.table("test_target"),
+        is_value_comparison=True,
+        report=report,
+    )
+    if report == consts.REPORT_ALL:
+        assert (result.validation_status == consts.VALIDATION_STATUS_SUCCESS).all()
+        result = module_under_test.summarize_report(result, ROW_RUN_METADATA)
+
+    assert result[
+        [
+            consts.ROWS_COMPARED,
+            consts.MISSING_SOURCE,
+            consts.MISSING_TARGET,
+            consts.MISMATCHED,
+            "validation_status",
+        ]
+    ].to_dict("records") == [
+        {
+            consts.ROWS_COMPARED: 2,
+            consts.MISSING_SOURCE: 0,
+            consts.MISSING_TARGET: 0,
+            consts.MISMATCHED: 0,
+            "validation_status": consts.VALIDATION_STATUS_SUCCESS,
+        }
+    ]
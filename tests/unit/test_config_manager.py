@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+
 import pytest
 
 from data_validation import consts
@@ -330,3 +332,20 @@ def test_dependent_aliases(module_under_test):
         "location",
         "bike",
     ]
+
+
+def test_get_local_result_handler(module_under_test, tmp_path):
+    from data_validation.result_handlers.local import SQLiteResultHandler
+
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_RESULT_HANDLER] = {
+        consts.CONFIG_TYPE: "SQLite",
+        consts.RESULT_HANDLER_PATH: str(tmp_path / "results.db"),
+    }
+    config_manager = module_under_test.ConfigManager(
+        config, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+    handler = config_manager.get_result_handler()
+
+    assert isinstance(handler, SQLiteResultHandler)
+    assert handler.table_id == "results"
@@ -758,3 +758,122 @@ def test_random_row_level_validation(module_under_test, fs):
     assert result_df["difference"].sum() == 0
     assert ids != [i for i in range(10)]
     assert ids != [i for i in range(90, 100)]
+
+
+def test_phase_timings(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_DATA)
+
+    client = module_under_test.DataValidation(SAMPLE_CONFIG)
+    result_df = client.execute()
+
+    assert consts.PHASE_TIMINGS not in result_df
+    assert list(client.run_metadata.phase_durations()) == [
+        "build_validation",
+        "build_queries",
+        "source_query",
+        "target_query",
+        "pandas_conversion",
+        "combiner_build",
+        "combiner_execute",
+        "result_handler",
+    ]
+
+
+def test_phase_timings_result_column(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_DATA)
+    config = dict(SAMPLE_CONFIG, **{consts.CONFIG_RECORD_TIMINGS: True})
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+
+    timings = json.loads(result_df[consts.PHASE_TIMINGS].iloc[0])
+    assert "source_query" in timings
+    assert "combiner_execute" in timings
+    assert "result_handler" not in timings
+
+
+def test_query_stats(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_DATA)
+    config = dict(SAMPLE_CONFIG, **{consts.CONFIG_RECORD_QUERY_STATS: True})
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+
+    assert [stats.result_type for stats in client.run_metadata.query_stats] == [
+        consts.RESULT_TYPE_SOURCE,
+        consts.RESULT_TYPE_TARGET,
+    ]
+    query_stats = json.loads(result_df[consts.QUERY_STATS].iloc[0])
+    assert [stats["rows"] for stats in query_stats] == [1, 1]
+    assert all(stats["bytes"] > 0 for stats in query_stats)
+
+
+def test_row_level_validation_memory_budget(module_under_test, fs):
+    data = _generate_fake_data(rows=100, second_range=0)
+    json_data = _get_fake_json_data(data)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, json_data)
+    _create_table_file(TARGET_TABLE_FILE_PATH, json_data)
+    config = dict(SAMPLE_ROW_CONFIG, **{consts.CONFIG_MEMORY_BUDGET: "50KB"})
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+
+    source_queries = [
+        timing
+        for timing in client.run_metadata.timings
+        if timing.phase == "source_query"
+    ]
+    # Several primary key ranges plus the null primary key partition.
+    assert len(source_queries) > 2
+    assert len(result_df) == 200
+    assert sorted(
+        json.loads(key)["id"]
+        for key in result_df[result_df.validation_name == "int_value"][
+            consts.GROUP_BY_COLUMNS
+        ]
+    ) == sorted(str(i) for i in range(100))
+    assert (result_df.validation_status == consts.VALIDATION_STATUS_SUCCESS).all()
+    assert (result_df[consts.PEAK_RSS] > 0).all()
+
+
+def test_row_level_validation_memory_budget_single_key(module_under_test, fs):
+    data = _generate_fake_data(rows=1, second_range=0)
+    json_data = _get_fake_json_data(data)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, json_data)
+    _create_table_file(TARGET_TABLE_FILE_PATH, json_data)
+    config = dict(SAMPLE_ROW_CONFIG, **{consts.CONFIG_MEMORY_BUDGET: "1B"})
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+
+    source_queries = [
+        timing
+        for timing in client.run_metadata.timings
+        if timing.phase == "source_query"
+    ]
+    # The minimum and maximum primary keys are equal, so rows are not split.
+    assert len(source_queries) == 1
+    assert len(result_df) == 2
+    assert (result_df.validation_status == consts.VALIDATION_STATUS_SUCCESS).all()
+
+
+def test_row_level_validation_memory_budget_summary(module_under_test, fs):
+    data = _generate_fake_data(rows=100, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data[1:]))
+    config = dict(
+        SAMPLE_ROW_CONFIG,
+        **{consts.CONFIG_MEMORY_BUDGET: "50KB", consts.CONFIG_REPORT: "summary"},
+    )
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+
+    assert sorted(result_df.validation_name) == ["int_value", "text_value"]
+    assert result_df[consts.ROWS_COMPARED].tolist() == [100, 100]
+    assert result_df[consts.MISSING_TARGET].tolist() == [1, 1]
+    assert result_df[consts.MISMATCHED].tolist() == [0, 0]
+    assert (result_df.validation_status == consts.VALIDATION_STATUS_FAIL).all()
@@ -0,0 +1,67 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+TARGET_KEYS = ["schema.table", "schema.other_table", "schema.tables", "other.abc"]
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import jellyfish_distance
+
+    return jellyfish_distance
+
+
+def test_extract_closest_match(module_under_test):
+    match = module_under_test.extract_closest_match(
+        "schema.tabel", TARGET_KEYS, score_cutoff=0.8
+    )
+    assert match == "schema.table"
+
+
+def test_extract_closest_matches(module_under_test):
+    matches = module_under_test.extract_closest_matches(
+        ["schema.tabel", "schema.table", "unmatched", ""], TARGET_KEYS, score_cutoff=0.8
+    )
+    assert matches == ["schema.table", "schema.table", None, None]
+
+
+def test_extract_closest_matches_empty(module_under_test):
+    assert module_under_test.extract_closest_matches([], TARGET_KEYS) == []
+    assert module_under_test.extract_closest_matches(["a", "b"], []) == [None, None]
+
+
+@pytest.mark.parametrize("score_cutoff", [0, 0.5, 0.8, 0.9, 1])
+def test_extract_closest_matches_same_as_each_match(module_under_test, score_cutoff):
+    """Pruned matching returns the same matches, and tie breaks, as every pair."""
+    rng = random.Random(score_cutoff)
+
+    def random_key():
+        return "".join(rng.choice("abcd_1") for _ in range(rng.randint(0, 8)))
+
+    search_keys = [random_key() for _ in range(200)]
+    target_keys = [random_key() for _ in range(200)]
+
+    matches = module_under_test.extract_closest_matches(
+        search_keys, target_keys, score_cutoff=score_cutoff
+    )
+    assert matches == [
+        module_under_test.extract_closest_match(
+            search_key, target_keys, score_cutoff=score_cutoff
+        )
+        for search_key in search_keys
+    ]
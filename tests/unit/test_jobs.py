@@ -0,0 +1,270 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import time
+
+import pandas
+import pytest
+
+SOURCE_CONN = {"source_type": "Example", "name": "source"}
+TARGET_CONN = {"source_type": "Example", "name": "target"}
+CONFIG = {"source_conn": SOURCE_CONN, "target_conn": TARGET_CONN}
+RESULT_DF = pandas.DataFrame(
+    {
+        "validation_name": ["count", "sum"],
+        "start_time": pandas.to_datetime(["2022-01-01 00:00:00"] * 2, utc=True),
+        "difference": [0.0, None],
+    }
+)
+
+
+class FakeDataValidation(object):
+    """DataValidation which waits for the test to release it."""
+
+    release = None
+    created = []
+
+    def __init__(self, config, result_handler=None, source_client=None, **kwargs):
+        self.config = config
+        self.result_handler = result_handler
+        self.source_client = source_client
+        self.run_metadata = type("RunMetadata", (), {"run_id": "run-id"})()
+        FakeDataValidation.created.append(self)
+
+    def execute(self):
+        FakeDataValidation.release.wait(5)
+        if self.config.get("fail"):
+            raise ValueError("validation failed")
+        return self.result_handler.execute(self.config, RESULT_DF)
+
+
+@pytest.fixture
+def module_under_test(monkeypatch):
+    from data_validation import jobs
+
+    FakeDataValidation.release = threading.Event()
+    FakeDataValidation.created = []
+    monkeypatch.setattr(jobs, "DataValidation", FakeDataValidation)
+    monkeypatch.setattr(jobs.clients, "get_data_client", lambda conn: object())
+    return jobs
+
+
+def _wait(job):
+    job.future.result(timeout=5)
+
+
+def test_submit_runs_job(module_under_test):
+    manager = module_under_test.JobManager(workers=1)
+    job = manager.submit(CONFIG)
+    assert job.status in (
+        module_under_test.STATUS_QUEUED,
+        module_under_test.STATUS_RUNNING,
+    )
+
+    FakeDataValidation.release.set()
+    _wait(job)
+
+    assert manager.get(job.job_id) is job
+    assert job.status == module_under_test.STATUS_SUCCEEDED
+    assert job.run_id == "run-id"
+    assert job.to_dict()["total_rows"] == 2
+    assert json.loads(job.results_json(1, 1)) == [
+        {
+            "validation_name": "sum",
+            "start_time": "2022-01-01T00:00:00.000000Z",
+            "difference": None,
+        }
+    ]
+
+
+def test_submit_records_error(module_under_test):
+    manager = module_under_test.JobManager(workers=1)
+    FakeDataValidation.release.set()
+    job = manager.submit({**CONFIG, "fail": True})
+    _wait(job)
+
+    assert job.status == module_under_test.STATUS_FAILED
+    assert job.error == "ValueError: validation failed"
+
+
+def test_jobs_reuse_clients(module_under_test):
+    manager = module_under_test.JobManager(workers=1)
+    FakeDataValidation.release.set()
+    for job in [manager.submit(CONFIG), manager.submit(CONFIG)]:
+        _wait(job)
+
+    first, second = FakeDataValidation.created
+    assert first.source_client is second.source_client
+
+
+def test_client_pool_checks_out_clients(module_under_test):
+    pool = module_under_test.ClientPool()
+
+    with pool.checkout(SOURCE_CONN) as first:
+        with pool.checkout(SOURCE_CONN) as second:
+            # A client is used by one validation at a time.
+            assert first is not second
+    with pool.checkout(SOURCE_CONN) as third:
+        assert third in (first, second)
+
+
+def test_submit_raises_when_queue_full(module_under_test):
+    manager = module_under_test.JobManager(workers=1, max_queued=1)
+    running = manager.submit(CONFIG)
+    while running.status != module_under_test.STATUS_RUNNING:
+        pass
+    queued = manager.submit(CONFIG)
+
+    with pytest.raises(module_under_test.QueueFullError):
+        manager.submit(CONFIG)
+
+    FakeDataValidation.release.set()
+    _wait(running)
+    _wait(queued)
+
+
+def test_cancel(module_under_test):
+    manager = module_under_test.JobManager(workers=1)
+    running = manager.submit(CONFIG)
+    while running.status != module_under_test.STATUS_RUNNING:
+        pass
+    queued = manager.submit(CONFIG)
+
+    assert manager.cancel(queued.job_id).status == module_under_test.STATUS_CANCELLED
+    assert manager.cancel(running.job_id).status == module_under_test.STATUS_CANCELLING
+    assert manager.cancel("unknown") is None
+
+    FakeDataValidation.release.set()
+    _wait(running)
+    assert running.status == module_under_test.STATUS_CANCELLED
+    assert running.result_df is None
+    assert len(FakeDataValidation.created) == 1
+
+
+def test_finished_jobs_are_dropped(module_under_test):
+    manager = module_under_test.JobManager(workers=1, max_finished=2)
+    FakeDataValidation.release.set()
+    submitted = [manager.submit(CONFIG) for _ in range(3)]
+    for job in submitted:
+        _wait(job)
+
+    assert manager.list_jobs() == submitted[1:]
+
+
+def test_finished_jobs_are_dropped_over_max_result_bytes(module_under_test):
+    result_bytes = int(RESULT_DF.memory_usage(deep=True).sum())
+    manager = module_under_test.JobManager(workers=1, max_result_bytes=2 * result_bytes)
+    FakeDataValidation.release.set()
+    submitted = [manager.submit(CONFIG) for _ in range(3)]
+    for job in submitted:
+        _wait(job)
+
+    assert manager.list_jobs() == submitted[1:]
+    assert submitted[2].result_bytes == result_bytes
+
+
+def test_last_finished_job_kept_over_max_result_bytes(module_under_test):
+    manager = module_under_test.JobManager(workers=1, max_result_bytes=1)
+    FakeDataValidation.release.set()
+    submitted = [manager.submit(CONFIG) for _ in range(2)]
+    for job in submitted:
+        _wait(job)
+
+    assert manager.list_jobs() == submitted[1:]
+    assert submitted[1].result_df is not None
+
+
+def test_get_batch_configs(module_under_test):
+    document = {
+        "source": SOURCE_CONN,
+        "target": TARGET_CONN,
+        "result_handler": None,
+        "validations": [{"type": "Column", "table_name": "a"}, {"type": "Row"}],
+    }
+
+    configs = module_under_test.get_batch_configs(document)
+
+    assert configs == [
+        {
+            "type": "Column",
+            "table_name": "a",
+            "source_conn": SOURCE_CONN,
+            "target_conn": TARGET_CONN,
+            "result_handler": None,
+        },
+        {
+            "type": "Row",
+            "source_conn": SOURCE_CONN,
+            "target_conn": TARGET_CONN,
+            "result_handler": None,
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "document",
+    (
+        [],
+        {"source": SOURCE_CONN, "target": TARGET_CONN, "validations": []},
+        {"source": SOURCE_CONN, "validations": [{"type": "Column"}]},
+    ),
+)
+def test_get_batch_configs_invalid(module_under_test, document):
+    with pytest.raises(ValueError):
+        module_under_test.get_batch_configs(document)
+
+
+def test_run_batch(module_under_test):
+    manager = module_under_test.JobManager(workers=1)
+    FakeDataValidation.release.set()
+    configs = [CONFIG, {**CONFIG, "fail": True}, CONFIG]
+
+    results = sorted(
+        manager.run_batch(configs, workers=3), key=lambda result: result.index
+    )
+
+    assert [result.error for result in results] == [
+        None,
+        "ValueError: validation failed",
+        None,
+    ]
+    lines = [json.loads(result.to_json()) for result in results]
+    assert [line["status"] for line in lines] == ["succeeded", "failed", "succeeded"]
+    assert lines[0]["total_rows"] == 2
+    assert lines[0]["results"][0]["validation_name"] == "count"
+    assert lines[1]["results"] is None
+
+
+def test_run_batch_workers_shared_between_batches(module_under_test):
+    manager = module_under_test.JobManager(workers=1, batch_workers=2)
+    threads = [
+        threading.Thread(target=list, args=(manager.run_batch([CONFIG] * 3, 3),))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for _ in range(50):
+        if len(FakeDataValidation.created) == 2:
+            break
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    # Two batches of three run at most batch_workers validations at a time.
+    assert len(FakeDataValidation.created) == 2
+    FakeDataValidation.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(FakeDataValidation.created) == 6
@@ -0,0 +1,77 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import ibis
+import pytest
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import memory
+
+    return memory
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        (1048576, 1048576),
+        ("1048576", 1048576),
+        ("512MB", 512 * 1024**2),
+        ("512m", 512 * 1024**2),
+        ("1.5 GB", int(1.5 * 1024**3)),
+        ("20KB", 20 * 1024),
+    ),
+)
+def test_parse_memory_size(module_under_test, value, expected):
+    assert module_under_test.parse_memory_size(value) == expected
+
+
+def test_parse_memory_size_invalid(module_under_test):
+    with pytest.raises(ValueError, match="Invalid memory size"):
+        module_under_test.parse_memory_size("lots")
+
+
+def test_estimate_row_width(module_under_test):
+    schema = ibis.schema(
+        [("id", "int64"), ("flag", "boolean"), ("name", "string"), ("ts", "timestamp")]
+    )
+
+    width = module_under_test.estimate_row_width(schema)
+
+    assert width == 8 + 1 + module_under_test.DEFAULT_OBJECT_WIDTH + 8
+    assert module_under_test.estimate_validation_bytes(10, width) == (
+        10 * width * module_under_test.WORKING_SET_FACTOR
+    )
+
+
+def test_get_peak_rss(module_under_test):
+    module_under_test.reset_peak_rss()
+    peak_rss = module_under_test.get_peak_rss()
+
+    assert peak_rss is None or peak_rss > 0
+
+
+def test_peak_rss_reset_only_without_other_measurements(module_under_test):
+    with mock.patch.object(module_under_test, "reset_peak_rss") as reset_peak_rss:
+        module_under_test.start_peak_rss()
+        module_under_test.start_peak_rss()
+        module_under_test.stop_peak_rss()
+        module_under_test.stop_peak_rss()
+        module_under_test.start_peak_rss()
+        module_under_test.stop_peak_rss()
+
+    assert reset_peak_rss.call_count == 2
@@ -109,3 +109,52 @@ def test_get_table_name_with_unexpected_result_type(module_under_test):
     )
     with pytest.raises(ValueError, match="Unexpected result_type"):
         validation.get_table_name("oops_i_goofed")
+
+
+def test_span_records_timing(module_under_test):
+    run_metadata = module_under_test.RunMetadata()
+
+    with run_metadata.span("source_query", table="my_table"):
+        pass
+    with pytest.raises(ValueError):
+        with run_metadata.span("source_query"):
+            raise ValueError("query failed")
+    with run_metadata.span("combiner_execute"):
+        pass
+
+    assert [timing.phase for timing in run_metadata.timings] == [
+        "source_query",
+        "source_query",
+        "combiner_execute",
+    ]
+    assert run_metadata.timings[0].details == {"table": "my_table"}
+    assert all(timing.duration >= 0 for timing in run_metadata.timings)
+    durations = run_metadata.phase_durations()
+    assert list(durations) == ["source_query", "combiner_execute"]
+    assert durations["source_query"] == pytest.approx(
+        run_metadata.timings[0].duration + run_metadata.timings[1].duration
+    )
+
+
+def test_timing_hook(module_under_test):
+    run_metadata = module_under_test.RunMetadata()
+    calls = []
+
+    def hook(hook_run_metadata, timing):
+        calls.append((hook_run_metadata.run_id, timing.phase))
+
+    def failing_hook(hook_run_metadata, timing):
+        raise RuntimeError("metrics system unavailable")
+
+    module_under_test.add_timing_hook(failing_hook)
+    module_under_test.add_timing_hook(hook)
+    try:
+        with run_metadata.span("target_query"):
+            pass
+    finally:
+        module_under_test.remove_timing_hook(hook)
+        module_under_test.remove_timing_hook(failing_hook)
+    with run_metadata.span("result_handler"):
+        pass
+
+    assert calls == [(run_metadata.run_id, "target_query")]
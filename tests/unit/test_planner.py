@@ -0,0 +1,248 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pandas
+import pytest
+
+from data_validation import clients, consts
+from data_validation.config_manager import ConfigManager
+from data_validation.data_validation import DataValidation
+
+SOURCE_TABLE_FILE_PATH = "source_table_data.json"
+TARGET_TABLE_FILE_PATH = "target_table_data.json"
+
+SOURCE_CONN_CONFIG = {
+    "source_type": "FileSystem",
+    "table_name": "my_table",
+    "file_path": SOURCE_TABLE_FILE_PATH,
+    "file_type": "json",
+}
+
+TARGET_CONN_CONFIG = {
+    "source_type": "FileSystem",
+    "table_name": "my_table",
+    "file_path": TARGET_TABLE_FILE_PATH,
+    "file_type": "json",
+}
+
+SOURCE_DATA = [
+    {"id": i, "region": f"r{i % 3}", "qty": i % 5, "price": i / 3} for i in range(30)
+]
+TARGET_DATA = SOURCE_DATA + [{"id": 30, "region": "r0", "qty": 4, "price": 10.0}]
+
+GROUPED_COLUMNS = [
+    {
+        consts.CONFIG_FIELD_ALIAS: "region",
+        consts.CONFIG_SOURCE_COLUMN: "region",
+        consts.CONFIG_TARGET_COLUMN: "region",
+        consts.CONFIG_CAST: None,
+    }
+]
+QTY_FILTER = {
+    consts.CONFIG_TYPE: consts.FILTER_TYPE_EQUALS,
+    consts.CONFIG_FILTER_SOURCE_COLUMN: "qty",
+    consts.CONFIG_FILTER_SOURCE_VALUE: 4,
+    consts.CONFIG_FILTER_TARGET_COLUMN: "qty",
+    consts.CONFIG_FILTER_TARGET_VALUE: 4,
+}
+
+
+def _aggregate(aggregate_type, column=None):
+    return {
+        consts.CONFIG_FIELD_ALIAS: f"{aggregate_type}__{column}"
+        if column
+        else aggregate_type,
+        consts.CONFIG_SOURCE_COLUMN: column,
+        consts.CONFIG_TARGET_COLUMN: column,
+        consts.CONFIG_TYPE: aggregate_type,
+    }
+
+
+def _get_config(aggregates, grouped_columns=None, filters=None, **kwargs):
+    config = {
+        consts.CONFIG_SOURCE_CONN: SOURCE_CONN_CONFIG,
+        consts.CONFIG_TARGET_CONN: TARGET_CONN_CONFIG,
+        consts.CONFIG_TYPE: consts.COLUMN_VALIDATION,
+        consts.CONFIG_SCHEMA_NAME: None,
+        consts.CONFIG_TABLE_NAME: "my_table",
+        consts.CONFIG_TARGET_SCHEMA_NAME: None,
+        consts.CONFIG_TARGET_TABLE_NAME: "my_table",
+        consts.CONFIG_GROUPED_COLUMNS: grouped_columns or [],
+        consts.CONFIG_AGGREGATES: aggregates,
+        consts.CONFIG_FILTERS: filters or [],
+        consts.CONFIG_THRESHOLD: 0.0,
+        consts.CONFIG_RESULT_HANDLER: None,
+        consts.CONFIG_FORMAT: "table",
+    }
+    config.update(kwargs)
+    return config
+
+
+class _KeepResults(object):
+    def execute(self, config, result_df):
+        return result_df
+
+
+@pytest.fixture
+def module_under_test():
+    import data_validation.planner
+
+    return data_validation.planner
+
+
+@pytest.fixture
+def config_managers(fs):
+    with open(SOURCE_TABLE_FILE_PATH, "w") as f:
+        f.write(json.dumps(SOURCE_DATA))
+    with open(TARGET_TABLE_FILE_PATH, "w") as f:
+        f.write(json.dumps(TARGET_DATA))
+
+    source_client = clients.get_data_client(SOURCE_CONN_CONFIG)
+    target_client = clients.get_data_client(TARGET_CONN_CONFIG)
+    configs = [
+        _get_config([_aggregate("count"), _aggregate("sum", "qty")]),
+        _get_config([_aggregate("count"), _aggregate("max", "price")], GROUPED_COLUMNS),
+        _get_config([_aggregate("sum", "qty")], GROUPED_COLUMNS),
+        _get_config([_aggregate("min", "qty"), _aggregate("sum", "price")]),
+        _get_config([_aggregate("count")], filters=[QTY_FILTER]),
+        _get_config([_aggregate("avg", "price")], filters=[QTY_FILTER]),
+        _get_config([_aggregate("count")], filters=[QTY_FILTER], limit=5),
+        _get_config(
+            [],
+            primary_keys=[
+                {
+                    consts.CONFIG_FIELD_ALIAS: "id",
+                    consts.CONFIG_SOURCE_COLUMN: "id",
+                    consts.CONFIG_TARGET_COLUMN: "id",
+                    consts.CONFIG_CAST: None,
+                }
+            ],
+            type=consts.ROW_VALIDATION,
+        ),
+    ]
+    return [ConfigManager(config, source_client, target_client) for config in configs]
+
+
+def _execute(config_manager, shared_scan=None):
+    validator = DataValidation(
+        config_manager.config,
+        result_handler=_KeepResults(),
+        source_client=config_manager.source_client,
+        target_client=config_manager.target_client,
+        shared_scan=shared_scan,
+    )
+    result_df = validator.execute()
+    return (
+        result_df.drop(columns=[consts.RUN_ID, "start_time", "end_time"]),
+        validator.run_metadata.query_stats,
+    )
+
+
+def test_import(module_under_test):
+    assert module_under_test is not None
+
+
+def test_plan_shared_scans(module_under_test, config_managers):
+    shared_scans = module_under_test.plan_shared_scans(config_managers)
+
+    members = [shared_scans.get(id(manager)) for manager in config_managers]
+    # Validations without grouped columns join the scan of the grouped ones.
+    assert members[0].scan is members[1].scan is members[2].scan is members[3].scan
+    assert members[4].scan is members[5].scan
+    assert members[4].scan is not members[0].scan
+    # A different limit and a row validation do not share a scan.
+    assert members[6] is None
+    assert members[7] is None
+
+
+def test_shared_scan_results(module_under_test, config_managers):
+    shared_scans = module_under_test.plan_shared_scans(config_managers)
+
+    query_stats = []
+    for config_manager in config_managers[:6]:
+        expected_df, _ = _execute(config_manager)
+        result_df, stats = _execute(config_manager, shared_scans[id(config_manager)])
+        pandas.testing.assert_frame_equal(
+            result_df.reset_index(drop=True), expected_df.reset_index(drop=True)
+        )
+        query_stats.extend(stats)
+
+    # A sum of floats is not rolled up, so that validation runs its own queries.
+    assert len({id(stats) for stats in query_stats}) == 6
+    # Stats of the queries of a scan are marked as shared by its validations.
+    assert sorted(stats.shared_by for stats in query_stats) == (
+        [1, 1] + [2] * 4 + [3] * 6
+    )
+
+
+def test_rollup_of_float_sums(module_under_test, config_managers):
+    member = module_under_test._Member(
+        config_managers[0], rollup=True, aliases={"shared_scan__1": "sum__qty"}
+    )
+
+    # Integer sums with a NULL group are fetched as floats.
+    exact = pandas.DataFrame({"shared_scan__1": [2.0**52, None, 1.0]})
+    inexact = pandas.DataFrame({"shared_scan__1": [2.0**53, None, 1.0]})
+    assert module_under_test._has_exact_sums(exact, member)
+    assert not module_under_test._has_exact_sums(inexact, member)
+
+
+def test_plan_union_batches(module_under_test, config_managers):
+    batch_members = module_under_test.plan_union_batches(config_managers, 4)
+
+    members = [batch_members.get(id(manager)) for manager in config_managers]
+    assert members[0].source_batch is members[3].source_batch
+    assert members[4].source_batch is members[5].source_batch
+    assert members[0].source_batch is not members[4].source_batch
+    assert [member.source_index for member in members[:6]] == [0, 1, 2, 3, 0, 1]
+    # Queries with a limit and row validations are not batched.
+    assert members[6] is None
+    assert members[7] is None
+
+
+def test_union_batch_results(module_under_test, config_managers):
+    batch_members = module_under_test.plan_union_batches(config_managers, 4)
+
+    for config_manager in config_managers[:6]:
+        expected_df, _ = _execute(config_manager)
+        result_df, _ = _execute(config_manager, batch_members[id(config_manager)])
+        pandas.testing.assert_frame_equal(
+            result_df.reset_index(drop=True), expected_df.reset_index(drop=True)
+        )
+
+
+def test_union_batch_query_stats(module_under_test, config_managers):
+    count_managers = [
+        config_managers[4],
+        ConfigManager(
+            _get_config([_aggregate("count")]),
+            config_managers[4].source_client,
+            config_managers[4].target_client,
+        ),
+    ]
+    batch_members = module_under_test.plan_union_batches(count_managers, 4)
+
+    query_stats = []
+    for config_manager in count_managers:
+        _, stats = _execute(config_manager, batch_members[id(config_manager)])
+        query_stats.extend(stats)
+
+    # Queries with the same result schema run as one UNION ALL query per side,
+    # whose stats are recorded with the rows of each validation.
+    assert [stats.rows for stats in query_stats] == [1, 1, 1, 1]
+    assert [stats.shared_by for stats in query_stats] == [2, 2, 2, 2]
+    # Both validations record the duration of the same source query.
+    assert query_stats[0].duration == query_stats[2].duration
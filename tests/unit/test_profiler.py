@@ -0,0 +1,102 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import pstats
+import tracemalloc
+
+import pytest
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import profiler
+
+    return profiler
+
+
+def _validation():
+    return sorted(str(value) for value in range(10000))
+
+
+def test_profile_writes_profiles(module_under_test, tmp_path):
+    validation_profiler = module_under_test.ValidationProfiler(str(tmp_path), top=3)
+
+    with validation_profiler.profile("my_schema.my_table") as validation_profile:
+        validation_profile.run_id = "my-run"
+        _validation()
+
+    assert not tracemalloc.is_tracing()
+    assert validation_profile.stats_path == str(
+        tmp_path / "my-run_my_schema.my_table.prof"
+    )
+    stats = pstats.Stats(validation_profile.stats_path)
+    assert any(name == "_validation" for _, _, name in stats.stats)
+    snapshot = tracemalloc.Snapshot.load(validation_profile.snapshot_path)
+    assert snapshot.statistics("lineno")
+    assert validation_profile.peak_memory > 0
+    # Only the top rows of the profiles are kept in memory.
+    assert len(validation_profile.functions) == 3
+    assert len(validation_profile.allocations) <= 3
+
+
+def test_profile_writes_profiles_of_failed_validation(module_under_test, tmp_path):
+    validation_profiler = module_under_test.ValidationProfiler(str(tmp_path))
+
+    with pytest.raises(ValueError):
+        with validation_profiler.profile("custom/query"):
+            raise ValueError("failed")
+
+    assert [profile.label for profile in validation_profiler.profiles] == [
+        "custom/query"
+    ]
+    # Without a run_id, profiles are named by their position in the run.
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "0_custom_query.prof",
+        "0_custom_query.tracemalloc",
+    ]
+
+
+def test_print_summary(module_under_test, tmp_path):
+    validation_profiler = module_under_test.ValidationProfiler(str(tmp_path), top=2)
+    for run_id in ("run-1", "run-2"):
+        with validation_profiler.profile("my_table") as validation_profile:
+            validation_profile.run_id = run_id
+            _validation()
+
+    summary = io.StringIO()
+    validation_profiler.print_summary(file=summary)
+    lines = summary.getvalue().splitlines()
+
+    headers = [line for line in lines if line.startswith("Profile of")]
+    assert [header.split(":")[0] for header in headers] == [
+        "Profile of my_table (run_id run-1)",
+        "Profile of my_table (run_id run-2)",
+    ]
+    function_header = lines.index("      ncalls   tottime   cumtime  function")
+    # The top 2 functions follow the header, then the top allocations.
+    assert lines[function_header + 3].split() == ["size", "count", "allocated", "at"]
+
+
+def test_top_functions(module_under_test):
+    stats = pstats.Stats(
+        module_under_test.cProfile.Profile().runctx(
+            "_validation()", globals(), locals()
+        )
+    )
+
+    top = module_under_test.top_functions(stats, top=2)
+
+    assert len(top) == 2
+    assert top[0][1] >= top[1][1]
@@ -17,6 +17,9 @@ import pytest
 import random
 from datetime import datetime, timedelta
 
+import ibis
+import ibis.expr.datatypes as dt
+
 from data_validation import consts, data_validation
 
 SOURCE_TABLE_FILE_PATH = "source_table_data.json"
@@ -243,3 +246,58 @@ def test_execute(module_under_test, fs):
     assert result_df.labels[0] == SAMPLE_SCHEMA_CONFIG[consts.CONFIG_LABELS]
     assert failures["source_column_name"].to_list() == ["id", "N/A"]
     assert failures["target_column_name"].to_list() == ["N/A", "id_new"]
+
+
+def test_schema_validation_frame(module_under_test):
+    """The frame of many validations matches each schema_validation_matching."""
+    validations = [
+        (
+            {"FIELD1": dt.string, "fiEld2": dt.date, "field3": dt.string},
+            {"field1": dt.string, "field2": dt.timestamp, "field_3": dt.string},
+            ["field3"],
+        ),
+        ({"id": dt.int64, "ID": dt.int32}, {"id": dt.int32}, None),
+        ({}, {"only_target": dt.string}, []),
+        ({}, {}, []),
+    ]
+    results = module_under_test.schema_validation_frame(
+        module_under_test._get_fields_frame(
+            [ibis.schema(list(source.items())) for source, _, _ in validations],
+            [exclusions for _, _, exclusions in validations],
+        ),
+        module_under_test._get_fields_frame(
+            [ibis.schema(list(target.items())) for _, target, _ in validations],
+            [exclusions for _, _, exclusions in validations],
+        ),
+    )
+
+    for index, (source, target, exclusions) in enumerate(validations):
+        validation_results = results[results["validation"] == index]
+        assert validation_results[
+            module_under_test.RESULT_COLUMNS
+        ].values.tolist() == module_under_test.schema_validation_matching(
+            source, target, exclusions
+        )
+
+
+def test_bulk_schema_validation(module_under_test, fs):
+    source_data = _generate_fake_data(rows=1, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(source_data))
+    target_data = _generate_fake_data(
+        rows=1, second_range=0, rename_columns={"id": "id_new"}
+    )
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(target_data))
+
+    dv_client = data_validation.DataValidation(SAMPLE_SCHEMA_CONFIG)
+    (schema_results,) = module_under_test.BulkSchemaValidation(
+        [dv_client.config_manager]
+    ).execute()
+    bulk_client = data_validation.DataValidation(
+        SAMPLE_SCHEMA_CONFIG, schema_results=schema_results
+    )
+
+    expected_df = dv_client.schema_validator.execute()
+    result_df = bulk_client.schema_validator.execute()
+    columns = ["source_column_name", "target_column_name", "validation_status"]
+    assert result_df[columns].equals(expected_df[columns])
+    assert list(result_df.columns) == list(expected_df.columns)
@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from data_validation import state_manager
+import json
+
+import pytest
+from google.api_core import exceptions
+
+from data_validation import consts, state_manager
 
 TEST_CONN_NAME = "example"
 TEST_CONN = {
@@ -92,3 +97,136 @@ def test_create_and_list_validation(capsys, fs):
 
     validations = manager.list_validations()
     assert validations == [TEST_VALIDATION_NAME.split(".")[0]]
+
+
+class FakeBlob(object):
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.generation = None
+
+    def download_as_bytes(self, if_generation_not_match=None):
+        content, generation = self.bucket.objects[self.name]
+        self.bucket.downloads.append((self.name, if_generation_not_match))
+        if generation == if_generation_not_match:
+            raise exceptions.NotModified("Not modified")
+        self.generation = generation
+        return content
+
+    def upload_from_string(self, data):
+        _, generation = self.bucket.objects.get(self.name, (None, 0))
+        self.generation = generation + 1
+        self.bucket.objects[self.name] = (data.encode("utf-8"), self.generation)
+
+
+class FakeBucket(object):
+    def __init__(self):
+        self.objects = {}
+        self.downloads = []
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+
+class FakeStorageClient(object):
+    def __init__(self):
+        self.gcs_bucket = FakeBucket()
+
+    def bucket(self, name):
+        return self.gcs_bucket
+
+
+@pytest.fixture
+def storage_client(monkeypatch, tmp_path):
+    client = FakeStorageClient()
+    monkeypatch.setattr(state_manager, "_get_storage_client", lambda: client)
+    monkeypatch.setenv(consts.ENV_CACHE_DIRECTORY_VAR, str(tmp_path / "cache"))
+    state_manager.GCSFileCache.clear_memory()
+    yield client
+    state_manager.GCSFileCache.clear_memory()
+
+
+def test_gcs_client_is_created_on_first_use(monkeypatch):
+    def fail():
+        raise AssertionError("The GCS client was created")
+
+    monkeypatch.setattr(state_manager, "_get_storage_client", fail)
+    manager = state_manager.StateManager("gs://bucket/path")
+    assert manager.file_system == state_manager.FileSystem.GCS
+
+
+def test_gcs_read_is_cached(storage_client):
+    manager = state_manager.StateManager("gs://bucket/path")
+    manager.create_connection(TEST_CONN_NAME, TEST_CONN)
+
+    assert manager.get_connection_config(TEST_CONN_NAME) == TEST_CONN
+    # Files written by the process are cached with their generation.
+    assert storage_client.gcs_bucket.downloads == []
+
+    state_manager.StateManager("gs://bucket/path").get_connection_config(TEST_CONN_NAME)
+    assert storage_client.gcs_bucket.downloads == []
+
+
+def test_gcs_read_revalidates_stale_files(storage_client, monkeypatch):
+    monkeypatch.setattr(state_manager, "CACHE_MAX_AGE_SECONDS", 0)
+    bucket = storage_client.gcs_bucket
+    bucket.objects["path/connections/example.connection.json"] = (
+        json.dumps(TEST_CONN).encode(),
+        1,
+    )
+    manager = state_manager.StateManager("gs://bucket/path")
+
+    assert manager.get_connection_config(TEST_CONN_NAME) == TEST_CONN
+    assert manager.get_connection_config(TEST_CONN_NAME) == TEST_CONN
+    assert bucket.downloads == [
+        ("path/connections/example.connection.json", None),
+        ("path/connections/example.connection.json", 1),
+    ]
+
+    changed_conn = dict(TEST_CONN, project_id="other-project")
+    bucket.objects["path/connections/example.connection.json"] = (
+        json.dumps(changed_conn).encode(),
+        2,
+    )
+    assert manager.get_connection_config(TEST_CONN_NAME) == changed_conn
+
+
+def test_gcs_read_uses_disk_cache(storage_client, monkeypatch):
+    bucket = storage_client.gcs_bucket
+    bucket.objects["path/connections/example.connection.json"] = (
+        json.dumps(TEST_CONN).encode(),
+        7,
+    )
+    state_manager.StateManager("gs://bucket/path").get_connection_config(TEST_CONN_NAME)
+
+    # A new process only has the disk cache, which is revalidated.
+    state_manager.GCSFileCache.clear_memory()
+    bucket.objects["path/connections/example.connection.json"] = (b"not downloaded", 7)
+    config = state_manager.StateManager("gs://bucket/path").get_connection_config(
+        TEST_CONN_NAME
+    )
+    assert config == TEST_CONN
+    assert bucket.downloads[-1] == ("path/connections/example.connection.json", 7)
+
+
+def test_get_connection_configs_gcs(storage_client):
+    bucket = storage_client.gcs_bucket
+    names = ["first", "second", "third"]
+    for index, name in enumerate(names):
+        bucket.objects[f"path/connections/{name}.connection.json"] = (
+            json.dumps(dict(TEST_CONN, project_id=name)).encode(),
+            index + 1,
+        )
+    manager = state_manager.StateManager("gs://bucket/path")
+
+    configs = manager.get_connection_configs(names + ["first"])
+    assert configs == {name: dict(TEST_CONN, project_id=name) for name in names}
+    assert len(bucket.downloads) == len(names)
+
+
+def test_get_validation_configs(capsys, fs):
+    manager = state_manager.StateManager()
+    manager.create_validation_yaml(TEST_VALIDATION_NAME, TEST_VALIDATION_CONFIG)
+
+    configs = manager.get_validation_configs([TEST_VALIDATION_NAME])
+    assert configs == {TEST_VALIDATION_NAME: TEST_VALIDATION_CONFIG}
@@ -23,7 +23,11 @@ Ibis as an override, though it would not apply for Pandas and other
 non-textual languages.
 """
 
+import hashlib
+
 import ibis
+import numpy
+import pandas
 import sqlalchemy
 
 import ibis.expr.api
@@ -34,9 +38,12 @@ import ibis.expr.rules as rlz
 from ibis.expr.types import BinaryValue, IntegerColumn, StringValue
 from ibis.backends.impala.compiler import ImpalaExprTranslator
 from ibis.backends.pandas import client as _pandas_client
+from ibis.backends.pandas.core import execute_node
+from pandas.core.groupby import SeriesGroupBy
 from ibis.backends.base_sqlalchemy.alchemy import AlchemyExprTranslator
 from ibis.backends.base_sqlalchemy.compiler import ExprTranslator
 from ibis.backends.base_sql.compiler import BaseExprTranslator
+from third_party.ibis.ibis_duckdb.compiler import DuckDBExprTranslator
 from third_party.ibis.ibis_oracle.compiler import OracleExprTranslator
 from third_party.ibis.ibis_teradata.compiler import TeradataExprTranslator
 
@@ -144,11 +151,64 @@ def format_hashbytes_alchemy(translator, expr):
     else:
         raise ValueError(f"unexpected value for 'how': {how}")
 
+
+def format_hashbytes_duckdb(translator, expr):
+    arg, how = expr.op().args
+    compiled_arg = translator.translate(arg)
+    if how == "sha256":
+        return sqlalchemy.func.sha256(compiled_arg)
+    elif how == "md5":
+        return sqlalchemy.func.md5(compiled_arg)
+    else:
+        raise ValueError(f"unexpected value for 'how': {how}")
+
+
+def format_bit_xor_duckdb(translator, expr):
+    arg, where = expr.op().args
+    compiled_arg = translator.translate(arg)
+    if where is not None:
+        compiled_arg = sqlalchemy.case(
+            [(translator.translate(where), compiled_arg)], else_=None
+        )
+    return sqlalchemy.func.bit_xor(compiled_arg)
+
+
 def format_hashbytes_base(translator, expr):
     arg, how  = expr.op().args
     compiled_arg = translator.translate(arg)
     return f"sha2({compiled_arg}, 256)"
 
+
+@execute_node.register(HashBytes, pandas.Series)
+def execute_hashbytes_series(op, data, **kwargs):
+    if op.how != "sha256":
+        raise ValueError(f"unexpected value for 'how': {op.how}")
+    return data.map(
+        lambda value: None
+        if pandas.isnull(value)
+        else hashlib.sha256(
+            value if isinstance(value, bytes) else str(value).encode("utf-8")
+        ).hexdigest()
+    )
+
+
+def _bit_xor(values):
+    values = values.dropna()
+    if values.empty:
+        return None
+    return int(numpy.bitwise_xor.reduce(values.astype("int64").values))
+
+
+@execute_node.register(BitXor, pandas.Series, (pandas.Series, type(None)))
+def execute_bit_xor_series(op, data, mask, aggcontext=None, **kwargs):
+    return aggcontext.agg(data[mask] if mask is not None else data, _bit_xor)
+
+
+@execute_node.register(BitXor, SeriesGroupBy, type(None))
+def execute_bit_xor_series_groupby(op, data, mask, aggcontext=None, **kwargs):
+    return aggcontext.agg(data, _bit_xor)
+
+
 def compile_raw_sql(table, sql):
     op = RawSQL(table[table.columns[0]].cast(dt.string), ibis.literal(sql))
     return op.to_expr()
@@ -182,6 +242,9 @@ BaseExprTranslator._registry[HashBytes] = format_hashbytes_base
 BigQueryExprTranslator._registry[RawSQL] = format_raw_sql
 ImpalaExprTranslator._registry[RawSQL] = format_raw_sql
 ImpalaExprTranslator._registry[HashBytes] = format_hashbytes_hive
+DuckDBExprTranslator._registry[BitXor] = format_bit_xor_duckdb
+DuckDBExprTranslator._registry[HashBytes] = format_hashbytes_duckdb
+DuckDBExprTranslator._registry[RawSQL] = sa_format_raw_sql
 OracleExprTranslator._registry[RawSQL] = sa_format_raw_sql
 TeradataExprTranslator._registry[RawSQL] = format_raw_sql
 TeradataExprTranslator._registry[HashBytes] = format_hashbytes_teradata
@@ -0,0 +1,361 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Ibis pandas client for Parquet and Arrow IPC (Feather) files.
+
+Files are opened as pyarrow datasets and only read when an expression is
+executed. The expression is inspected first so that only the columns it uses
+are read, and simple filters are pushed down to pyarrow, which skips files
+and Parquet row groups using their statistics. The pandas backend still
+evaluates every filter, so pushdown only reduces the data read.
+"""
+
+import collections
+import fnmatch
+import logging
+import operator
+import os
+import posixpath
+
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.schema as sch
+import ibis.expr.types as ir
+import pyarrow
+import pyarrow.dataset as ds
+import pyarrow.fs
+from ibis.backends.pandas.client import PandasClient, PandasTable
+from ibis.backends.pandas.core import execute_node
+
+FILE_FORMATS = {
+    "parquet": "parquet",
+    "feather": "feather",
+    "arrow": "ipc",
+    "ipc": "ipc",
+}
+SCHEMA_SAMPLE_ROWS = 10000
+
+_GLOB_CHARS = "*?["
+# NotEquals is not pushed down: pyarrow drops rows where the column is null,
+# while the pandas backend keeps them.
+_COMPARISONS = {
+    ops.Equals: (operator.eq, operator.eq),
+    ops.Less: (operator.lt, operator.gt),
+    ops.LessEqual: (operator.le, operator.ge),
+    ops.Greater: (operator.gt, operator.lt),
+    ops.GreaterEqual: (operator.ge, operator.le),
+}
+
+
+def open_dataset(file_path, file_type="parquet", memory_map=True):
+    """Return a pyarrow Dataset for a file, directory or glob of files.
+
+    file_path (str): A local or remote (eg. gs://) file, directory or glob
+    file_type (str): One of parquet, feather, arrow or ipc
+    memory_map (bool): Memory map local files instead of reading them
+    """
+    if file_type not in FILE_FORMATS:
+        raise ValueError(f"Unknown Arrow File Type: {file_type}")
+
+    if "://" in file_path:
+        filesystem, path = pyarrow.fs.FileSystem.from_uri(file_path)
+    else:
+        filesystem = pyarrow.fs.LocalFileSystem(use_mmap=memory_map)
+        path = os.path.abspath(file_path)
+
+    source = path
+    if any(char in path for char in _GLOB_CHARS):
+        source = _glob(filesystem, path)
+        if not source:
+            raise FileNotFoundError(f"No files match: {file_path}")
+
+    return ds.dataset(
+        source,
+        format=FILE_FORMATS[file_type],
+        filesystem=filesystem,
+        partitioning="hive",
+    )
+
+
+def _glob(filesystem, pattern):
+    prefix = pattern[: min(pattern.index(c) for c in _GLOB_CHARS if c in pattern)]
+    selector = pyarrow.fs.FileSelector(posixpath.dirname(prefix), recursive=True)
+    return sorted(
+        info.path
+        for info in filesystem.get_file_info(selector)
+        if info.type == pyarrow.fs.FileType.File
+        and fnmatch.fnmatchcase(info.path, pattern)
+    )
+
+
+def _data_columns(schema):
+    """Return column names, excluding any stored pandas index."""
+    index_columns = set()
+    if schema.pandas_metadata:
+        index_columns = {
+            column
+            for column in schema.pandas_metadata.get("index_columns", [])
+            if isinstance(column, str)
+        }
+    return [name for name in schema.names if name not in index_columns]
+
+
+def _ibis_type(arrow_type):
+    """Return the Ibis type of a pyarrow type, or None if it has no simple one."""
+    types = pyarrow.types
+    if types.is_integer(arrow_type) or types.is_floating(arrow_type):
+        # Eg. int32 -> dt.int32, double -> dt.float64.
+        return dt.dtype(arrow_type.to_pandas_dtype().__name__)
+    elif types.is_boolean(arrow_type):
+        return dt.boolean
+    elif types.is_string(arrow_type) or types.is_large_string(arrow_type):
+        return dt.string
+    elif types.is_binary(arrow_type) or types.is_large_binary(arrow_type):
+        return dt.binary
+    elif types.is_timestamp(arrow_type):
+        return dt.Timestamp(timezone=arrow_type.tz)
+    elif types.is_date(arrow_type):
+        return dt.date
+    elif types.is_decimal(arrow_type):
+        return dt.Decimal(arrow_type.precision, arrow_type.scale)
+    return None
+
+
+def _flatten(args):
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            yield from _flatten(arg)
+        else:
+            yield arg
+
+
+def _is_filter(op):
+    return isinstance(op, ops.Selection) and not op.selections
+
+
+def _resolve_scan(expr, table_class):
+    """Return the table name and predicates of a scan, looking through filters.
+
+    Returns (None, []) when expr does not read from a table_class table.
+    """
+    predicates = []
+    while isinstance(expr, ir.TableExpr) and _is_filter(expr.op()):
+        predicates.extend(expr.op().predicates)
+        expr = expr.op().table
+    if isinstance(expr, ir.TableExpr) and isinstance(expr.op(), table_class):
+        return expr.op().name, predicates
+    return None, []
+
+
+def _scan_name(expr, table_class):
+    return _resolve_scan(expr, table_class)[0]
+
+
+def _common_predicates(uses):
+    """Return the predicates applied by every use of a table."""
+    if not uses or not all(uses):
+        return []
+    return [
+        predicate
+        for predicate in uses[0]
+        if all(any(predicate.equals(other) for other in use) for use in uses[1:])
+    ]
+
+
+def _to_arrow_filter(predicate, name, table_class):
+    """Translate a predicate into a pyarrow expression, or None if unsupported."""
+    op = predicate.op()
+
+    def field(expr):
+        column = expr.op()
+        if (
+            isinstance(column, ops.TableColumn)
+            and _scan_name(column.table, table_class) == name
+        ):
+            return ds.field(column.name)
+        return None
+
+    def literal(expr):
+        value = getattr(expr.op(), "value", None)
+        return value if isinstance(expr.op(), ops.Literal) else None
+
+    if isinstance(op, ops.And):
+        left = _to_arrow_filter(op.left, name, table_class)
+        right = _to_arrow_filter(op.right, name, table_class)
+        if left is None or right is None:
+            return left if right is None else right
+        return left & right
+    elif type(op) in _COMPARISONS:
+        compare, reflected = _COMPARISONS[type(op)]
+        if field(op.left) is not None and literal(op.right) is not None:
+            return compare(field(op.left), literal(op.right))
+        if field(op.right) is not None and literal(op.left) is not None:
+            return reflected(field(op.right), literal(op.left))
+    elif isinstance(op, ops.Between) and field(op.arg) is not None:
+        lower, upper = literal(op.lower_bound), literal(op.upper_bound)
+        if lower is not None and upper is not None:
+            return (field(op.arg) >= lower) & (field(op.arg) <= upper)
+    elif isinstance(op, ops.Contains) and field(op.value) is not None:
+        values = [literal(value) for value in getattr(op.options.op(), "values", [])]
+        if values and None not in values:
+            return field(op.value).isin(values)
+    return None
+
+
+def plan_scans(expr, table_class):
+    """Return the columns and filter to read for each table in an expression.
+
+    Returns a dict of table name to (columns, filter), where columns is None
+    when every column is needed and filter is a pyarrow expression or None.
+    """
+    columns = collections.defaultdict(set)
+    uses = collections.defaultdict(list)
+    read_all = set()
+
+    def add_use(table, predicates=(), all_columns=True):
+        name, filters = _resolve_scan(table, table_class)
+        if name:
+            uses[name].append(filters + list(predicates))
+            if all_columns:
+                read_all.add(name)
+
+    seen = set()
+
+    def visit(expr, context):
+        """Visit an expression evaluated against the rows of context.
+
+        Columns of the context table are read within the node that set the
+        context, so they do not add a use of the table of their own.
+        """
+        op = expr.op()
+        if (id(op), id(context)) in seen:
+            return
+        seen.add((id(op), id(context)))
+
+        if isinstance(op, ops.TableColumn):
+            name = _scan_name(op.table, table_class)
+            if name:
+                columns[name].add(op.name)
+                if context is None or not op.table.equals(context):
+                    add_use(op.table, all_columns=False)
+            visit(op.table, context)
+        elif isinstance(op, (ops.Selection, ops.Aggregation)):
+            # Filters are resolved by the nodes which consume them.
+            if not _is_filter(op):
+                add_use(op.table, op.predicates, all_columns=False)
+                for selection in getattr(op, "selections", []):
+                    add_use(selection)
+            visit(op.table, context)
+            for arg in _flatten(op.args[1:]):
+                if isinstance(arg, ir.Expr):
+                    visit(arg, op.table)
+        else:
+            for arg in _flatten(op.args):
+                if isinstance(arg, ir.Expr):
+                    # Counting rows needs no columns, anything else needs all.
+                    add_use(arg, all_columns=not isinstance(op, ops.Count))
+                    visit(arg, context)
+
+    add_use(expr)
+    visit(expr, None)
+
+    scans = {}
+    for name in set(columns) | set(uses) | read_all:
+        filters = [
+            _to_arrow_filter(predicate, name, table_class)
+            for predicate in _common_predicates(uses[name])
+        ]
+        arrow_filter = None
+        for expression in filters:
+            if expression is not None:
+                arrow_filter = (
+                    expression if arrow_filter is None else arrow_filter & expression
+                )
+        scans[name] = (
+            None if name in read_all else sorted(columns[name]),
+            arrow_filter,
+        )
+    return scans
+
+
+class ArrowFileTable(PandasTable):
+    pass
+
+
+class ArrowFileClient(PandasClient):
+    """Pandas client which reads Parquet or Arrow IPC files on execution."""
+
+    def __init__(self, table_name, file_path, file_type="parquet", memory_map=True):
+        super().__init__({})
+        self.datasets = {table_name: open_dataset(file_path, file_type, memory_map)}
+        self._schemas = {}
+        self._scans = {}
+
+    def table(self, name, schema=None, database=None):
+        return ArrowFileTable(name, self.get_schema(name), self).to_expr()
+
+    def get_schema(self, table_name, database=None):
+        """Return the Ibis schema of a dataset from its Arrow schema.
+
+        Columns of Arrow types without a simple Ibis type, eg. dictionaries
+        or nested types, are inferred from pandas on a sample of rows.
+        """
+        if table_name not in self._schemas:
+            dataset = self.datasets[table_name]
+            names = _data_columns(dataset.schema)
+            types = {
+                name: _ibis_type(dataset.schema.field(name).type) for name in names
+            }
+            inferred = [name for name in names if types[name] is None]
+            if inferred:
+                sample = dataset.head(SCHEMA_SAMPLE_ROWS, columns=inferred)
+                types.update(sch.infer(sample.to_pandas()).items())
+            self._schemas[table_name] = sch.Schema(
+                names, [types[name] for name in names]
+            )
+        return self._schemas[table_name]
+
+    def list_tables(self, like=None):
+        return [name for name in self.datasets if like is None or like in name]
+
+    def execute(self, query, params=None, limit="default", **kwargs):
+        self._scans = plan_scans(query, ArrowFileTable)
+        try:
+            return super().execute(query, params=params, limit=limit, **kwargs)
+        finally:
+            self._scans = {}
+
+    def read_table(self, name, columns=None, filter=None):
+        """Return a DataFrame with the given columns and rows of a dataset.
+
+        All data columns are read when columns is None. Datasets are read
+        with pyarrow's thread pool, so multiple files and row groups are read
+        in parallel.
+        """
+        dataset = self.datasets[name]
+        if columns is None:
+            columns = _data_columns(dataset.schema)
+        try:
+            table = dataset.to_table(columns=columns, filter=filter, use_threads=True)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as e:
+            if filter is None:
+                raise
+            logging.debug("Cannot push down filter %s, reading all rows: %s", filter, e)
+            table = dataset.to_table(columns=columns, use_threads=True)
+        return table.to_pandas()
+
+
+@execute_node.register(ArrowFileTable, ArrowFileClient)
+def execute_arrow_file_table(op, client, **kwargs):
+    columns, arrow_filter = client._scans.get(op.name, (None, None))
+    return client.read_table(op.name, columns=columns, filter=arrow_filter)
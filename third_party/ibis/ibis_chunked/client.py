@@ -0,0 +1,378 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Ibis pandas client which reads CSV and JSON lines files in chunks.
+
+Expressions are executed once per chunk of the file, so memory use is bounded
+by the chunk size rather than the file size:
+
+  - Aggregations of count, sum, min, max and bit_xor, grouped or not, are
+    computed per chunk and the partial results merged.
+  - Row wise selections, eg. the hashed rows of a row validation, are
+    computed per chunk and concatenated.
+
+Any other expression is executed over the whole file.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.schema as sch
+import ibis.expr.types as ir
+import pandas
+from ibis.backends.pandas.client import PandasClient, PandasTable
+
+from third_party.ibis.ibis_addon.operations import BitXor, _bit_xor
+from third_party.ibis.ibis_arrow.client import plan_scans
+
+DEFAULT_CHUNK_SIZE = 1000000
+MAX_CACHED_DTYPES = 128
+
+# Dtypes decided by a pass over a file, by file, modification time and read
+# schema, so each file is passed over at most once while it is unchanged.
+_dtypes_cache = OrderedDict()
+_dtypes_cache_lock = threading.Lock()
+
+_MERGES = {
+    ops.Count: "sum",
+    ops.Sum: "sum",
+    ops.Min: "min",
+    ops.Max: "max",
+    BitXor: _bit_xor,
+}
+_NOT_ROW_WISE = (
+    ops.Reduction,
+    ops.AnalyticOp,
+    ops.WindowOp,
+    ops.Aggregation,
+    ops.Limit,
+    ops.Distinct,
+    ops.Join,
+)
+
+
+def _flatten(args):
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            yield from _flatten(arg)
+        else:
+            yield arg
+
+
+def _is_row_wise(exprs):
+    """Return True if no node under exprs depends on rows other than its own."""
+    stack = [expr.op() for expr in exprs]
+    seen = set()
+    while stack:
+        op = stack.pop()
+        if id(op) in seen:
+            continue
+        seen.add(id(op))
+        if isinstance(op, _NOT_ROW_WISE) or getattr(op, "sort_keys", None):
+            return False
+        stack.extend(arg.op() for arg in _flatten(op.args) if isinstance(arg, ir.Expr))
+    return True
+
+
+def _merge_function(metric):
+    """Return how to merge per chunk values of an aggregate, or None."""
+    op = metric.op()
+    if isinstance(op, ops.Cast):
+        if not isinstance(op.to, (dt.Integer, dt.Floating, dt.Decimal)):
+            return None
+        op = op.arg.op()
+    return _MERGES.get(type(op))
+
+
+def _merge_series(series, merge):
+    return merge(series) if callable(merge) else getattr(series, merge)()
+
+
+def chunk_merger(expr):
+    """Return a function merging per chunk results of expr, or None.
+
+    None is returned when expr cannot be executed chunk by chunk.
+    """
+    op = expr.op()
+    if isinstance(op, ops.Aggregation):
+        if op.having or op.sort_keys:
+            return None
+        if not _is_row_wise([op.table] + list(op.by) + list(op.predicates)):
+            return None
+        merges = {metric.get_name(): _merge_function(metric) for metric in op.metrics}
+        if None in merges.values():
+            return None
+        keys = [key.get_name() for key in op.by]
+        names = list(expr.schema().names)
+
+        def merge_aggregations(parts):
+            df = pandas.concat(parts, ignore_index=True)
+            if keys:
+                df = df.groupby(keys, dropna=False, sort=False).agg(merges)
+                return df.reset_index()[names]
+            return pandas.DataFrame(
+                {name: [_merge_series(df[name], merges[name])] for name in names}
+            )
+
+        return merge_aggregations
+    elif isinstance(op, ops.Selection):
+        if not _is_row_wise([op.table] + list(op.selections) + list(op.predicates)):
+            return None
+        if op.sort_keys:
+            return None
+        return lambda parts: pandas.concat(parts, ignore_index=True)
+    elif isinstance(expr, ir.ScalarExpr) and _merge_function(expr):
+        if not _is_row_wise(op.args[:1]):
+            return None
+        merge = _merge_function(expr)
+        return lambda parts: _merge_series(pandas.Series(parts), merge)
+    return None
+
+
+def _read_dtypes(schema, names):
+    """Return pandas dtypes and date columns for file columns from a schema.
+
+    Names are matched case insensitively. Integers are returned as "Int64",
+    to be resolved to int64 or float64 over the whole file, as columns with
+    nulls become float64 with pandas type inference.
+    """
+    types = {name.lower(): dtype for name, dtype in zip(schema.names, schema.types)}
+    dtypes, dates = {}, []
+    for name in names:
+        dtype = types.get(name.lower())
+        if isinstance(dtype, dt.String):
+            dtypes[name] = "object"
+        elif isinstance(dtype, dt.Integer):
+            dtypes[name] = "Int64"
+        elif isinstance(dtype, (dt.Floating, dt.Decimal)):
+            dtypes[name] = "float64"
+        elif isinstance(dtype, (dt.Timestamp, dt.Date)):
+            dates.append(name)
+    return dtypes, dates
+
+
+def _chunk_dtype(series):
+    """Return the dtype pandas type inference gives a column of one chunk."""
+    if isinstance(series.dtype, pandas.Int64Dtype):
+        return "float64" if series.hasnans else "int64"
+    return str(series.dtype)
+
+
+def _widen_dtype(left, right):
+    """Return the dtype pandas would infer for the rows of two dtypes."""
+    if left is None or left == right:
+        return right
+    if {left, right} <= {"int64", "float64"}:
+        return "float64"
+    return "object"
+
+
+class ChunkedFileTable(PandasTable):
+    pass
+
+
+class ChunkedFileClient(PandasClient):
+    """Pandas client which executes expressions over chunks of a file."""
+
+    def __init__(
+        self, table_name, file_path, file_type="csv", chunk_size=DEFAULT_CHUNK_SIZE
+    ):
+        if file_type not in ("csv", "json"):
+            raise ValueError(f"Unknown Chunked File Type: {file_type}")
+        super().__init__({})
+        self.table_name = table_name
+        self.file_path = file_path
+        self.file_type = file_type
+        self.chunk_size = int(chunk_size)
+        self.read_schema = None
+        self._schema = None
+        self._dtypes = None
+
+    def set_dtypes(self, schema):
+        """Read columns with the types of an Ibis schema, eg. the other side's.
+
+        This skips pandas type inference and keeps strings such as ids with
+        leading zeros as strings.
+        """
+        self.read_schema = schema
+        self._schema = None
+        self._dtypes = None
+
+    def table(self, name, schema=None, database=None):
+        return ChunkedFileTable(name, self.get_schema(name), self).to_expr()
+
+    def get_schema(self, table_name, database=None):
+        if self._schema is None:
+            sample = next(self.iter_chunks(chunk_size=min(self.chunk_size, 10000)))
+            self._schema = sch.infer(sample)
+        return self._schema
+
+    def list_tables(self, like=None):
+        return [self.table_name]
+
+    def _read_file(self, columns, chunk_size, dtypes=None, dates=None):
+        if self.file_type == "csv":
+            names = pandas.read_csv(self.file_path, nrows=0).columns
+            return pandas.read_csv(
+                self.file_path,
+                chunksize=chunk_size,
+                # Counting rows needs no columns, but pandas reads no rows
+                # without any columns.
+                usecols=list(names[:1]) if columns == [] else columns,
+                dtype=dtypes,
+                parse_dates=dates,
+            )
+        return pandas.read_json(self.file_path, lines=True, chunksize=chunk_size)
+
+    def _dtypes_key(self):
+        """Return the key of the file's dtypes in the dtypes cache, or None."""
+        try:
+            stat = os.stat(self.file_path)
+        except (OSError, TypeError, ValueError):
+            # Eg. the path of a remote file system, whose dtypes are not cached.
+            return None
+        schema = self.read_schema
+        return (
+            os.path.abspath(self.file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.file_type,
+            None
+            if schema is None
+            else tuple(zip(schema.names, map(str, schema.types))),
+        )
+
+    def _get_dtypes(self):
+        """Return the pandas dtypes and date columns to read every chunk with.
+
+        Dtypes are decided once for the whole file, so results such as row
+        hashes do not depend on chunk boundaries. Integers of the read schema
+        are int64, or float64 when the file has nulls in the column, and
+        columns without a read type get the dtype pandas infers over all
+        chunks. Deciding those takes one pass over their columns, which is
+        cached for the file until it is modified.
+        """
+        if self._dtypes is not None:
+            return self._dtypes
+        key = self._dtypes_key()
+        with _dtypes_cache_lock:
+            if key in _dtypes_cache:
+                _dtypes_cache.move_to_end(key)
+                self._dtypes = _dtypes_cache[key]
+                return self._dtypes
+
+        self._dtypes = self._scan_dtypes()
+        if key is not None:
+            with _dtypes_cache_lock:
+                _dtypes_cache[key] = self._dtypes
+                while len(_dtypes_cache) > MAX_CACHED_DTYPES:
+                    _dtypes_cache.popitem(last=False)
+        return self._dtypes
+
+    def _scan_dtypes(self):
+        """Return the dtypes and date columns of the file, see _get_dtypes."""
+        schema = self.read_schema or sch.Schema([], [])
+        columns = None
+        if self.file_type == "csv":
+            names = pandas.read_csv(self.file_path, nrows=0).columns
+            dtypes, dates = _read_dtypes(schema, names)
+            columns = [
+                name
+                for name in names
+                if name not in dates and dtypes.get(name, "Int64") == "Int64"
+            ]
+
+        inferred = {}
+        if columns != []:
+            for chunk in self._read_file(columns, self.chunk_size):
+                read_dtypes, _ = _read_dtypes(schema, chunk.columns)
+                for name in chunk.columns:
+                    series = chunk[name]
+                    if read_dtypes.get(name) == "Int64":
+                        series = series.astype("Int64")
+                    inferred[name] = _widen_dtype(
+                        inferred.get(name), _chunk_dtype(series)
+                    )
+
+        names = list(inferred) if self.file_type == "json" else names
+        dtypes, dates = _read_dtypes(schema, names)
+        for name in names:
+            if name in inferred and name not in dates:
+                dtypes[name] = dtypes.get(name, inferred[name])
+                if dtypes[name] == "Int64":
+                    dtypes[name] = inferred[name]
+            elif dtypes.get(name) == "Int64":
+                # Integers of a file without rows have no nulls.
+                dtypes[name] = "int64"
+        return dtypes, dates
+
+    def _read_chunks(self, columns, chunk_size):
+        dtypes, dates = self._get_dtypes()
+        if columns is not None:
+            dtypes = {k: v for k, v in dtypes.items() if k in columns}
+            dates = [name for name in dates if name in columns]
+        return self._read_file(columns, chunk_size, dtypes, dates)
+
+    def _prepare_chunk(self, chunk, columns):
+        if columns:
+            chunk = chunk[[name for name in chunk.columns if name in columns]].copy()
+        # CSV chunks are read with these dtypes, JSON chunks are cast to them.
+        dtypes, dates = self._get_dtypes()
+        for name in chunk.columns:
+            if name in dates:
+                if not pandas.api.types.is_datetime64_any_dtype(chunk[name]):
+                    chunk[name] = pandas.to_datetime(chunk[name])
+            elif name in dtypes and chunk[name].dtype != dtypes[name]:
+                chunk[name] = chunk[name].astype(dtypes[name])
+        return chunk
+
+    def iter_chunks(self, columns=None, chunk_size=None):
+        """Yield DataFrames of the file, at least one (possibly empty).
+
+        columns (List[str]): Columns to read, all columns if None
+        chunk_size (int): Rows per DataFrame (default. client chunk_size)
+        """
+        yielded = False
+        for chunk in self._read_chunks(columns, chunk_size or self.chunk_size):
+            yielded = True
+            yield self._prepare_chunk(chunk, columns)
+        if not yielded:
+            empty = (
+                self._schema.apply_to(pandas.DataFrame(columns=self._schema.names))
+                if self._schema
+                else pandas.DataFrame()
+            )
+            yield empty if columns is None else empty[columns]
+
+    def execute(self, query, params=None, limit="default", **kwargs):
+        columns = plan_scans(query, ChunkedFileTable).get(self.table_name, (None,))[0]
+        merge = chunk_merger(query)
+        try:
+            if merge is None:
+                self.dictionary[self.table_name] = pandas.concat(
+                    self.iter_chunks(columns), ignore_index=True
+                )
+                return super().execute(query, params=params, limit=limit, **kwargs)
+
+            parts = []
+            for chunk in self.iter_chunks(columns):
+                self.dictionary[self.table_name] = chunk
+                parts.append(
+                    super().execute(query, params=params, limit=limit, **kwargs)
+                )
+            return merge(parts)
+        finally:
+            self.dictionary.pop(self.table_name, None)
@@ -55,6 +55,8 @@ def connect(
     instance_id,
     database_id,
     project_id=None,
+    use_partitioned_reads=True,
+    max_workers=None,
 ) -> CloudSpannerClient:
     """Create a CloudSpannerClient for use with Ibis.
 
@@ -66,6 +68,10 @@ def connect(
         A database id inside of the Cloud Spanner Instance
     project_id  : str (Optional)
         The ID of the project which owns the instances, tables and data.
+    use_partitioned_reads : bool (Optional)
+        Read partitionable queries concurrently with a batch snapshot.
+    max_workers : int (Optional)
+        Maximum number of partitions read concurrently.
 
     Returns
     -------
@@ -77,4 +83,6 @@ def connect(
         instance_id=instance_id,
         database_id=database_id,
         project_id=project_id,
+        use_partitioned_reads=use_partitioned_reads,
+        max_workers=max_workers,
     )
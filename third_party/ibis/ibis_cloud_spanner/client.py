@@ -265,7 +265,15 @@ class CloudSpannerClient(SQLClient):
     database_class = CloudSpannerDatabase
     table_class = CloudSpannerTable
 
-    def __init__(self, instance_id, database_id, project_id=None, credentials=None):
+    def __init__(
+        self,
+        instance_id,
+        database_id,
+        project_id=None,
+        credentials=None,
+        use_partitioned_reads=True,
+        max_workers=None,
+    ):
         """Construct a CloudSpannerClient.
 
         Parameters
@@ -276,9 +284,16 @@ class CloudSpannerClient(SQLClient):
             A ``<instance_id>.<database_id>`` string or just a dataset name
         project_id  : str (Optional)
             The ID of the project which owns the instances, tables and data.
+        use_partitioned_reads : bool (Optional)
+            Read partitionable queries with a batch snapshot, one worker
+            per partition (default True).
+        max_workers : int (Optional)
+            Maximum number of partitions read concurrently.
 
 
         """
+        self.use_partitioned_reads = use_partitioned_reads
+        self.max_workers = max_workers
         self.spanner_client = spanner.Client(project=project_id)
         self.instance = self.spanner_client.instance(instance_id)
         self.database_name = self.instance.database(database_id)
@@ -403,6 +418,11 @@ class CloudSpannerClient(SQLClient):
         database_id = self.dataset_id
         database_1 = instance.database(database_id)
 
+        if self.use_partitioned_reads:
+            return pandas_df.to_pandas_partitioned(
+                database_1, stmt, query_parameters, max_workers=self.max_workers
+            )
+
         with database_1.snapshot() as snapshot:
             data_qry = pandas_df.to_pandas(snapshot, stmt, query_parameters)
         return data_qry
@@ -12,37 +12,192 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import logging
+import queue
+import threading
+
+import numpy
+import pandas
+from google.api_core import exceptions
 from pandas import DataFrame
 
+DEFAULT_BATCH_SIZE = 100000
+DEFAULT_MAX_QUEUED_BATCHES = 4
+
+# Put on the queue of iter_partitioned_batches when a partition is read.
+_PARTITION_DONE = object()
+
+
+def merge_query_parameters(query_parameters):
+    """Return the params and param_types dicts expected by execute_sql."""
+    param = {}
+    param_type = {}
+    for i in query_parameters or []:
+        param.update(i["params"])
+        param_type.update(i["param_types"])
+    return param, param_type
+
+
+def _column_to_series(name, values, type_code):
+    """Return a typed pandas Series for a column of Spanner values.
+
+    Nullable INT64 and BOOL columns keep the dtypes pandas would have inferred
+    for them (float64 and object) so results match the row based path.
+    """
+    if type_code == "INT64":
+        if None in values:
+            return pandas.Series(values, name=name, dtype="float64")
+        return pandas.Series(numpy.array(values, dtype="int64"), name=name)
+    elif type_code == "FLOAT64":
+        return pandas.Series(values, name=name, dtype="float64")
+    elif type_code == "BOOL" and None not in values:
+        return pandas.Series(numpy.array(values, dtype="bool"), name=name)
+    elif type_code == "TIMESTAMP":
+        return pandas.Series(pandas.to_datetime(values, utc=True), name=name)
+    return pandas.Series(values, name=name, dtype="object")
+
+
+def _build_frame(fields, columns):
+    return DataFrame(
+        {
+            field.name: _column_to_series(field.name, values, field.type_.code.name)
+            for field, values in zip(fields, columns)
+        },
+        columns=[field.name for field in fields],
+    )
+
 
 class pandas_df:
     def to_pandas(snapshot, sql, query_parameters):
-
         if query_parameters:
-            param = {}
-            param_type = {}
-            for i in query_parameters:
-                param.update(i["params"])
-                param_type.update(i["param_types"])
-
+            param, param_type = merge_query_parameters(query_parameters)
             data_qry = snapshot.execute_sql(sql, params=param, param_types=param_type)
-
         else:
             data_qry = snapshot.execute_sql(sql)
 
-        data = []
-        for row in data_qry:
-            data.append(row)
+        batches = list(pandas_df.iter_batches(data_qry))
+        if len(batches) == 1:
+            return batches[0]
+        return pandas.concat(batches, ignore_index=True)
+
+    def iter_batches(result_set, batch_size=DEFAULT_BATCH_SIZE):
+        """Yield DataFrames of at most batch_size rows from a result set.
+
+        Rows are appended straight into per-column lists so each batch is
+        built column by column with its Spanner type, rather than from a list
+        of row tuples.  At least one (possibly empty) DataFrame is yielded.
+        """
+        columns = None
+        num_rows = 0
+        yielded = False
+        for row in result_set:
+            # Fields are only populated after the first response is consumed.
+            if columns is None:
+                columns = [[] for _ in result_set.fields]
+            for column, value in zip(columns, row):
+                column.append(value)
+            num_rows += 1
+            if num_rows >= batch_size:
+                yield _build_frame(result_set.fields, columns)
+                yielded = True
+                columns = [[] for _ in result_set.fields]
+                num_rows = 0
+
+        if num_rows or not yielded:
+            fields = result_set.fields or []
+            yield _build_frame(fields, columns or [[] for _ in fields])
+
+    def iter_partitioned_batches(
+        database,
+        sql,
+        query_parameters,
+        max_workers=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        max_queued=DEFAULT_MAX_QUEUED_BATCHES,
+    ):
+        """Yield DataFrames read concurrently from a partitioned query.
+
+        The query is split with a batch snapshot and up to max_workers
+        partitions are streamed at a time, each in its own worker.  Batches
+        are yielded as they are read, through a queue of at most max_queued
+        batches which workers wait on, so memory is bounded by the batches in
+        flight rather than the partitions.  The order of rows is not
+        preserved.  Raises google.api_core.exceptions.InvalidArgument when
+        the query is not root partitionable.
+        """
+        param, param_type = merge_query_parameters(query_parameters)
+        batch_snapshot = database.batch_snapshot()
+        executor = None
+        stop = threading.Event()
+        try:
+            query_batches = list(
+                batch_snapshot.generate_query_batches(
+                    sql, params=param or None, param_types=param_type or None
+                )
+            )
+            results = queue.Queue(maxsize=max_queued)
+
+            def put(item):
+                # Give up once the consumer stopped, rather than wait forever.
+                while not stop.is_set():
+                    try:
+                        results.put(item, timeout=0.1)
+                        return
+                    except queue.Full:
+                        pass
 
-        columns_dict = {}
+            def read_partition(query_batch):
+                if stop.is_set():
+                    return
+                try:
+                    result_set = batch_snapshot.process_query_batch(query_batch)
+                    for df in pandas_df.iter_batches(result_set, batch_size):
+                        if stop.is_set():
+                            return
+                        put(df)
+                except Exception as e:
+                    put(e)
+                finally:
+                    put(_PARTITION_DONE)
 
-        for item in data_qry.fields:
-            columns_dict[item.name] = item.type_.code.name
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            for query_batch in query_batches:
+                executor.submit(read_partition, query_batch)
+            remaining = len(query_batches)
+            while remaining:
+                item = results.get()
+                if item is _PARTITION_DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+            if executor is not None:
+                executor.shutdown(wait=True)
+            batch_snapshot.close()
 
-        # Creating list of columns to be mapped with the data
-        column_list = [k for k, v in columns_dict.items()]
+    def to_pandas_partitioned(database, sql, query_parameters, max_workers=None):
+        """Return a DataFrame read with a partitioned query where possible.
 
-        # Creating pandas dataframe from data and columns_list
-        df = DataFrame(data, columns=column_list)
+        Falls back to a single snapshot read when Spanner rejects the query
+        as not partitionable (eg. aggregates or ORDER BY at the root).
+        """
+        try:
+            batches = list(
+                pandas_df.iter_partitioned_batches(
+                    database, sql, query_parameters, max_workers=max_workers
+                )
+            )
+        except (exceptions.InvalidArgument, exceptions.FailedPrecondition) as e:
+            logging.debug("Query is not partitionable, reading serially: %s", e)
+            with database.snapshot() as snapshot:
+                return pandas_df.to_pandas(snapshot, sql, query_parameters)
 
-        return df
+        if not batches:
+            # No partitions were generated, so no field metadata was received.
+            with database.snapshot() as snapshot:
+                return pandas_df.to_pandas(snapshot, sql, query_parameters)
+        return pandas.concat(batches, ignore_index=True)
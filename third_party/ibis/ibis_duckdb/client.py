@@ -0,0 +1,99 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+
+import ibis.backends.base_sqlalchemy.alchemy as alch
+import ibis.expr.datatypes as dt
+import sqlalchemy as sa
+from ibis.backends.postgres.client import PostgreSQLClient
+
+import duckdb_engine
+from third_party.ibis.ibis_duckdb.compiler import DuckDBDialect
+
+IN_MEMORY_DATABASE = ":memory:"
+
+
+# DuckDB reports DOUBLE columns as FLOAT, only REAL is single precision.
+@dt.dtype.register(duckdb_engine.Dialect, sa.types.Float)
+@dt.dtype.register(duckdb_engine.Dialect, sa.dialects.postgresql.DOUBLE_PRECISION)
+def sa_duckdb_float(_, satype, nullable=True):
+    if isinstance(satype, sa.types.REAL):
+        return dt.Float(nullable=nullable)
+    return dt.Double(nullable=nullable)
+
+
+class DuckDBClient(PostgreSQLClient):
+    """An Ibis client for an embedded DuckDB database.
+
+    Queries run in process with DuckDB's vectorized engine, either against a
+    DuckDB database file or against CSV, Parquet and JSON files which are
+    exposed as views and read in place.
+    """
+
+    dialect = DuckDBDialect
+
+    def __init__(self, database=None, table_name=None, file_path=None, read_only=False):
+        """Construct a DuckDB client.
+
+        Parameters
+        ----------
+        database : Optional[str]
+            A DuckDB database file (default. in memory database)
+        table_name : Optional[str]
+            Name of a view to create over file_path
+        file_path : Optional[str]
+            A CSV, Parquet or JSON file, or a glob of files, to query in place
+        read_only : Optional[bool]
+            Open the database file in read only mode
+        """
+        database = database or IN_MEMORY_DATABASE
+        engine = sa.create_engine(
+            f"duckdb:///{database}",
+            connect_args={"read_only": read_only},
+            # Each connection to an in memory database is a new database.
+            poolclass=sa.pool.StaticPool,
+        )
+        alch.AlchemyClient.__init__(self, engine)
+        self.database_name = "main"
+
+        if file_path:
+            self.create_file_view(table_name, file_path)
+
+    @contextlib.contextmanager
+    def begin(self):
+        with alch.AlchemyClient.begin(self) as bind:
+            yield bind
+
+    def create_file_view(self, table_name, file_path):
+        """Create a view named table_name which reads file_path in place."""
+        if not table_name:
+            raise ValueError("A table_name is required to query a file")
+        path = file_path.replace("'", "''")
+        self.con.execute(
+            f"CREATE OR REPLACE VIEW \"{table_name}\" AS SELECT * FROM '{path}'"
+        )
+        self.meta.clear()
+
+    def database(self, name=None):
+        return self.database_class(self.current_database, self)
+
+    def list_databases(self):
+        return [self.current_database]
+
+    @property
+    def version(self):
+        import duckdb
+
+        return duckdb.__version__
@@ -0,0 +1,36 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ibis.backends.base_sqlalchemy.alchemy as alch
+from ibis.backends.postgres.compiler import (
+    PostgreSQLExprTranslator,
+    _operation_registry as _postgres_registry,
+)
+
+# DuckDB's SQL dialect follows PostgreSQL closely, so start from its registry.
+_operation_registry = _postgres_registry.copy()
+
+
+class DuckDBExprTranslator(PostgreSQLExprTranslator):
+
+    _registry = _operation_registry
+    _rewrites = PostgreSQLExprTranslator._rewrites.copy()
+    _type_map = PostgreSQLExprTranslator._type_map.copy()
+
+
+class DuckDBDialect(alch.AlchemyDialect):
+    translator = DuckDBExprTranslator
+
+
+dialect = DuckDBDialect
@@ -14,12 +14,14 @@
 
 
 import contextlib
+import pandas
 import third_party.ibis.ibis_snowflake.alchemy as alch
 from third_party.ibis.ibis_snowflake.compiler import SnowflakeDialect
 from snowflake.sqlalchemy import URL
 import sqlalchemy as sa
 from sqlalchemy import create_engine
 from ibis.client import Database
+from snowflake.connector.errors import NotSupportedError, ProgrammingError
 from . import compiler
 
 
@@ -27,6 +29,14 @@ class SnowflakeTable(alch.AlchemyTable):
     pass
 
 
+class SnowflakeQuery(alch.AlchemyQuery):
+    """ Snowflake query which fetches results as Arrow batches """
+
+    def execute(self, **kwargs):
+        df = self.client._fetch_dataframe(self.compiled_sql)
+        return self._wrap_result(self.schema().apply_to(df))
+
+
 class SnowflakeSchema(alch.AlchemyDatabaseSchema):
     pass
 
@@ -40,6 +50,7 @@ class SnowflakeClient(alch.AlchemyClient):
     dialect = SnowflakeDialect
     database_class = SnowflakeDatabase
     table_class = SnowflakeTable
+    query_class = SnowflakeQuery
 
     def __init__(self,
                  user=None, password=None, account=None, database=None, schema=None, url=None):
@@ -162,4 +173,77 @@ class SnowflakeClient(alch.AlchemyClient):
         return response
 
     def get_schema(self, name, schema=None):
-        return self.table(name, schema=schema).schema()
\ No newline at end of file
+        return self.table(name, schema=schema).schema()
+
+    def fetch_arrow_batches(self, sql, stats=None):
+        """Yield pyarrow Tables for the result chunks of a query.
+
+        Column names are normalized the same way SQLAlchemy does, so
+        case-insensitive Snowflake identifiers are returned in lower case.
+        Results which cannot be fetched as Arrow (eg. the pandas extra of
+        snowflake-connector-python is not installed) are fetched as rows and
+        yielded as a single Table. The query id is added to the stats dict,
+        if one is given.
+        """
+        import pyarrow
+
+        if isinstance(sql, str):
+            statement, parameters = sql, None
+        else:
+            compiled = sql.compile(dialect=self.con.dialect)
+            statement, parameters = str(compiled), compiled.params
+
+        connection = self.con.raw_connection()
+        cursor = None
+        try:
+            cursor = connection.cursor()
+            cursor.execute(statement, parameters)
+            if stats is not None:
+                stats["query_id"] = cursor.sfqid
+            names = [
+                self.con.dialect.normalize_name(column[0])
+                for column in cursor.description
+            ]
+            try:
+                batches = cursor.fetch_arrow_batches()
+            except (NotSupportedError, ProgrammingError):
+                batches = None
+
+            if batches is None:
+                rows = cursor.fetchall()
+                yield pyarrow.Table.from_pandas(
+                    pandas.DataFrame.from_records(
+                        rows, columns=names, coerce_float=True
+                    ),
+                    preserve_index=False,
+                )
+                return
+
+            yielded = False
+            for table in batches:
+                yielded = True
+                yield table.rename_columns(names)
+            if not yielded:
+                # Snowflake returns no chunks for an empty result.
+                yield pyarrow.table({name: pyarrow.array([]) for name in names})
+        finally:
+            if cursor is not None:
+                cursor.close()
+            connection.close()
+
+    def _fetch_dataframe(self, sql):
+        """Return a DataFrame concatenated from the query's Arrow batches.
+
+        Batches are converted to pandas before they are concatenated, as the
+        Arrow types of a column can differ between result chunks, eg. int8
+        and int64 for a NUMBER column. The query id is returned in
+        df.attrs["engine_stats"].
+        """
+        stats = {}
+        frames = [table.to_pandas() for table in self.fetch_arrow_batches(sql, stats)]
+        if len(frames) == 1:
+            df = frames[0]
+        else:
+            df = pandas.concat(frames, ignore_index=True)
+        df.attrs["engine_stats"] = stats
+        return df
\ No newline at end of file
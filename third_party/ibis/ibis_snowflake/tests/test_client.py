@@ -127,4 +127,11 @@ def test_schema_table():
     )
     schema = con.schema('PUBLIC')
 
-    assert isinstance(schema['ITEM'], ir.TableExpr)
\ No newline at end of file
+    assert isinstance(schema['ITEM'], ir.TableExpr)
+
+
+def test_execute_empty_result_keeps_columns(alltypes):
+    expr = alltypes[alltypes.id < 0][['id', 'string_col']]
+    df = expr.execute()
+    assert list(df.columns) == ['id', 'string_col']
+    assert len(df) == 0
@@ -3,7 +3,7 @@
 from typing import Optional
 
 import ibis.common.exceptions as com
-from client import TeradataClient  # TODO make non local
+from client import DEFAULT_FETCH_SIZE, TeradataClient  # TODO make non local
 from compiler import dialect  # TODO make non local
 from ibis.config import options  # noqa: F401
 
@@ -35,7 +35,14 @@ def verify(expr, params=None):
 
 
 def connect(
-    host: str, user_name: str, password: str, port: Optional[int] = 1025, logmech: Optional[str]='TD2'
+    host: str,
+    user_name: str,
+    password: str,
+    port: Optional[int] = 1025,
+    logmech: Optional[str] = 'TD2',
+    use_no_lock_tables: Optional[bool] = False,
+    use_fastexport: Optional[bool] = False,
+    fetch_size: Optional[int] = DEFAULT_FETCH_SIZE,
 ) -> TeradataClient:
     """ Create a TeradataClient for use with Ibis.
     Parameters
@@ -50,9 +57,24 @@ def connect(
         The database port to connect to (default. 1025)
     logmech : Optional[str]
         Logmech flag to select with (default. TD2)
+    use_no_lock_tables : Optional[bool]
+        Prefix SELECT queries with LOCKING ROW FOR ACCESS (default. False)
+    use_fastexport : Optional[bool]
+        Export SELECT results with FastExport in chunks (default. False)
+    fetch_size : Optional[int]
+        Number of rows fetched per chunk when exporting results
     Returns
     -------
     TeradataClient
     """
 
-    return TeradataClient(host, user_name, password, port, logmech)
+    return TeradataClient(
+        host,
+        user_name,
+        password,
+        port,
+        logmech,
+        use_no_lock_tables=use_no_lock_tables,
+        use_fastexport=use_fastexport,
+        fetch_size=fetch_size,
+    )
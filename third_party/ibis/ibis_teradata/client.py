@@ -14,6 +14,8 @@ from ibis.client import Database, Query, SQLClient
 from . import compiler  # TODO non local import ie from ibis.teradata import compiler
 from .datatypes import TeradataTypeTranslator  # TODO non local import
 
+DEFAULT_FETCH_SIZE = 100000
+
 
 def _find_scalar_parameter(expr):
     """Find all :class:`~ibis.expr.types.ScalarParameter` instances.
@@ -37,16 +39,56 @@ def _find_scalar_parameter(expr):
 class TeradataQuery(Query):
 
     NO_LOCK_SQL = "LOCKING ROW FOR ACCESS "
+    # Driver escape which runs a SELECT with FastExport when the request
+    # qualifies, otherwise it silently runs as a regular SQL request.
+    FASTEXPORT_SQL = "{fn teradata_try_fastexport}"
 
     def __init__(self, client, ddl):
         super().__init__(client, ddl)
 
-    def execute(self):
+    @property
+    def is_select(self):
+        return self.compiled_sql.strip().startswith("SELECT")
+
+    def prepared_sql(self):
+        """Return the SQL to send to Teradata with any client options applied."""
         sql = self.compiled_sql
-        if self.client.use_no_lock_tables and sql.strip().startswith("SELECT"):
-            sql = self.NO_LOCK_SQL + self.compiled_sql
+        if self.client.use_no_lock_tables and self.is_select:
+            sql = self.NO_LOCK_SQL + sql
+        if self.client.use_fastexport and self.is_select:
+            sql = self.FASTEXPORT_SQL + sql
+        return sql
 
-        return pandas.read_sql(sql, self.client.client)
+    def execute(self):
+        if self.client.use_fastexport and self.is_select:
+            batches = list(self.iter_batches())
+            if len(batches) == 1:
+                return batches[0]
+            return pandas.concat(batches, ignore_index=True)
+
+        return pandas.read_sql(self.prepared_sql(), self.client.client)
+
+    def iter_batches(self, fetch_size=None):
+        """Yield DataFrames of at most fetch_size rows from the query results.
+
+        At least one (possibly empty) DataFrame is yielded.
+        """
+        fetch_size = fetch_size or self.client.fetch_size
+        with self.client.client.cursor() as cursor:
+            cursor.execute(self.prepared_sql())
+            columns = [column[0] for column in cursor.description]
+            yielded = False
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yielded = True
+                yield pandas.DataFrame.from_records(
+                    rows, columns=columns, coerce_float=True
+                )
+
+            if not yielded:
+                yield pandas.DataFrame(columns=columns)
 
 
 class TeradataDatabase(Database):
@@ -67,7 +109,17 @@ class TeradataClient(SQLClient):
     table_class = TeradataTable
     dialect = compiler.TeradataDialect
 
-    def __init__(self, host, user_name, password, port=1025, logmech='TD2', use_no_lock_tables=False):
+    def __init__(
+        self,
+        host,
+        user_name,
+        password,
+        port=1025,
+        logmech='TD2',
+        use_no_lock_tables=False,
+        use_fastexport=False,
+        fetch_size=DEFAULT_FETCH_SIZE,
+    ):
         """Construct a TeradataClient.
 
         Parameters
@@ -82,6 +134,12 @@ class TeradataClient(SQLClient):
             The database port to connect to (default. 1025)
         logmech : Optional[int]
             The logmech type to connect to (default. TD2)
+        use_no_lock_tables : Optional[bool]
+            Prefix SELECT queries with LOCKING ROW FOR ACCESS
+        use_fastexport : Optional[bool]
+            Export SELECT results with FastExport and fetch them in chunks
+        fetch_size : Optional[int]
+            Number of rows fetched per chunk when exporting results
         """
         self.teradata_config = {
             "host": host,
@@ -93,6 +151,8 @@ class TeradataClient(SQLClient):
 
         self.client = teradatasql.connect(**self.teradata_config)
         self.use_no_lock_tables = use_no_lock_tables
+        self.use_fastexport = use_fastexport
+        self.fetch_size = fetch_size
 
     def __del__ (self):
         self.client.close()